@@ -5,9 +5,10 @@ import time
 from datetime import datetime
 from pprint import pprint
 
-from rdflib import RDF, RDFS
+from rdflib import Graph, RDF, RDFS
 
 import scior.modules.initialization_arguments as args
+from scior.modules.graph_cache import load_graph_using_cache
 from scior.modules.graph_ontology import save_ontology_gufo_statements, save_ontology_file_as_configuration
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
@@ -18,7 +19,10 @@ from scior.modules.problems_treatment.treat_incomplete import print_all_incomple
 from scior.modules.results.classifications_matrix import generate_classifications_matrix
 from scior.modules.results.results_calculation import generate_results_information
 from scior.modules.rules.rules_execution import execute_rules_types
-from scior.modules.utils_rdf import load_all_graph_safely, reduce_graph_considering_restrictions
+from scior.modules.rules.rules_profiling import print_rules_profiles, save_rules_profiles
+from scior.modules.utils_general import get_peak_memory_usage
+from scior.modules.utils_ntriples import is_streamable_file, stream_working_graph
+from scior.modules.utils_rdf import reduce_graph_considering_restrictions
 
 SOFTWARE_ACRONYM = "Scior"
 SOFTWARE_NAME = "Identification of Ontological Categories for OWL Ontologies"
@@ -28,6 +32,33 @@ SCOPE_RESTRICTION = "ENDURANT_TYPES"
 LIST_GRAPH_RESTRICTIONS = [RDF.type, RDFS.subClassOf]
 
 
+def load_original_graph() -> Graph:
+    """ Loads the input ontology's complete graph, using the cache of parsed ontologies if it is configured. """
+
+    original_graph = load_graph_using_cache(args.ARGUMENTS["ontology_path"], args.ARGUMENTS["graph_store"],
+                                            args.ARGUMENTS["cache_directory"], args.ARGUMENTS["cache_size"],
+                                            SOFTWARE_VERSION)
+
+    return original_graph
+
+
+def load_ontology_graphs() -> tuple[Graph | None, Graph]:
+    """ Loads the input ontology's original graph and its working graph (taxonomy only).
+
+        The working graph of N-Triples and N-Quads files is streamed directly from the file and their original graph is
+        not loaded (None is returned), as it is only necessary for saving the output (see load_original_graph).
+    """
+
+    if is_streamable_file(args.ARGUMENTS["ontology_path"]):
+        return None, stream_working_graph(args.ARGUMENTS["ontology_path"], args.ARGUMENTS["graph_store"])
+
+    original_graph = load_original_graph()
+    working_graph = reduce_graph_considering_restrictions(original_graph, LIST_GRAPH_RESTRICTIONS,
+                                                          args.ARGUMENTS["graph_store"])
+
+    return original_graph, working_graph
+
+
 def run_scior():
     """ Main function. """
 
@@ -44,14 +75,15 @@ def run_scior():
     logger.info(f"Scior started on {start_date_time}!")
 
     # Loading OWL ontologies from test_files to the working memory
-    original_graph = load_all_graph_safely(args.ARGUMENTS["ontology_path"])
-    working_graph = reduce_graph_considering_restrictions(original_graph, LIST_GRAPH_RESTRICTIONS)
+    original_graph, working_graph = load_ontology_graphs()
 
     # Creating empty list of classes and their respective classifications
     ontology_dataclass_list = initialize_ontology_dataclasses(working_graph, SCOPE_RESTRICTION)
 
     # Loading the gUFO information already stated into the ontology
-    load_known_gufo_information(original_graph, ontology_dataclass_list)
+    # The working graph streamed from N-Triples files contains all statements needed
+    known_gufo_graph = working_graph if original_graph is None else original_graph
+    load_known_gufo_information(known_gufo_graph, ontology_dataclass_list)
 
     logger.debug("Saving initial data for calculating future statistics.")
     before_dataclass_list = copy.deepcopy(ontology_dataclass_list)
@@ -63,6 +95,8 @@ def run_scior():
     # TREATING RESULTS
 
     # Saving file
+    if original_graph is None:
+        original_graph = load_original_graph()
     resulting_graph = save_ontology_gufo_statements(ontology_dataclass_list, original_graph, SCOPE_RESTRICTION)
 
     # Generating results information
@@ -94,11 +128,16 @@ def run_scior():
     end_date_time_files = now.strftime("%Y%m%d-%H%M%S")
     et = time.perf_counter()
     elapsed_time = round((et - st), 3)
-    logger.info(f"Scior concluded on {end_date_time_screen}! Total execution time: {elapsed_time} seconds.")
+    logger.info(f"Scior concluded on {end_date_time_screen}! Total execution time: {elapsed_time} seconds. "
+                f"Peak memory usage: {get_peak_memory_usage()} MB ({args.ARGUMENTS['graph_store']} graph store).")
 
     # Printing results
     save_ontology_file_as_configuration(resulting_graph, end_date_time_files)
 
+    if args.ARGUMENTS["is_rules_profiling"]:
+        print_rules_profiles()
+        save_rules_profiles(end_date_time_files)
+
     # print_report_file(ontology_dataclass_list,  #                   start_date_time, end_date_time_files, elapsed_time,  #                   SCOPE_RESTRICTION, SOFTWARE_VERSION, classifications_matrix)
 
 
@@ -136,14 +175,15 @@ def run_scior_test_execution(treatment_type: str, test_file: str, assumption: st
     args.publish_global_arguments(SOFTWARE_ACRONYM, SOFTWARE_NAME, SOFTWARE_VERSION, SOFTWARE_URL, test_arguments)
 
     # Loading OWL ontologies from test_files to the working memory
-    original_graph = load_all_graph_safely(args.ARGUMENTS["ontology_path"])
-    working_graph = reduce_graph_considering_restrictions(original_graph, LIST_GRAPH_RESTRICTIONS)
+    original_graph, working_graph = load_ontology_graphs()
 
     # Creating empty list of classes and their respective classifications
     ontology_dataclass_list = initialize_ontology_dataclasses(working_graph, SCOPE_RESTRICTION)
 
     # Loading the gUFO information already stated into the ontology
-    load_known_gufo_information(original_graph, ontology_dataclass_list)
+    # The working graph streamed from N-Triples files contains all statements needed
+    known_gufo_graph = working_graph if original_graph is None else original_graph
+    load_known_gufo_information(known_gufo_graph, ontology_dataclass_list)
 
     # Executing Scior
     if treatment_type == "input":
@@ -0,0 +1,229 @@
+""" On-disk cache of parsed ontology graphs, so that repeated executions over the same input file do not parse it again.
+
+    Each cache entry is a binary file that contains the graph's interned terms table (each term stored once), its
+    triples as an array of integer term ids and its namespace bindings. Entries are keyed by the digest of the input
+    file's content and by Scior's version. When the cache directory exceeds its maximum size, the least recently used
+    entries are evicted.
+
+    The entries contain only data (a JSON header and the raw bytes of the triples array), so that loading an entry
+    never executes code, even if the cache directory is shared or was tampered with. Invalid entries are removed.
+"""
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+
+from rdflib import Graph
+
+from scior.modules.graph_store import bulk_loading, create_graph, decode_node, encode_node
+from scior.modules.logger_config import initialize_logger
+from scior.modules.utils_general import create_directory_if_not_exists
+from scior.modules.utils_rdf import load_all_graph_safely
+
+LOGGER = initialize_logger()
+
+CACHE_FILE_EXTENSION = ".graph-cache"
+CACHE_FORMAT_VERSION = 2
+
+# Initial bytes of all cache entries, followed by the header's length (unsigned 64 bits, little-endian), the header (a
+# UTF-8 JSON object) and the bytes of the triples array
+CACHE_MAGIC_BYTES = b"SCIORGC\n"
+HEADER_LENGTH_FORMAT = "<Q"
+
+# Size of the blocks in which the input files are read for calculating their digests
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+
+def get_file_digest(file_path: str) -> str:
+    """ Returns the SHA-256 hexadecimal digest of the content of the received file. """
+
+    file_hash = hashlib.sha256()
+
+    with open(file_path, "rb") as input_file:
+        for block in iter(lambda: input_file.read(DIGEST_BLOCK_SIZE), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+
+def get_cache_file_path(cache_directory: str, file_digest: str, software_version: str) -> str:
+    """ Returns the path of the cache entry of the received file digest and software version. """
+
+    version_key = re.sub(r"[^0-9A-Za-z]+", "_", software_version)
+
+    return os.path.join(cache_directory, f"{file_digest}-{version_key}{CACHE_FILE_EXTENSION}")
+
+
+def save_graph_to_cache(ontology_graph: Graph, cache_file_path: str, software_version: str) -> None:
+    """ Saves the received graph as a cache entry. The entry is written to a temporary file that then replaces the
+        entry's file, so that concurrent executions never read an incomplete entry.
+    """
+
+    terms_ids = {}
+    triples_ids = array("I")
+
+    for triple in ontology_graph:
+        for node in triple:
+            node_id = terms_ids.get(node)
+            if node_id is None:
+                node_id = terms_ids[node] = len(terms_ids)
+            triples_ids.append(node_id)
+
+    cache_header = {"format_version": CACHE_FORMAT_VERSION,
+                    "software_version": software_version,
+                    "byte_order": sys.byteorder,
+                    "item_size": triples_ids.itemsize,
+                    "number_triples": len(triples_ids) // 3,
+                    "terms": [encode_node(node) for node in terms_ids],
+                    "namespaces": [(prefix, str(namespace)) for prefix, namespace in ontology_graph.namespaces()]}
+    encoded_header = json.dumps(cache_header).encode("utf-8")
+
+    temporary_file_path = f"{cache_file_path}.{os.getpid()}.tmp"
+
+    with open(temporary_file_path, "wb") as cache_file:
+        cache_file.write(CACHE_MAGIC_BYTES)
+        cache_file.write(struct.pack(HEADER_LENGTH_FORMAT, len(encoded_header)))
+        cache_file.write(encoded_header)
+        cache_file.write(triples_ids.tobytes())
+
+    os.replace(temporary_file_path, cache_file_path)
+
+
+def load_graph_from_cache(cache_file_path: str, software_version: str, graph_store: str) -> Graph:
+    """ Loads the graph saved in the received cache entry into a new graph of the received graph store.
+
+    :raises ValueError: If the entry is not a valid entry created by the same cache format, software version and
+    platform (byte order and integer size).
+    """
+
+    with open(cache_file_path, "rb") as cache_file:
+        if cache_file.read(len(CACHE_MAGIC_BYTES)) != CACHE_MAGIC_BYTES:
+            raise ValueError("File is not a graph cache entry.")
+
+        header_length_bytes = cache_file.read(struct.calcsize(HEADER_LENGTH_FORMAT))
+        if len(header_length_bytes) != struct.calcsize(HEADER_LENGTH_FORMAT):
+            raise ValueError("Truncated cache entry.")
+        header_length, = struct.unpack(HEADER_LENGTH_FORMAT, header_length_bytes)
+
+        cache_header = json.loads(cache_file.read(header_length).decode("utf-8"))
+        triples_bytes = cache_file.read()
+
+    triples_ids = array("I")
+
+    if cache_header["format_version"] != CACHE_FORMAT_VERSION or \
+            cache_header["software_version"] != software_version:
+        raise ValueError("Cache entry created by a different cache format or software version.")
+
+    if cache_header["byte_order"] != sys.byteorder or cache_header["item_size"] != triples_ids.itemsize:
+        raise ValueError("Cache entry created in a different platform.")
+
+    terms = [decode_node(encoded_term) for encoded_term in cache_header["terms"]]
+    triples_ids.frombytes(triples_bytes)
+
+    if len(triples_ids) != 3 * cache_header["number_triples"] or (triples_ids and max(triples_ids) >= len(terms)):
+        raise ValueError("Cache entry with invalid triples.")
+
+    ontology_graph = create_graph(graph_store)
+
+    for prefix, namespace in cache_header["namespaces"]:
+        ontology_graph.bind(prefix, namespace, override=True, replace=True)
+
+    with bulk_loading(ontology_graph):
+        ontology_graph.addN((terms[triples_ids[position]], terms[triples_ids[position + 1]],
+                             terms[triples_ids[position + 2]], ontology_graph)
+                            for position in range(0, len(triples_ids), 3))
+
+    # Updating the entry's modification time, used for evicting the least recently used entries
+    os.utime(cache_file_path)
+
+    return ontology_graph
+
+
+def evict_cache_entries(cache_directory: str, maximum_size_mb: int, kept_file_path: str) -> None:
+    """ Removes the least recently used cache entries while the cache directory exceeds the maximum size (in MB).
+        The entry in kept_file_path (the one used in the current execution) is never removed.
+    """
+
+    cache_entries = []
+
+    for file_name in os.listdir(cache_directory):
+        if file_name.endswith(CACHE_FILE_EXTENSION):
+            file_path = os.path.join(cache_directory, file_name)
+            file_status = os.stat(file_path)
+            cache_entries.append((file_status.st_mtime, file_status.st_size, file_path))
+
+    cache_size = sum(file_size for _, file_size, _ in cache_entries)
+    maximum_size = maximum_size_mb * 1024 * 1024
+
+    for _, file_size, file_path in sorted(cache_entries):
+        if cache_size <= maximum_size:
+            break
+        if file_path == kept_file_path:
+            continue
+        os.remove(file_path)
+        cache_size -= file_size
+        LOGGER.debug(f"Cache entry {file_path} evicted.")
+
+
+def load_graph_using_cache(ontology_file: str, graph_store: str, cache_directory: str | None, maximum_size_mb: int,
+                           software_version: str) -> Graph:
+    """ Loads the ontology file into a graph, using the cache entry of its content if available. Otherwise, the file is
+        parsed and a cache entry is created for it. The cache is not used if cache_directory is None.
+
+    :param ontology_file: Path to the ontology file to be loaded into the working memory.
+    :type ontology_file: str
+    :param graph_store: Graph store in which the graph is loaded (see graph_store.GRAPH_STORES).
+    :type graph_store: str
+    :param cache_directory: Directory of the cache entries or None if the cache is not used.
+    :type cache_directory: str | None
+    :param maximum_size_mb: Maximum size of the cache directory in MB.
+    :type maximum_size_mb: int
+    :param software_version: Scior's version, part of the entries' keys.
+    :type software_version: str
+    :return: RDFLib graph loaded as object.
+    :rtype: Graph
+    """
+
+    if cache_directory is None:
+        return load_all_graph_safely(ontology_file, graph_store)
+
+    create_directory_if_not_exists(cache_directory)
+
+    try:
+        cache_file_path = get_cache_file_path(cache_directory, get_file_digest(ontology_file), software_version)
+    except OSError:
+        # The file cannot be read. The regular loading reports the error.
+        return load_all_graph_safely(ontology_file, graph_store)
+
+    if os.path.exists(cache_file_path):
+        try:
+            st = time.perf_counter()
+            ontology_graph = load_graph_from_cache(cache_file_path, software_version, graph_store)
+            elapsed_time = round(time.perf_counter() - st, 3)
+            LOGGER.info(f"Ontology file {ontology_file} successfully loaded to working memory from the cache "
+                        f"in {elapsed_time} seconds.")
+            return ontology_graph
+        except Exception as error:
+            # Any error means a corrupted or outdated entry, which is replaced by a new one
+            LOGGER.warning(f"Invalid cache entry {cache_file_path} ignored and removed. "
+                           f"System error message is: {error!r}")
+            try:
+                os.remove(cache_file_path)
+            except OSError:
+                pass
+
+    ontology_graph = load_all_graph_safely(ontology_file, graph_store)
+
+    try:
+        save_graph_to_cache(ontology_graph, cache_file_path, software_version)
+        evict_cache_entries(cache_directory, maximum_size_mb, cache_file_path)
+        LOGGER.debug(f"Cache entry {cache_file_path} created for the ontology file {ontology_file}.")
+    except OSError as error:
+        LOGGER.warning(f"Could not create the cache entry for the ontology file {ontology_file}. "
+                       f"System error message is: {error}")
+
+    return ontology_graph
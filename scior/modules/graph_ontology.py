@@ -146,14 +146,25 @@ def treat_name(gufo_short_name: str) -> str:
     return gufo_url + gufo_short_name
 
 
-def update_ontology_graph_with_gufo(ontology_dataclass_list, ontology_graph):
+def update_ontology_graph_with_gufo(ontology_dataclass_list, ontology_graph, new_types=None) -> int:
     """ Include all known gUFO classifications (got from ontology_dataclass_list) into the ontology_graph.
         Currently implemented only for Types.
+
+        If new_types, a list of (id, classification) pairs (see OntologyDataClassList.get_new_types_since), is
+        received, only its classifications are included, as all previous ones are already in the graph.
+        Returns the number of synced (written) triples.
     """
 
     ontology_graph.bind("gufo", GUFO_NAMESPACE)
 
-    for ontology_class in ontology_dataclass_list:
-        for gufo_type in ontology_class.is_type:
-            gufo_classification = URIRef(GUFO_NAMESPACE + gufo_type)
-            ontology_graph.add((URIRef(ontology_class.uri), RDF.type, gufo_classification))
+    if new_types is None:
+        new_types = [(ontology_class.uri_id, gufo_type) for ontology_class in ontology_dataclass_list
+                     for gufo_type in ontology_class.is_type]
+
+    uri_table = ontology_dataclass_list.uri_table
+
+    for class_id, gufo_type in new_types:
+        gufo_classification = URIRef(GUFO_NAMESPACE + gufo_type)
+        ontology_graph.add((uri_table.get_node(class_id), RDF.type, gufo_classification))
+
+    return len(new_types)
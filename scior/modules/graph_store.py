@@ -0,0 +1,313 @@
+""" Graph stores used for the ontology's original and working graphs.
+
+    Besides RDFLib's default in-memory store, the graphs can be placed in an on-disk store backed by a local SQLite
+    database (SQLiteStore), so that ontologies larger than the available memory can be treated. Triples are inserted in
+    bulk and, while a file is being parsed (see bulk_loading), the store's secondary indexes are only built at the end.
+"""
+import atexit
+import inspect
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.store import Store, VALID_STORE
+
+from scior.modules.logger_config import initialize_logger
+from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
+
+LOGGER = initialize_logger()
+
+GRAPH_STORES = ["memory", "sqlite"]
+
+# Number of pending triples that are inserted at once into the SQLite database
+BULK_INSERT_SIZE = 50000
+
+# Number of triples that are read at once from the SQLite database when the triples matching a pattern are iterated
+READ_PAGE_SIZE = 50000
+
+SQLITE_INDEXES = ["CREATE INDEX IF NOT EXISTS triples_predicate_object ON triples (predicate, object)",
+                  "CREATE INDEX IF NOT EXISTS triples_object ON triples (object)"]
+
+
+def encode_node(node) -> str:
+    """ Encodes an RDFLib node (URIRef, BNode or Literal) as the string stored in the SQLite database. """
+
+    if isinstance(node, URIRef):
+        return "U" + str(node)
+    if isinstance(node, BNode):
+        return "B" + str(node)
+    if isinstance(node, Literal):
+        datatype = None if node.datatype is None else str(node.datatype)
+        return "L" + json.dumps([str(node), datatype, node.language])
+
+    current_function = inspect.stack()[0][3]
+    report_error_end_of_switch(type(node).__name__, current_function)
+
+
+def decode_node(encoded_node: str):
+    """ Decodes a string stored in the SQLite database (see encode_node) back into an RDFLib node. """
+
+    node_kind = encoded_node[0]
+
+    if node_kind == "U":
+        return URIRef(encoded_node[1:])
+    if node_kind == "B":
+        return BNode(encoded_node[1:])
+    if node_kind == "L":
+        value, datatype, language = json.loads(encoded_node[1:])
+        return Literal(value, lang=language, datatype=None if datatype is None else URIRef(datatype))
+
+    current_function = inspect.stack()[0][3]
+    report_error_end_of_switch(node_kind, current_function)
+
+
+class SQLiteStore(Store):
+    """ RDFLib store that keeps the triples of a (non-context-aware) graph in a local SQLite database.
+
+        Added triples are kept pending and inserted in bulk when BULK_INSERT_SIZE triples are pending or before any
+        read. The namespace bindings, which are few, are kept in memory.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, configuration=None, identifier=None):
+        self.identifier = identifier
+        self.connection = None
+        self._pending_triples = []
+        self._namespace = {}
+        self._prefix = {}
+        super().__init__(configuration)
+
+    def open(self, configuration: str, create: bool = True) -> int:
+        """ Opens (and creates, if necessary) the SQLite database whose file path is received as configuration. """
+
+        self.connection = sqlite3.connect(configuration)
+        # The database is a working copy of the graph, hence durability is not necessary
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS triples (subject TEXT NOT NULL, predicate TEXT NOT NULL, "
+                                "object TEXT NOT NULL, PRIMARY KEY (subject, predicate, object)) WITHOUT ROWID")
+        self.create_indexes()
+
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        if self.connection is not None:
+            self.flush_pending_triples()
+            self.connection.close()
+            self.connection = None
+
+    def destroy(self, configuration: str) -> None:
+        self.close()
+        if os.path.exists(configuration):
+            os.remove(configuration)
+
+    def create_indexes(self) -> None:
+        """ Creates the secondary indexes used for queries by predicate and by object. """
+
+        for index_statement in SQLITE_INDEXES:
+            self.connection.execute(index_statement)
+
+    def drop_indexes(self) -> None:
+        """ Drops the secondary indexes, so that a bulk load of triples is faster. """
+
+        self.connection.execute("DROP INDEX IF EXISTS triples_predicate_object")
+        self.connection.execute("DROP INDEX IF EXISTS triples_object")
+
+    def flush_pending_triples(self) -> None:
+        """ Inserts all pending triples into the database. """
+
+        if self._pending_triples:
+            self.connection.executemany("INSERT OR IGNORE INTO triples VALUES (?, ?, ?)", self._pending_triples)
+            self.connection.commit()
+            self._pending_triples = []
+
+    def add(self, triple, context, quoted: bool = False) -> None:
+        self._pending_triples.append(tuple(encode_node(node) for node in triple))
+
+        if len(self._pending_triples) >= BULK_INSERT_SIZE:
+            self.flush_pending_triples()
+
+    def addN(self, quads) -> None:
+        for subject_node, predicate, object_node, _ in quads:
+            self.add((subject_node, predicate, object_node), None)
+
+    def _get_pattern_condition(self, triple_pattern) -> tuple[str, list[str]]:
+        """ Returns the SQL WHERE clause (and its parameters) selecting the triples that match the received pattern. """
+
+        conditions = []
+        parameters = []
+
+        for column, node in zip(["subject", "predicate", "object"], triple_pattern):
+            if node is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(encode_node(node))
+
+        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+        return where_clause, parameters
+
+    def remove(self, triple_pattern, context=None) -> None:
+        self.flush_pending_triples()
+        where_clause, parameters = self._get_pattern_condition(triple_pattern)
+        self.connection.execute("DELETE FROM triples" + where_clause, parameters)
+        self.connection.commit()
+
+    def triples(self, triple_pattern, context=None):
+        """ Generator over all triples matching the received pattern. Path predicates are solved by the graph.
+
+            The matching rows are read in pages of READ_PAGE_SIZE triples, so that a complete scan does not load the
+            whole database into memory. Each page is fetched at once and starts after the last triple of the previous
+            one (keyset pagination), as the triples are usually added or removed while they are iterated and SQLite
+            does not define the results of a cursor whose table is modified by the same connection. Hence, every
+            triple that exists during the whole iteration is returned once and triples removed before their page is
+            read are not returned. Triples added during the iteration may or may not be returned.
+        """
+
+        where_clause, parameters = self._get_pattern_condition(triple_pattern)
+        subject_node, predicate, object_node = triple_pattern
+
+        # Columns of the index used for the pattern (the primary key or a secondary index, whose entries end with the
+        # primary key's columns), in which the pattern's nodes are a prefix. The pages follow the order of the
+        # remaining columns, so that each page is read directly from the index.
+        if subject_node is not None and (predicate is not None or object_node is None):
+            index_columns = ["subject", "predicate", "object"]
+        elif predicate is not None:
+            index_columns = ["predicate", "object", "subject"]
+        elif object_node is not None:
+            index_columns = ["object", "subject", "predicate"]
+        else:
+            index_columns = ["subject", "predicate", "object"]
+
+        column_positions = {"subject": 0, "predicate": 1, "object": 2}
+        key_columns = [column for column in index_columns if triple_pattern[column_positions[column]] is None]
+
+        select_statement = "SELECT subject, predicate, object FROM triples" + where_clause
+        last_key = None
+
+        while True:
+            self.flush_pending_triples()
+
+            if not key_columns:
+                encoded_triples = self.connection.execute(select_statement, parameters).fetchall()
+            elif last_key is None:
+                encoded_triples = self.connection.execute(
+                    select_statement + f" ORDER BY {', '.join(key_columns)} LIMIT ?",
+                    parameters + [READ_PAGE_SIZE]).fetchall()
+            else:
+                key_condition = (" AND " if where_clause else " WHERE ") + \
+                                f"({', '.join(key_columns)}) > ({', '.join('?' for _ in key_columns)})"
+                encoded_triples = self.connection.execute(
+                    select_statement + key_condition + f" ORDER BY {', '.join(key_columns)} LIMIT ?",
+                    parameters + last_key + [READ_PAGE_SIZE]).fetchall()
+
+            for encoded_triple in encoded_triples:
+                yield tuple(decode_node(encoded_node) for encoded_node in encoded_triple), iter(())
+
+            if not key_columns or len(encoded_triples) < READ_PAGE_SIZE:
+                return
+
+            last_key = [encoded_triples[-1][column_positions[column]] for column in key_columns]
+
+    def __len__(self, context=None) -> int:
+        self.flush_pending_triples()
+        return self.connection.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        # Same treatment of RDFLib's in-memory stores
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+        if bound_prefix is None:
+            bound_prefix = self._prefix.get(bound_namespace)
+
+        if override:
+            if bound_prefix is not None:
+                del self._namespace[bound_prefix]
+            if bound_namespace is not None:
+                del self._prefix[bound_namespace]
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+        else:
+            self._prefix[namespace if bound_namespace is None else bound_namespace] = \
+                prefix if bound_prefix is None else bound_prefix
+            self._namespace[prefix if bound_prefix is None else bound_prefix] = \
+                namespace if bound_namespace is None else bound_namespace
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        return self._prefix.get(namespace)
+
+    def namespaces(self):
+        yield from self._namespace.items()
+
+
+STORES_DIRECTORY = None
+
+
+def get_stores_directory() -> str:
+    """ Returns the temporary directory in which the SQLite databases are created, creating it on the first call.
+        The directory and all its databases are removed when the execution ends.
+    """
+
+    global STORES_DIRECTORY
+
+    if STORES_DIRECTORY is None:
+        STORES_DIRECTORY = tempfile.mkdtemp(prefix="scior-store-")
+        atexit.register(shutil.rmtree, STORES_DIRECTORY, ignore_errors=True)
+        LOGGER.debug(f"On-disk graph stores created in the directory {STORES_DIRECTORY}.")
+
+    return STORES_DIRECTORY
+
+
+def create_graph(graph_store: str = "memory") -> Graph:
+    """ Creates an empty graph in the received graph store.
+
+    :param graph_store: Graph store to be used. Allowed values are listed in GRAPH_STORES.
+    :type graph_store: str
+    :return: Empty RDFLib graph.
+    :rtype: Graph
+    """
+
+    if graph_store == "memory":
+        return Graph()
+
+    if graph_store == "sqlite":
+        database_file, database_path = tempfile.mkstemp(suffix=".sqlite", dir=get_stores_directory())
+        os.close(database_file)
+        sqlite_store = SQLiteStore(database_path)
+        # Registered after the directory's removal, hence executed before it
+        atexit.register(sqlite_store.close)
+        return Graph(store=sqlite_store)
+
+    current_function = inspect.stack()[0][3]
+    report_error_end_of_switch(graph_store, current_function)
+
+
+@contextmanager
+def bulk_loading(ontology_graph: Graph):
+    """ Context in which many triples are going to be added to the received graph. For on-disk stores, the secondary
+        indexes are dropped during the context and rebuilt at its end.
+    """
+
+    if not isinstance(ontology_graph.store, SQLiteStore):
+        yield ontology_graph
+        return
+
+    ontology_graph.store.drop_indexes()
+    try:
+        yield ontology_graph
+    finally:
+        ontology_graph.store.flush_pending_triples()
+        ontology_graph.store.create_indexes()
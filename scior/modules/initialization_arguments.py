@@ -2,11 +2,22 @@
 
 import argparse
 
+from scior.modules.graph_store import GRAPH_STORES
 from scior.modules.logger_config import initialize_logger
 
 LOGGER = initialize_logger()
 ARGUMENTS = {}
 
+# Default values of arguments that may not be present in dictionaries received from the Scior-Tester or tests.
+OPTIONAL_ARGUMENTS_DEFAULTS = {
+    "is_vectorized_gufo": False,
+    "is_sparql_rules": False,
+    "graph_store": "memory",
+    "cache_directory": None,
+    "cache_size": 1024,
+    "is_rules_profiling": False
+}
+
 
 def treat_user_arguments(software_acronym: str, software_name: str, software_version: str, software_url: str) -> dict:
     """ Treat arguments provided by the user when starting software execution. """
@@ -75,6 +86,32 @@ def treat_user_arguments(software_acronym: str, software_name: str, software_ver
     gufo_in_file.add_argument("-gw", "--gufo_write", action='store_true', default=False,
                               help="Write all gUFO statements in the output ontology file.")
 
+    # EXECUTION ENGINE ARGUMENTS
+
+    arguments_parser.add_argument("-vg", "--vectorized_gufo", action='store_true', default=False,
+                                  help="Execute the gUFO rules for all classes at once as vectorized operations. "
+                                       "Requires NumPy.")
+
+    arguments_parser.add_argument("-sr", "--sparql_rules", action='store_true', default=False,
+                                  help="Evaluate the rules using SPARQL queries over the ontology graph instead of the "
+                                       "native taxonomy index (reference mode).")
+
+    arguments_parser.add_argument("-st", "--store", choices=GRAPH_STORES, default="memory",
+                                  help="Graph store used for the original and working graphs: in memory (*memory) or "
+                                       "in temporary on-disk SQLite databases (sqlite), for ontologies larger than RAM.")
+
+    arguments_parser.add_argument("-cd", "--cache_directory", type=str, default=None, metavar="DIRECTORY",
+                                  help="Directory of the cache of parsed ontologies. When informed, the parsed input "
+                                       "ontology is cached and later executions over the same file load it from there.")
+
+    arguments_parser.add_argument("-cs", "--cache_size", type=int, default=1024, metavar="MB",
+                                  help="Maximum size (in MB) of the cache of parsed ontologies. The least recently used "
+                                       "entries are evicted when it is exceeded. Default value is 1024.")
+
+    arguments_parser.add_argument("-rp", "--rules_profiling", action='store_true', default=False,
+                                  help="Record the time, query rows, moves and incompleteness entries of each rule "
+                                       "execution, printed as a table and saved in a JSON file at the end.")
+
     # AUTOMATIC ARGUMENTS
     arguments_parser.add_argument("-v", "--version", action="version",
                                   help="Print the software version and exit.")
@@ -116,6 +153,13 @@ def treat_user_arguments(software_acronym: str, software_name: str, software_ver
         "is_verbose": arguments.verbose,
         "is_debug": arguments.debug,
 
+        "is_vectorized_gufo": arguments.vectorized_gufo,
+        "is_sparql_rules": arguments.sparql_rules,
+        "graph_store": arguments.store,
+        "cache_directory": arguments.cache_directory,
+        "cache_size": arguments.cache_size,
+        "is_rules_profiling": arguments.rules_profiling,
+
         "ontology_path": arguments.ontology_file
     }
 
@@ -131,6 +175,6 @@ def publish_global_arguments(software_acronym: str, software_name: str, software
         arguments_dictionary = treat_user_arguments(software_acronym, software_name, software_version, software_url)
 
     global ARGUMENTS
-    ARGUMENTS = arguments_dictionary
+    ARGUMENTS = OPTIONAL_ARGUMENTS_DEFAULTS | arguments_dictionary
 
     LOGGER.debug(f"Arguments parsed. Obtained values are: {arguments_dictionary}.")
@@ -1,32 +1,383 @@
 """ Definition of dataclass as the data structure used for loading the ontologies ontology in Scior.
     This module contains the data structure fields, initial value assignments and methods.
+
+    The is, can and not type classifications of each class are stored as three integer bitmasks indexed over the
+    GUFO_LIST_ENDURANT_TYPES positions. The list-style accessors (is_type, can_type and not_type) are kept as
+    read-only views over these bitmasks.
 """
+import inspect
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from scior.modules.logger_config import initialize_logger
+from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
+from scior.modules.resources_gufo import GUFO_LIST_ENDURANT_TYPES, GUFO_LIST_LEAF_CLASSIFICATIONS
+from scior.modules.uri_table import UriTable
 
 LOGGER = initialize_logger()
 
+# Bit of each gUFO endurant type. As GUFO_LIST_ENDURANT_TYPES is alphabetically sorted, iterating the bits from the
+# lowest to the highest always returns sorted classifications.
+GUFO_TYPES_BITS = {gufo_type: 1 << position for position, gufo_type in enumerate(GUFO_LIST_ENDURANT_TYPES)}
+GUFO_ALL_TYPES_MASK = (1 << len(GUFO_LIST_ENDURANT_TYPES)) - 1
+GUFO_LEAF_TYPES_MASK = sum(GUFO_TYPES_BITS[leaf_type] for leaf_type in GUFO_LIST_LEAF_CLASSIFICATIONS)
+
+
+def classifications_to_mask(classifications_list: list[str]) -> int:
+    """ Converts a list of gUFO classifications (in short form, e.g., Kind) into its corresponding bitmask.
+
+    :param classifications_list: List of gUFO classifications to be converted.
+    :type classifications_list: list[str]
+    :return: Bitmask with the bits of all received classifications set.
+    :rtype: int
+    """
+
+    mask = 0
+
+    for classification in classifications_list:
+        if classification not in GUFO_TYPES_BITS:
+            current_function = inspect.stack()[0][3]
+            report_error_end_of_switch(classification, current_function)
+        mask |= GUFO_TYPES_BITS[classification]
+
+    return mask
+
+
+def mask_to_classifications(mask: int) -> list[str]:
+    """ Converts a bitmask into the sorted list of gUFO classifications it represents.
+
+    :param mask: Bitmask indexed over the GUFO_LIST_ENDURANT_TYPES positions.
+    :type mask: int
+    :return: Sorted list of gUFO classifications whose bits are set in the mask.
+    :rtype: list[str]
+    """
+
+    return [gufo_type for gufo_type, bit in GUFO_TYPES_BITS.items() if mask & bit]
+
+
+class ClassificationsView(Sequence):
+    """ Read-only and sorted list-like view of a classifications bitmask. Membership tests are single bit operations.
+
+    Views are immutable snapshots: they do not reflect moves performed after they are obtained.
+    """
+
+    __slots__ = ("mask", "_classifications")
+
+    def __init__(self, mask: int):
+        self.mask = mask
+        self._classifications = tuple(mask_to_classifications(mask))
+
+    def __contains__(self, classification) -> bool:
+        return bool(self.mask & GUFO_TYPES_BITS.get(classification, 0))
+
+    def __iter__(self):
+        return iter(self._classifications)
+
+    def __len__(self) -> int:
+        return len(self._classifications)
+
+    def __getitem__(self, index):
+        return self._classifications[index]
 
-@dataclass
+    def __add__(self, other) -> list[str]:
+        return list(self._classifications) + list(other)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ClassificationsView):
+            return self.mask == other.mask
+        if isinstance(other, (list, tuple)):
+            return list(self._classifications) == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.mask)
+
+    def __repr__(self) -> str:
+        return repr(list(self._classifications))
+
+
+# As there are only 2^15 possible masks, views are created once per mask value and shared among all classes.
+_CLASSIFICATIONS_VIEWS: dict[int, ClassificationsView] = {}
+
+
+def get_classifications_view(mask: int) -> ClassificationsView:
+    """ Returns the (shared) read-only view of the received bitmask.
+
+    :param mask: Bitmask indexed over the GUFO_LIST_ENDURANT_TYPES positions.
+    :type mask: int
+    :return: Read-only view of the classifications represented by the mask.
+    :rtype: ClassificationsView
+    """
+
+    view = _CLASSIFICATIONS_VIEWS.get(mask)
+
+    if view is None:
+        view = ClassificationsView(mask)
+        _CLASSIFICATIONS_VIEWS[mask] = view
+
+    return view
+
+
+@dataclass(slots=True)
 class OntologyDataClass(object):
-    """ Each loaded ontology dataclass has a URI (identifier) and six lists of GUFO elements.
-        Lists indicate which gUFO element the dataclass is, can, or cannot be for the types and individuals hierarchies.
+    """ Each loaded ontology dataclass has a URI (identifier), three bitmasks for the types hierarchy and three lists of
+        GUFO elements for the individuals hierarchy.
+        Bitmasks and lists indicate which gUFO element the dataclass is, can, or cannot be.
+        The uri_id is the URI's integer id, assigned when the dataclass is included into an OntologyDataClassList.
     """
 
     uri: str = field(default_factory=str)
-    is_type: list[str] = field(default_factory=list[str])
+    uri_id: int = -1
+    is_mask: int = 0
+    can_mask: int = 0
+    not_mask: int = 0
     is_individual: list[str] = field(default_factory=list[str])
-    can_type: list[str] = field(default_factory=list[str])
     can_individual: list[str] = field(default_factory=list[str])
-    not_type: list[str] = field(default_factory=list[str])
     not_individual: list[str] = field(default_factory=list[str])
+    is_incomplete: bool = False
+
+    @property
+    def is_type(self) -> ClassificationsView:
+        """ Read-only view of the gUFO types the dataclass is. """
+        return get_classifications_view(self.is_mask)
+
+    @property
+    def can_type(self) -> ClassificationsView:
+        """ Read-only view of the gUFO types the dataclass can be. """
+        return get_classifications_view(self.can_mask)
+
+    @property
+    def not_type(self) -> ClassificationsView:
+        """ Read-only view of the gUFO types the dataclass cannot be. """
+        return get_classifications_view(self.not_mask)
+
+    def move_classification_from_can_type(self, classification: str, target_list: str) -> None:
+        """ Moves a classification from the can_type bitmask to the is_type or to the not_type bitmask.
+            The caller must guarantee that the classification is in the can_type bitmask.
+
+        :param classification: gUFO classification (in short form, e.g., Kind) to be moved.
+        :type classification: str
+        :param target_list: Destination of the classification. Allowed values are 'is_type' and 'not_type'.
+        :type target_list: str
+        """
+
+        classification_bit = GUFO_TYPES_BITS[classification]
+
+        if target_list == "is_type":
+            self.is_mask |= classification_bit
+        elif target_list == "not_type":
+            self.not_mask |= classification_bit
+        else:
+            current_function = inspect.stack()[0][3]
+            report_error_end_of_switch(target_list, current_function)
+
+        self.can_mask &= ~classification_bit
 
     def sort_all_internal_lists(self):
-        """ Sorts all internal lists. """
-        self.is_type.sort()
+        """ Sorts all internal lists. Bitmasks views are always sorted. """
         self.is_individual.sort()
-        self.can_type.sort()
         self.can_individual.sort()
-        self.not_type.sort()
         self.not_individual.sort()
+
+
+class OntologyDataClassList(list):
+    """ List of all OntologyDataClass elements that also keeps the URI interning table (UriTable) of the execution, a
+        URI -> dataclass hash index and an integer id -> dataclass index, so that lookups by URI or by id are performed
+        in constant time. Dataclasses receive their URIs' ids when included into the list.
+
+        Iteration order is the list order. All mutating list operations keep both indexes updated.
+
+        The list also keeps a monotonically increasing counter of classification moves performed in its dataclasses,
+        used for detecting the convergence of the rules, and an optional log of these moves.
+
+        Additionally, a journal with the ids of all classes whose classifications or relations were changed is kept,
+        so that rules can be evaluated only for the classes changed since a journal position (see RulesDelta), as well
+        as a counter of changes per gUFO classification and per graph predicate, used for skipping the execution of
+        rules whose inputs were not changed (see RulesScheduler).
+
+        Finally, a journal of all (id, classification) pairs moved to the is_type lists is kept, so that only the new
+        classifications must be written into the ontology graph (see update_ontology_graph_with_gufo).
+    """
+
+    def __init__(self, ontology_dataclasses=(), uri_table: UriTable | None = None):
+        super().__init__()
+        self.uri_table = UriTable() if uri_table is None else uri_table
+        self.uri_index = {}
+        self.dataclasses_by_id = []
+        self.extend(ontology_dataclasses)
+        self.modifications_counter = 0
+        self.change_log = None
+        self.changes_journal = []
+        self.changed_items_counters = {}
+        self.types_journal = []
+
+    def _rebuild_indexes(self) -> None:
+        """ Recreates both indexes from the current list content. The dataclasses' ids are kept. """
+        self.uri_index = {ontology_dataclass.uri: ontology_dataclass for ontology_dataclass in self}
+        self.dataclasses_by_id = [None] * len(self.uri_table)
+        for ontology_dataclass in self:
+            self.dataclasses_by_id[ontology_dataclass.uri_id] = ontology_dataclass
+
+    def get_by_uri(self, desired_uri: str) -> OntologyDataClass | None:
+        """ Returns the OntologyDataClass with the desired URI or None if it is not in the list. """
+        return self.uri_index.get(desired_uri)
+
+    def get_by_id(self, desired_id: int) -> OntologyDataClass | None:
+        """ Returns the OntologyDataClass whose URI has the desired id or None if it is not in the list. """
+        return self.dataclasses_by_id[desired_id] if desired_id < len(self.dataclasses_by_id) else None
+
+    def get_id_by_uri(self, desired_uri: str) -> int | None:
+        """ Returns the integer id of the desired URI or None if it is not in the list. """
+        ontology_dataclass = self.uri_index.get(desired_uri)
+        return None if ontology_dataclass is None else ontology_dataclass.uri_id
+
+    def register_modification(self, ontology_dataclass: OntologyDataClass, classification: str,
+                              target_list: str) -> None:
+        """ Registers that a classification of one of the list's dataclasses was moved to the target_list.
+            Must be called by all moving functions.
+
+        :param ontology_dataclass: Data structure that contains information about the modified class.
+        :type ontology_dataclass: OntologyDataClass
+        :param classification: gUFO classification (in short form, e.g., Kind) that was moved.
+        :type classification: str
+        :param target_list: Destination of the classification. Allowed values are 'is_type' and 'not_type'.
+        :type target_list: str
+        """
+
+        self.modifications_counter += 1
+        self.changes_journal.append(ontology_dataclass.uri_id)
+        self.changed_items_counters[classification] = self.changed_items_counters.get(classification, 0) + 1
+
+        if target_list == "is_type":
+            self.types_journal.append((ontology_dataclass.uri_id, classification))
+
+        if self.change_log is not None:
+            self.change_log.append((ontology_dataclass.uri, classification, target_list))
+
+    def register_modifications_masks(self, ontology_dataclass: OntologyDataClass, new_is_mask: int,
+                                     new_not_mask: int) -> None:
+        """ Registers at once that all classifications in new_is_mask and in new_not_mask were moved to the is_type
+            and to the not_type lists of one of the list's dataclasses, respectively.
+        """
+
+        if self.change_log is None:
+            self.modifications_counter += new_is_mask.bit_count() + new_not_mask.bit_count()
+            if new_is_mask or new_not_mask:
+                self.changes_journal.append(ontology_dataclass.uri_id)
+                for classification in mask_to_classifications(new_is_mask | new_not_mask):
+                    self.changed_items_counters[classification] = self.changed_items_counters.get(classification, 0) + 1
+                for classification in mask_to_classifications(new_is_mask):
+                    self.types_journal.append((ontology_dataclass.uri_id, classification))
+            return
+
+        for classification in mask_to_classifications(new_is_mask):
+            self.register_modification(ontology_dataclass, classification, "is_type")
+        for classification in mask_to_classifications(new_not_mask):
+            self.register_modification(ontology_dataclass, classification, "not_type")
+
+    def register_class_change(self, changed_id: int, changed_item: str) -> None:
+        """ Journals a change that is not a classification move (e.g., a new relation in the ontology graph) in the
+            class with the received id. The modifications counter is not affected.
+
+        :param changed_id: Id of the changed class' URI.
+        :type changed_id: int
+        :param changed_item: Changed graph predicate in short form (e.g., rdfs:subClassOf).
+        :type changed_item: str
+        """
+
+        self.changes_journal.append(changed_id)
+        self.changed_items_counters[changed_item] = self.changed_items_counters.get(changed_item, 0) + 1
+
+    def get_journal_position(self) -> int:
+        """ Returns the current position (i.e., number of entries) of the changes journal. """
+        return len(self.changes_journal)
+
+    def get_changed_classes_since(self, journal_position: int) -> set[int]:
+        """ Returns the ids of all classes journaled after the received position of the changes journal. """
+        return set(self.changes_journal[journal_position:])
+
+    def get_types_journal_position(self) -> int:
+        """ Returns the current position (i.e., number of entries) of the is_type classifications journal. """
+        return len(self.types_journal)
+
+    def get_new_types_since(self, journal_position: int) -> list[tuple[int, str]]:
+        """ Returns the (id, classification) pairs moved to the is_type lists after the received journal position. """
+        return self.types_journal[journal_position:]
+
+    def start_change_log(self) -> None:
+        """ Starts (or restarts) logging all registered modifications. """
+        self.change_log = []
+
+    def stop_change_log(self) -> list[tuple[str, str, str]]:
+        """ Stops logging modifications and returns the (uri, classification, target_list) tuples logged since the
+            last call to start_change_log.
+        """
+
+        change_log = self.change_log if self.change_log is not None else []
+        self.change_log = None
+
+        return change_log
+
+    def append(self, ontology_dataclass: OntologyDataClass) -> None:
+        self._register_uri(ontology_dataclass)
+        self.uri_index[ontology_dataclass.uri] = ontology_dataclass
+        self.dataclasses_by_id[ontology_dataclass.uri_id] = ontology_dataclass
+        super().append(ontology_dataclass)
+
+    def _register_uri(self, ontology_dataclass: OntologyDataClass) -> None:
+        """ Assigns to the dataclass the id of its URI, whose string is then shared with the URI table. """
+
+        uri_id = self.uri_table.get_id(ontology_dataclass.uri)
+        ontology_dataclass.uri_id = uri_id
+        ontology_dataclass.uri = self.uri_table.get_uri(uri_id)
+
+        if uri_id >= len(self.dataclasses_by_id):
+            self.dataclasses_by_id.extend([None] * (uri_id + 1 - len(self.dataclasses_by_id)))
+
+    def extend(self, ontology_dataclasses) -> None:
+        for ontology_dataclass in ontology_dataclasses:
+            self.append(ontology_dataclass)
+
+    def __iadd__(self, ontology_dataclasses):
+        self.extend(ontology_dataclasses)
+        return self
+
+    def insert(self, position, ontology_dataclass: OntologyDataClass) -> None:
+        self._register_uri(ontology_dataclass)
+        super().insert(position, ontology_dataclass)
+        self._rebuild_indexes()
+
+    def remove(self, ontology_dataclass: OntologyDataClass) -> None:
+        super().remove(ontology_dataclass)
+        self._rebuild_indexes()
+
+    def pop(self, position=-1) -> OntologyDataClass:
+        ontology_dataclass = super().pop(position)
+        self._rebuild_indexes()
+        return ontology_dataclass
+
+    def clear(self) -> None:
+        super().clear()
+        self._rebuild_indexes()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild_indexes()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._rebuild_indexes()
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, slice):
+            value = list(value)
+            for ontology_dataclass in value:
+                self._register_uri(ontology_dataclass)
+        else:
+            self._register_uri(value)
+        super().__setitem__(key, value)
+        self._rebuild_indexes()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._rebuild_indexes()
@@ -35,16 +35,17 @@ def create_ontology_dataclass_list_hash(ontology_dataclass_list: list[OntologyDa
     """ Calculate an integer hexadecimal SHA256 fixed hash the ontology_dataclass_list.
 
         This hash must be the same every time the internal elements are the same to be comparable among multiple
-        executions of Scior.
+        executions of Scior. It is not used for detecting the rules' convergence (which is done with the
+        modifications counter of the OntologyDataClassList) and must be explicitly called when needed.
+        The digest is incrementally updated for each dataclass, without building a single concatenated string.
     """
 
-    dataclasses_hash = ""
+    dataclasses_hash = hashlib.sha256()
 
     for ontology_dataclass in ontology_dataclass_list:
-        dataclasses_hash += create_ontology_dataclass_hash(ontology_dataclass)
+        # Used for generating fix hashes
+        dataclasses_hash.update(create_ontology_dataclass_hash(ontology_dataclass).encode('utf-8'))
 
-    # Used for generating fix hashes
-    encoded_dataclasses_hash = dataclasses_hash.encode('utf-8')
-    dataclass_list_hash = int(hashlib.sha256(encoded_dataclasses_hash).hexdigest(), 16)
+    dataclass_list_hash = int(dataclasses_hash.hexdigest(), 16)
 
     return dataclass_list_hash
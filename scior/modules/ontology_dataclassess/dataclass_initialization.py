@@ -3,38 +3,43 @@ import inspect
 
 from rdflib import Graph
 
+import scior.modules.initialization_arguments as args
 from scior.modules.logger_config import initialize_logger
-from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, OntologyDataClassList, \
+    classifications_to_mask, GUFO_TYPES_BITS
 from scior.modules.ontology_dataclassess.dataclass_moving import move_classification_to_is_type, \
     move_classification_to_not_type
 from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch, report_error_requirement_not_met
 from scior.modules.resources_gufo import GUFO_NAMESPACE, GUFO_LIST_ENDURANT_TYPES
+from scior.modules.rules.rule_loop_group_gufo import loop_execute_gufo_rules
 from scior.modules.utils_dataclass import get_dataclass_by_uri, sort_all_ontology_dataclass_list
 from scior.modules.utils_rdf import get_list_of_all_classes
 
 LOGGER = initialize_logger()
 
 
-def initialize_ontology_dataclasses(ontology_graph: Graph, scope_restriction: str) -> list[OntologyDataClass]:
+def initialize_ontology_dataclasses(ontology_graph: Graph, scope_restriction: str) -> OntologyDataClassList:
     """ Receives the ontology graph (taxonomy only) and the gUFO scope to be considered.
-        Returns the ontology_dataclass_list, a list with all classes in the ontology to be evaluated.
+        Returns the ontology_dataclass_list, a list with all classes in the ontology to be evaluated, indexed by URI.
     """
 
     LOGGER.debug("Initializing list of Ontology concepts...")
 
-    ontology_dataclass_list = []
+    ontology_dataclass_list = OntologyDataClassList()
     classes_list = get_list_of_all_classes_no_gufo(ontology_graph)
 
     gufo_can_list_types, gufo_can_list_individuals = get_gufo_possibilities(scope_restriction)
+    gufo_can_mask_types = classifications_to_mask(gufo_can_list_types)
 
     # - URI: Ontology class name
-    # - CAN_TYPE and CAN_INDIVIDUAL: list of all possible ontological categories. Receive VALUES (not a pointer)
+    # - CAN_TYPE: bitmask of all possible ontological categories. Integers are immutable, so no copy is needed.
+    # - CAN_INDIVIDUAL: list of all possible ontological categories. Receive VALUES (not a pointer)
     # loaded from the gufo_data.yaml file because the data needs to be manipulated.
-    # - OTHER LISTS (IS and NOT): Empty lists. No value received.
+    # - OTHER LISTS AND BITMASKS (IS and NOT): Empty. No value received.
 
     for new_class in classes_list:
         ontology_dataclass_list.append(OntologyDataClass(uri=new_class,
-                                                         can_type=gufo_can_list_types.copy(),
+                                                         can_mask=gufo_can_mask_types,
                                                          can_individual=gufo_can_list_individuals.copy()))
 
     # Validating results: Scior requires the list to be non-empty. OWL Classes must exist in the input file.
@@ -214,6 +219,64 @@ def insert_known_gufo_information(list_known_gufo: list[tuple], ontology_datacla
         report_error_end_of_switch(assertion_type, current_function)
 
 
+def assign_known_gufo_information(list_known_gufo: list[tuple], ontology_dataclass_list: list[OntologyDataClass],
+                                  assertion_type: str) -> None:
+    """ Receives a list of known (positive or negative) gUFO information and assigns it to the elements in the
+    ontology_dataclass_list WITHOUT executing the gUFO rules. Used for bulk loading, in which the gUFO rules are
+    executed later (and inconsistencies detected) once for all classes.
+
+    :param list_known_gufo: List of tuples containing an ontology class (str) and a gufo_type (str).
+    :type list_known_gufo: list[tuple]
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param assertion_type: Indication of the assertion to be included into the ontology_dataclass elements.
+    Allowed values are 'positive' or 'negative'. If invalid value is provided a ValueError exception is raised.
+    :type assertion_type: str
+    """
+
+    target_lists = {'positive': "is_type", 'negative': "not_type"}
+
+    if assertion_type not in target_lists:
+        current_function = inspect.stack()[0][3]
+        report_error_end_of_switch(assertion_type, current_function)
+
+    target_list = target_lists[assertion_type]
+
+    for known_gufo in list_known_gufo:
+        receptor_dataclass = get_dataclass_by_uri(ontology_dataclass_list, known_gufo[0])
+
+        if known_gufo[1] not in GUFO_TYPES_BITS:
+            current_function = inspect.stack()[0][3]
+            report_error_end_of_switch(known_gufo[1], current_function)
+
+        receptor_dataclass.move_classification_from_can_type(known_gufo[1], target_list)
+        if isinstance(ontology_dataclass_list, OntologyDataClassList):
+            ontology_dataclass_list.register_modification(receptor_dataclass, known_gufo[1], target_list)
+
+
+def load_known_gufo_information_bulk(ontology_graph: Graph, ontology_dataclass_list: list[OntologyDataClass]) -> None:
+    """ Bulk version of load_known_gufo_information: all known gUFO information is assigned at once and the gUFO rules
+    are executed a single time for all classes (vectorized).
+
+    :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
+    :type ontology_graph: Graph
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    """
+
+    # Setting all classes as EndurantType
+    list_endurant_types = [(ontology_dataclass.uri, "EndurantType") for ontology_dataclass in ontology_dataclass_list]
+    assign_known_gufo_information(list_endurant_types, ontology_dataclass_list, "positive")
+
+    list_known_is_gufo = get_known_gufo_types(ontology_graph, "positive")
+    assign_known_gufo_information(list_known_is_gufo, ontology_dataclass_list, "positive")
+
+    list_known_not_gufo = get_known_gufo_types(ontology_graph, "negative")
+    assign_known_gufo_information(list_known_not_gufo, ontology_dataclass_list, "negative")
+
+    loop_execute_gufo_rules(ontology_dataclass_list)
+
+
 def load_known_gufo_information(ontology_graph: Graph, ontology_dataclass_list: list[OntologyDataClass]) -> None:
     """ Reads gUFO information about types and instances that are available in the inputted ontology file.
 
@@ -227,6 +290,12 @@ def load_known_gufo_information(ontology_graph: Graph, ontology_dataclass_list:
     :type ontology_dataclass_list: list[OntologyDataClass]
     """
 
+    if args.ARGUMENTS["is_vectorized_gufo"]:
+        load_known_gufo_information_bulk(ontology_graph, ontology_dataclass_list)
+        sort_all_ontology_dataclass_list(ontology_dataclass_list)
+        LOGGER.debug("Known gUFO information from input file transferred to dataclass_ontology_list (bulk loading).")
+        return
+
     # Setting all classes as EndurantType
     for ontology_dataclass in ontology_dataclass_list:
         move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "EndurantType", "Initialization")
@@ -1,15 +1,16 @@
 """ Functions related to moving elements between different lists in a OntologyDataClass or
 in the ontology_data_class_list. """
 
-import bisect
 import inspect
 
 import scior.modules.initialization_arguments as args
 from scior.modules.logger_config import initialize_logger
-from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, OntologyDataClassList, \
+    GUFO_TYPES_BITS, mask_to_classifications
 from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
 from scior.modules.problems_treatment.treat_inconsistent import report_inconsistency_case_moving
-from scior.modules.rules.rule_loop_group_gufo import loop_execute_gufo_rules
+from scior.modules.rules.rule_loop_group_gufo import execute_gufo_rules_for_dataclass
+from scior.modules.rules.rules_profiling import record_move, start_gufo_closure, stop_gufo_closure
 
 LOGGER = initialize_logger()
 
@@ -19,18 +20,13 @@ def move_classification_between_type_lists(ontology_dataclass_list: list[Ontolog
                                            target_list: str, caller: str) -> None:
     """ Unique function that performs moving of classifications between lists of an ontology_dataclass.
         It is used for all other moving functions.
-        Always insert in ordered position. I.e., final lists are always kept sorted.
+        Classifications are stored as bitmasks, whose views are always sorted.
     """
 
-    ontology_dataclass.can_type.remove(classification_to_move)
+    ontology_dataclass.move_classification_from_can_type(classification_to_move, target_list)
 
-    if target_list == "is_type":
-        bisect.insort(ontology_dataclass.is_type, classification_to_move)
-    elif target_list == "not_type":
-        bisect.insort(ontology_dataclass.not_type, classification_to_move)
-    else:
-        current_function = inspect.stack()[0][3]
-        report_error_end_of_switch(target_list, current_function)
+    if isinstance(ontology_dataclass_list, OntologyDataClassList):
+        ontology_dataclass_list.register_modification(ontology_dataclass, classification_to_move, target_list)
 
     # Every time a classification is moved the class will be reanalyzed by all rules, so the incompleteness is
     # cleared to be updated if detected again.
@@ -39,8 +35,37 @@ def move_classification_between_type_lists(ontology_dataclass_list: list[Ontolog
     LOGGER.debug(f"{caller}: Classification {classification_to_move} moved from CAN_TYPE to {target_list.upper()} "
                  f"in {ontology_dataclass.uri}.")
 
-    # All list must be re-evaluated to comply with the gUFO rules.
-    loop_execute_gufo_rules(ontology_dataclass_list)
+    # Only the moved dataclass must be re-evaluated to comply with the gUFO rules, as they evaluate a single class.
+    closure_start_time = start_gufo_closure()
+    execute_gufo_rules_for_dataclass(ontology_dataclass_list, ontology_dataclass)
+    stop_gufo_closure(closure_start_time)
+
+
+def move_classifications_to_closed_state(ontology_dataclass_list: list[OntologyDataClass],
+                                        ontology_dataclass: OntologyDataClass, closed_is_mask: int,
+                                        closed_not_mask: int, caller: str) -> None:
+    """ Moves at once from the can_type list all classifications necessary for the ontology_dataclass to reach the
+        received closed state. The closed state must contain the current one (e.g., the closure of the current state
+        under the gUFO rules), hence no inconsistency is possible and the gUFO rules do not need to be re-evaluated.
+    """
+
+    new_is_mask = closed_is_mask & ~ontology_dataclass.is_mask
+    new_not_mask = closed_not_mask & ~ontology_dataclass.not_mask
+
+    if not (new_is_mask or new_not_mask):
+        return
+
+    ontology_dataclass.is_mask |= new_is_mask
+    ontology_dataclass.not_mask |= new_not_mask
+    ontology_dataclass.can_mask &= ~(new_is_mask | new_not_mask)
+
+    if isinstance(ontology_dataclass_list, OntologyDataClassList):
+        ontology_dataclass_list.register_modifications_masks(ontology_dataclass, new_is_mask, new_not_mask)
+
+    if args.ARGUMENTS["is_debug"]:
+        LOGGER.debug(f"{caller}: Classifications {mask_to_classifications(new_is_mask)} moved from CAN_TYPE to "
+                     f"IS_TYPE and {mask_to_classifications(new_not_mask)} moved from CAN_TYPE to NOT_TYPE "
+                     f"in {ontology_dataclass.uri}.")
 
 
 def move_classification_to_is_type(ontology_dataclass_list: list[OntologyDataClass],
@@ -56,18 +81,21 @@ def move_classification_to_is_type(ontology_dataclass_list: list[OntologyDataCla
         LOGGER.debug(f"{caller}: Move requested to classify {classification_to_move} "
                      f"to {destination_list.upper()} in {ontology_dataclass.uri}.")
 
-    if classification_to_move in ontology_dataclass.can_type:
+    # Invalid classifications have no bit and are reported as an end of switch error.
+    classification_bit = GUFO_TYPES_BITS.get(classification_to_move, 0)
+
+    if ontology_dataclass.can_mask & classification_bit:
+        record_move(is_effective=True)
         move_classification_between_type_lists(ontology_dataclass_list, ontology_dataclass, classification_to_move,
                                                destination_list, caller)
 
-
-
-    elif classification_to_move in ontology_dataclass.is_type:
+    elif ontology_dataclass.is_mask & classification_bit:
+        record_move(is_effective=False)
         if args.ARGUMENTS["is_debug"]:
             LOGGER.debug(f"{caller}: Classification {classification_to_move} already "
                          f"in {destination_list.upper()} list of {ontology_dataclass.uri}.")
 
-    elif classification_to_move in ontology_dataclass.not_type:
+    elif ontology_dataclass.not_mask & classification_bit:
         additional_message = f"{caller}: Classification {classification_to_move} is in NOT_LIST and " \
                              f"cannot be moved to {destination_list.upper()}. "
         report_inconsistency_case_moving(ontology_dataclass, additional_message)
@@ -102,16 +130,21 @@ def move_classification_to_not_type(ontology_dataclass_list: list[OntologyDataCl
         LOGGER.debug(f"{caller}: Move requested to classify {classification_to_move} "
                      f"to {destination_list.upper()} in {ontology_dataclass.uri}.")
 
-    if classification_to_move in ontology_dataclass.can_type:
+    # Invalid classifications have no bit and are reported as an end of switch error.
+    classification_bit = GUFO_TYPES_BITS.get(classification_to_move, 0)
+
+    if ontology_dataclass.can_mask & classification_bit:
+        record_move(is_effective=True)
         move_classification_between_type_lists(ontology_dataclass_list, ontology_dataclass, classification_to_move,
                                                destination_list, caller)
 
-    elif classification_to_move in ontology_dataclass.not_type:
+    elif ontology_dataclass.not_mask & classification_bit:
+        record_move(is_effective=False)
         if args.ARGUMENTS["is_debug"]:
             LOGGER.debug(f"{caller}: Classification {classification_to_move} already "
                          f"in {destination_list.upper()} list of {ontology_dataclass.uri}.")
 
-    elif classification_to_move in ontology_dataclass.is_type:
+    elif ontology_dataclass.is_mask & classification_bit:
         additional_message = f"{caller}: Classification {classification_to_move} is in IS_LIST and " \
                              f"cannot be moved to {destination_list.upper()}. "
         report_inconsistency_case_moving(ontology_dataclass, additional_message)
@@ -1,37 +1,29 @@
 """ This module implements functions to validate OntologyDataClasses and the OntologyDataClasses list. """
 
 from scior.modules.logger_config import initialize_logger
-from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, GUFO_ALL_TYPES_MASK, \
+    GUFO_LEAF_TYPES_MASK, mask_to_classifications
 from scior.modules.problems_treatment.treat_inconsistent import report_inconsistency_case_in_dataclass
-
-from scior.modules.resources_gufo import GUFO_LIST_LEAF_CLASSIFICATIONS, GUFO_LIST_ENDURANT_TYPES
+from scior.modules.resources_gufo import GUFO_LIST_ENDURANT_TYPES
 
 LOGGER = initialize_logger()
 
 
 def verify_dataclass_invalid_strings_in_lists(ontology_dataclass: OntologyDataClass) -> None:
-    """ Checks if there are invalid strings in all lists of the OntologyDataClass.
+    """ Checks if there are invalid values in all bitmasks of the OntologyDataClass. I.e., bits that do not correspond
+    to any element of the GUFO_LIST_ENDURANT_TYPES.
 
     :param ontology_dataclass: Data structure that contains information about the class and its internal lists.
     :type ontology_dataclass: OntologyDataClass
     """
 
-    evaluated_list = "IS_TYPE LIST"
-    for classification_is in ontology_dataclass.is_type:
-        if classification_is not in GUFO_LIST_ENDURANT_TYPES:
-            additional_message = f"Invalid value {classification_is} found in the ontology_dataclass {evaluated_list}."
-            report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
+    evaluated_masks = [("IS_TYPE LIST", ontology_dataclass.is_mask), ("CAN_TYPE LIST", ontology_dataclass.can_mask),
+                       ("NOT_TYPE LIST", ontology_dataclass.not_mask)]
 
-    evaluated_list = "CAN_TYPE LIST"
-    for classification_can in ontology_dataclass.can_type:
-        if classification_can not in GUFO_LIST_ENDURANT_TYPES:
-            additional_message = f"Invalid value {classification_can} found in the ontology_dataclass {evaluated_list}."
-            report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
-
-    evaluated_list = "NOT_TYPE LIST"
-    for classification_not in ontology_dataclass.not_type:
-        if classification_not not in GUFO_LIST_ENDURANT_TYPES:
-            additional_message = f"Invalid value {classification_not} found in the ontology_dataclass {evaluated_list}."
+    for evaluated_list, evaluated_mask in evaluated_masks:
+        invalid_bits = evaluated_mask & ~GUFO_ALL_TYPES_MASK
+        if invalid_bits:
+            additional_message = f"Invalid value {bin(invalid_bits)} found in the ontology_dataclass {evaluated_list}."
             report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
 
 
@@ -42,10 +34,9 @@ def verify_dataclass_classifications_quantity(ontology_dataclass: OntologyDataCl
     :type ontology_dataclass: OntologyDataClass
     """
 
-    merged_list = ontology_dataclass.is_type + ontology_dataclass.can_type + ontology_dataclass.not_type
-
     expected_size = len(GUFO_LIST_ENDURANT_TYPES)
-    current_size = len(merged_list)
+    current_size = ontology_dataclass.is_mask.bit_count() + ontology_dataclass.can_mask.bit_count() + \
+                   ontology_dataclass.not_mask.bit_count()
 
     if expected_size != current_size:
         additional_message = f"Invalid amount of classifications. Expected {expected_size} but found {current_size}."
@@ -59,35 +50,38 @@ def verify_dataclass_multiple_final_classifications(ontology_dataclass: Ontology
     :type ontology_dataclass: OntologyDataClass
     """
 
-    final_classifications = set(ontology_dataclass.is_type).intersection(GUFO_LIST_LEAF_CLASSIFICATIONS)
+    final_classifications_mask = ontology_dataclass.is_mask & GUFO_LEAF_TYPES_MASK
 
-    if len(final_classifications) > 1:
+    if final_classifications_mask.bit_count() > 1:
+        final_classifications = set(mask_to_classifications(final_classifications_mask))
         additional_message = f"Multiple final classification(s) ({final_classifications}) found in IS_TYPE list."
         report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
 
 
 def verify_dataclass_duplicates_in_lists(ontology_dataclass: OntologyDataClass) -> None:
-    """ No same string must be in two lists at the same time.
+    """ No same classification must be in two lists at the same time.
 
     :param ontology_dataclass: Data structure that contains information about the class and its internal lists.
     :type ontology_dataclass: OntologyDataClass
     """
 
-    duplicated_is_can = set(ontology_dataclass.is_type).intersection(ontology_dataclass.can_type)
-    duplicated_is_not = set(ontology_dataclass.is_type).intersection(ontology_dataclass.not_type)
-    duplicated_can_not = set(ontology_dataclass.can_type).intersection(ontology_dataclass.not_type)
+    duplicated_is_can = ontology_dataclass.is_mask & ontology_dataclass.can_mask
+    duplicated_is_not = ontology_dataclass.is_mask & ontology_dataclass.not_mask
+    duplicated_can_not = ontology_dataclass.can_mask & ontology_dataclass.not_mask
 
-    if len(duplicated_is_can) > 0:
-        additional_message = f"Duplicated classification(s) ({duplicated_is_can}) found in lists IS_TYPE and CAN_TYPE."
+    if duplicated_is_can:
+        additional_message = f"Duplicated classification(s) ({set(mask_to_classifications(duplicated_is_can))}) " \
+                             f"found in lists IS_TYPE and CAN_TYPE."
         report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
 
-    if len(duplicated_is_not) > 0:
-        additional_message = f"Duplicated classification(s) ({duplicated_is_not}) found in lists IS_TYPE and NOT_TYPE."
+    if duplicated_is_not:
+        additional_message = f"Duplicated classification(s) ({set(mask_to_classifications(duplicated_is_not))}) " \
+                             f"found in lists IS_TYPE and NOT_TYPE."
         report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
 
-    if len(duplicated_can_not) > 0:
-        additional_message = f"Duplicated classification(s) ({duplicated_can_not}) found in lists " \
-                             f"CAN_TYPE and NOT_TYPE."
+    if duplicated_can_not:
+        additional_message = f"Duplicated classification(s) ({set(mask_to_classifications(duplicated_can_not))}) " \
+                             f"found in lists CAN_TYPE and NOT_TYPE."
         report_inconsistency_case_in_dataclass(ontology_dataclass, additional_message)
 
 
@@ -5,6 +5,7 @@ import string
 import scior.modules.initialization_arguments as args
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.rules.rules_profiling import record_incompleteness
 
 LOGGER = initialize_logger()
 
@@ -16,14 +17,16 @@ class IncompletenessEntry(object):
         rule_code: str - Rule that detected the incompleteness case.
         affected_dataclass_uri: str - URI of the classes affected by the detected incompleteness.
         message: str - Additional message to be reported together with the incompleteness case.
+        affected_dataclass_id: int - Id of the affected class' URI (see UriTable), used for comparing entries.
     """
 
     def __init__(self, entry_id: str, rule_code: str, affected_dataclass_uri: str,
-                 incompleteness_message: str = ""):
+                 incompleteness_message: str = "", affected_dataclass_id: int = -1):
         self.entry_id = entry_id
         self.rule_code = rule_code
         self.affected_dataclass_uri = affected_dataclass_uri
         self.incompleteness_message = incompleteness_message
+        self.affected_dataclass_id = affected_dataclass_id
 
 
 def include_incompleteness_and_keep_updated(new_entry: IncompletenessEntry,
@@ -40,8 +43,8 @@ def include_incompleteness_and_keep_updated(new_entry: IncompletenessEntry,
 
     # If new entry's rule and list of affected classes are already in the incompleteness stack, remove the old entry.
     for registered_entry in incompleteness_stack:
-        if (registered_entry.rule_code == new_entry.rule_code) and (
-                registered_entry.affected_dataclass_uri == new_entry.affected_dataclass_uri):
+        if (registered_entry.affected_dataclass_id == new_entry.affected_dataclass_id) and (
+                registered_entry.rule_code == new_entry.rule_code):
             LOGGER.debug(f"Outdated incompleteness entry (entry_id: {registered_entry.entry_id}) "
                          f"substituted for an updated one (entry_id: {new_entry.entry_id}).")
             incompleteness_stack.remove(registered_entry)
@@ -66,11 +69,13 @@ def register_incompleteness(incompleteness_stack: list[IncompletenessEntry], rul
     # Creating new incompleteness entry
     new_entry = IncompletenessEntry(entry_id=new_entry_id, rule_code=rule_code,
                                     affected_dataclass_uri=affected_ontology_dataclass.uri,
-                                    incompleteness_message=incompleteness_message)
+                                    incompleteness_message=incompleteness_message,
+                                    affected_dataclass_id=affected_ontology_dataclass.uri_id)
 
     LOGGER.debug(f"Creating and adding new incompleteness entry: {new_entry}.")
 
     include_incompleteness_and_keep_updated(new_entry, incompleteness_stack)
+    record_incompleteness()
 
 
 def print_all_incompleteness(incompleteness_stack: list[IncompletenessEntry]) -> None:
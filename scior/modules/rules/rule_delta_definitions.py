@@ -0,0 +1,183 @@
+""" Definition of the data structure used for the semi-naive (delta-driven) execution of the UFO rules and functions
+    for restricting the rules' evaluations to the bindings affected by it.
+
+    The OntologyDataClassList keeps a journal with the ids of all classes whose classifications or relations were
+    changed. A RulesDelta refers to a position of this journal: all classes journaled after it are the delta. A binding
+    (i.e., a query result row or an evaluated class) that does not involve any class of the delta produces the same
+    result it produced in the rule's previous execution, which was already applied, and hence is not evaluated again.
+
+    The SPARQL queries' results are filtered by the select functions. The native queries are seeded with the delta's
+    classes instead (see QuerySeed), so that only the affected bindings are obtained from the taxonomy index.
+"""
+
+from rdflib import Graph
+
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, OntologyDataClassList
+from scior.modules.rules.rule_native_queries import QuerySeed
+from scior.modules.taxonomy_index import TaxonomyIndex, get_taxonomy_relations
+
+
+class RulesDelta(object):
+    """ Set of classes changed since a position of the OntologyDataClassList's changes journal.
+
+        The delta is calculated when requested, so that a rule always receives the changes performed by the rules
+        executed before it, including the ones in its own group. The related classes are obtained from the taxonomy
+        index, if used, or from the ontology graph.
+    """
+
+    def __init__(self, ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph, start_position: int,
+                 taxonomy_index: TaxonomyIndex | None = None):
+        self.ontology_dataclass_list = ontology_dataclass_list
+        self.ontology_graph = ontology_graph
+        self.taxonomy_index = taxonomy_index
+        self.start_position = start_position
+        self._cached_position = None
+        self._changed_classes = set()
+        self._related_classes = set()
+
+    def has_changes(self) -> bool:
+        """ Informs if any class was changed since the delta's start position. """
+        return self.ontology_dataclass_list.get_journal_position() > self.start_position
+
+    def _update_cache(self) -> None:
+        """ Recalculates the changed and the related classes if the journal was modified since the last calculation. """
+
+        current_position = self.ontology_dataclass_list.get_journal_position()
+
+        if current_position == self._cached_position:
+            return
+
+        self._changed_classes = self.ontology_dataclass_list.get_changed_classes_since(self.start_position)
+        self._related_classes = set(self._changed_classes)
+
+        taxonomy_relations = get_taxonomy_relations(self.ontology_graph, self.ontology_dataclass_list.uri_table,
+                                                    self.taxonomy_index)
+
+        for changed_class in self._changed_classes:
+            self._related_classes.update(taxonomy_relations.get_superclass_ids(changed_class))
+            self._related_classes.update(taxonomy_relations.get_subclass_ids(changed_class))
+
+        self._cached_position = current_position
+
+    def get_changed_classes(self) -> set[int]:
+        """ Returns the ids of all classes changed since the delta's start position. """
+        self._update_cache()
+        return self._changed_classes
+
+    def get_related_classes(self) -> set[int]:
+        """ Returns the ids of all changed classes and of their direct superclasses and subclasses. """
+        self._update_cache()
+        return self._related_classes
+
+
+def select_rows_touching_delta(query_result, rules_delta: RulesDelta | None):
+    """ Selects the query result rows in which at least one bound class is in the delta.
+        Must be used by rules whose conclusions are obtained independently for each row.
+
+    :param query_result: Result of the rule's query. All variables used in the query's pattern must be projected.
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all rows are selected.
+    :type rules_delta: RulesDelta | None
+    :return: Iterable with the selected rows, in the query result order.
+    """
+
+    if rules_delta is None:
+        return query_result
+
+    changed_classes = rules_delta.get_changed_classes()
+
+    return [row for row in query_result if any(value in changed_classes for value in row)]
+
+
+def select_groups_touching_delta(query_result, evaluated_variable: str, rules_delta: RulesDelta | None):
+    """ Selects all query result rows of the evaluated classes whose group of rows is affected by the delta, i.e., the
+        evaluated class is related to a changed class or at least one of its rows has a bound class in the delta.
+        Must be used by rules whose conclusions are obtained after collecting all rows of each evaluated class.
+
+    :param query_result: Result of the rule's query. All variables used in the query's pattern must be projected.
+    :param evaluated_variable: Name of the query variable bound to the evaluated class (e.g., 'class_x').
+    :type evaluated_variable: str
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all rows are selected.
+    :type rules_delta: RulesDelta | None
+    :return: Iterable with the selected rows, in the query result order.
+    """
+
+    if rules_delta is None:
+        return query_result
+
+    changed_classes = rules_delta.get_changed_classes()
+    touched_classes = rules_delta.get_related_classes()
+    rows = list(query_result)
+
+    touched_groups = set()
+    for row in rows:
+        evaluated_class = getattr(row, evaluated_variable)
+        if evaluated_class in touched_classes or any(value in changed_classes for value in row):
+            touched_groups.add(evaluated_class)
+
+    return [row for row in rows if getattr(row, evaluated_variable) in touched_groups]
+
+
+def query_rows_touching_delta(rules_delta: RulesDelta | None, native_query, *query_args, **query_kwargs) -> list:
+    """ Native counterpart of select_rows_touching_delta: evaluates the received native query seeded with the classes
+        changed since the rule's previous execution, which returns only the rows in which at least one bound class is
+        in the delta.
+
+    :param rules_delta: Classes changed since the rule's previous execution. If None, the query is not seeded.
+    :type rules_delta: RulesDelta | None
+    :param native_query: Native query function (see rule_native_queries).
+    :return: List with the selected rows.
+    :rtype: list
+    """
+
+    if rules_delta is None:
+        return native_query(*query_args, **query_kwargs)
+
+    return native_query(*query_args, seed=QuerySeed(rules_delta.get_changed_classes(), None), **query_kwargs)
+
+
+def query_groups_touching_delta(rules_delta: RulesDelta | None, evaluated_variable: str, native_query,
+                                *query_args, **query_kwargs) -> list:
+    """ Native counterpart of select_groups_touching_delta. The received native query is first seeded with the
+        classes changed since the rule's previous execution, for obtaining the evaluated classes of the rows touching
+        the delta, and then seeded with all affected evaluated classes, for obtaining all rows of their groups.
+
+    :param rules_delta: Classes changed since the rule's previous execution. If None, the query is not seeded.
+    :type rules_delta: RulesDelta | None
+    :param evaluated_variable: Name of the query variable bound to the evaluated class (e.g., 'class_x').
+    :type evaluated_variable: str
+    :param native_query: Native query function (see rule_native_queries).
+    :return: List with the selected rows.
+    :rtype: list
+    """
+
+    if rules_delta is None:
+        return native_query(*query_args, **query_kwargs)
+
+    touched_groups = set(rules_delta.get_related_classes())
+    touched_groups.update(getattr(row, evaluated_variable)
+                          for row in native_query(*query_args, seed=QuerySeed(rules_delta.get_changed_classes(), None),
+                                                  **query_kwargs))
+
+    return native_query(*query_args, seed=QuerySeed(touched_groups, [evaluated_variable]), **query_kwargs)
+
+
+def select_dataclasses_touching_delta(ontology_dataclass_list: list[OntologyDataClass],
+                                      rules_delta: RulesDelta | None) -> list[OntologyDataClass]:
+    """ Selects the dataclasses that are changed or that are direct superclasses or subclasses of changed classes.
+        Must be used by rules that evaluate each class using its own superclasses or subclasses.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all dataclasses are selected.
+    :type rules_delta: RulesDelta | None
+    :return: List with the selected dataclasses, in the ontology_dataclass_list order.
+    :rtype: list[OntologyDataClass]
+    """
+
+    if rules_delta is None:
+        return ontology_dataclass_list
+
+    related_classes = rules_delta.get_related_classes()
+
+    return [ontology_dataclass for ontology_dataclass in ontology_dataclass_list
+            if ontology_dataclass.uri_id in related_classes]
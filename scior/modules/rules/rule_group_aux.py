@@ -2,18 +2,30 @@
 from rdflib import URIRef, RDFS, Graph
 
 from scior.modules.logger_config import initialize_logger
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClassList
 from scior.modules.resources_gufo import SCIOR_NAMESPACE
+from scior.modules.rules.rule_prepared_queries import execute_rule_query
+from scior.modules.rules.rule_scheduler_definitions import RuleDeclaration
+from scior.modules.taxonomy_index import TaxonomyIndex
 
 LOGGER = initialize_logger()
 
 
-def run_rx01(ontology_graph: Graph) -> None:
+def run_rx01(ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RX01 from group AUX.
 
     Definition: Kind(z) ^ subClassOf(x,z) ^ subClassOf(y,z) -> shareKind(x,y)
 
+    When the taxonomy index is used, the relation is not materialized: each subclass of a Kind is merged into the
+    Kind's block of the index's partition (KindPartition), in which all members share a Kind.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, in which new relations are journaled.
+    :type ontology_dataclass_list: OntologyDataClassList
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
     rule_code = "RX01"
 
@@ -27,25 +39,55 @@ def run_rx01(ontology_graph: Graph) -> None:
         ?class_y rdfs:subClassOf ?class_z .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is not None:
+        kind_partition = taxonomy_index.kind_partition
+        changed_classes = set()
+
+        for class_z in taxonomy_index.get_type_members("Kind"):
+            for class_x in taxonomy_index.subclasses[class_z]:
+                if kind_partition.add_kind_subclass(class_x, class_z):
+                    changed_classes.add(class_x)
+
+        # All members of a changed block share the Kind with the block's new members
+        for changed_root in {kind_partition.get_partition_id(class_x) for class_x in changed_classes}:
+            for class_x in kind_partition.get_block_members(changed_root):
+                ontology_dataclass_list.register_class_change(class_x, "scior:shareKind")
+
+        LOGGER.debug(f"Rule {rule_code} concluded.")
+        return
+
+    query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
 
     scior_share_kind = URIRef(SCIOR_NAMESPACE + "shareKind")
+    uri_table = ontology_dataclass_list.uri_table
 
     for row in query_result:
-        ontology_graph.add((row.class_x, scior_share_kind, row.class_y))
+        new_triple = (uri_table.get_node(row.class_x), scior_share_kind, uri_table.get_node(row.class_y))
+
+        if new_triple not in ontology_graph:
+            ontology_graph.add(new_triple)
+            ontology_dataclass_list.register_class_change(row.class_x, "scior:shareKind")
+            ontology_dataclass_list.register_class_change(row.class_y, "scior:shareKind")
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_rx02(ontology_graph: Graph) -> None:
+def run_rx02(ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RX02 from group AUX.
 
     Definition: Kind(z) ^ subClassOf(x,z) ^ shareKind(x,y) -> subClassOf(y,z)
 
+    When the taxonomy index is used, only the blocks of the index's partition (KindPartition) changed since the last
+    execution are evaluated: each of their members must be a subclass of each of their Kinds. The new relations are
+    inserted into the index only, as the ontology graph is not read in this case.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, in which new relations are journaled.
+    :type ontology_dataclass_list: OntologyDataClassList
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
-
-
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
     rule_code = "RX02"
 
@@ -60,26 +102,58 @@ def run_rx02(ontology_graph: Graph) -> None:
         ?class_x scior:shareKind ?class_y .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is not None:
+        for block_members, block_kinds in taxonomy_index.kind_partition.pop_changed_blocks():
+            for class_y in block_members:
+                for class_z in block_kinds:
+                    if taxonomy_index.add_relation(class_y, RDFS.subClassOf, class_z):
+                        ontology_dataclass_list.register_class_change(class_y, "rdfs:subClassOf")
+                        ontology_dataclass_list.register_class_change(class_z, "rdfs:subClassOf")
+
+        LOGGER.debug(f"Rule {rule_code} concluded.")
+        return
+
+    query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+
+    uri_table = ontology_dataclass_list.uri_table
 
     for row in query_result:
-        ontology_graph.add((row.class_y, RDFS.subClassOf, row.class_z))
+        new_triple = (uri_table.get_node(row.class_y), RDFS.subClassOf, uri_table.get_node(row.class_z))
+
+        if new_triple not in ontology_graph:
+            ontology_graph.add(new_triple)
+            ontology_dataclass_list.register_class_change(row.class_y, "rdfs:subClassOf")
+            ontology_dataclass_list.register_class_change(row.class_z, "rdfs:subClassOf")
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def execute_rules_auxiliary(ontology_graph: Graph) -> None:
+# Declaration of the rules of the group AUX and of their read and write sets, used by the rules scheduler.
+AUX_RULES = [
+    RuleDeclaration("RX01", "rule_group_aux", run_rx01, reads=["Kind", "rdfs:subClassOf"], writes=["scior:shareKind"]),
+    RuleDeclaration("RX02", "rule_group_aux", run_rx02,
+                    reads=["Kind", "rdfs:subClassOf", "scior:shareKind"],
+                    writes=["rdfs:subClassOf"]),
+]
+
+
+def execute_rules_auxiliary(ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph,
+                            taxonomy_index: TaxonomyIndex | None = None) -> None:
     """Executes all rules of the AUXILIARY group.
 
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, in which new relations are journaled.
+    :type ontology_dataclass_list: OntologyDataClassList
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     LOGGER.debug("Starting execution of all rules from group AUX.")
 
     ontology_graph.bind("scior", SCIOR_NAMESPACE)
 
-    run_rx01(ontology_graph)
-    run_rx02(ontology_graph)
+    run_rx01(ontology_dataclass_list, ontology_graph, taxonomy_index)
+    run_rx02(ontology_dataclass_list, ontology_graph, taxonomy_index)
 
     LOGGER.debug("Execution of all rules from group AUX completed.")
@@ -1,104 +1,112 @@
 """ Implementation of rules of group BASE. """
 
-from rdflib import RDF, OWL, RDFS, URIRef
+from rdflib import Graph, RDFS, URIRef
 
 from scior.modules.logger_config import initialize_logger
+from scior.modules.taxonomy_closure import TaxonomyClosure, build_taxonomy_closure
+from scior.modules.uri_table import UriTable
 
 LOGGER = initialize_logger()
 SCIOR_NAMESPACE = "https://purl.org/scior/"
 
 
-def run_rb01(ontology_graph):
-    """ Executes rule RB01 from group base.
+def run_rb01(ontology_graph: Graph, taxonomy_closure: TaxonomyClosure) -> None:
+    """ Executes rule RB01 from group base, writing its results into the graph.
 
     Definition: subClassOf(x,x)
     Description: rdfs:subClassOf is reflexive. All owl:Classe instances are rdfs:subClassOf themselves.
 
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param taxonomy_closure: Closure of the graph's rdfs:subClassOf relations.
+    :type taxonomy_closure: TaxonomyClosure
     """
 
     rule_code = "RB01"
 
     LOGGER.debug(f"Starting rule {rule_code}")
 
-    for ontology_class in ontology_graph.subjects(RDF.type, OWL.Class):
+    for class_id in taxonomy_closure.owl_classes:
+        ontology_class = taxonomy_closure.nodes[class_id]
         ontology_graph.add((ontology_class, RDFS.subClassOf, ontology_class))
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_rb02(ontology_graph):
-    """ Executes rule RB02 from group base.
+def run_rb02(ontology_graph: Graph, taxonomy_closure: TaxonomyClosure) -> None:
+    """ Executes rule RB02 from group base, writing its results into the graph.
 
     Definition: subClassOf(x,y) ^ subClassOf(y,z) -> subClassOf(x,z)
     Description: rdfs:subClassOf is transitive. All owl:Classe instances are rdfs:subClassOf of all their superclasses.
 
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param taxonomy_closure: Closure of the graph's rdfs:subClassOf relations.
+    :type taxonomy_closure: TaxonomyClosure
     """
     rule_code = "RB02"
 
     LOGGER.debug(f"Starting rule {rule_code}")
 
-    query_string = """
-    SELECT DISTINCT ?subclass ?superclass
-    WHERE {
-        ?subclass rdf:type owl:Class .
-        ?superclass rdf:type owl:Class .
-        ?subclass rdfs:subClassOf+ ?superclass .
-    } """
-
-    query_result = ontology_graph.query(query_string)
-
-    for row in query_result:
-        ontology_graph.add((row.subclass, RDFS.subClassOf, row.superclass))
+    for class_id in taxonomy_closure.owl_classes:
+        subclass = taxonomy_closure.nodes[class_id]
+        for superclass_id in taxonomy_closure.get_superclass_ids(class_id):
+            ontology_graph.add((subclass, RDFS.subClassOf, taxonomy_closure.nodes[superclass_id]))
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_rb03(ontology_graph):
+def run_rb03(ontology_graph: Graph, taxonomy_closure: TaxonomyClosure) -> None:
     """ Executes rule RB03 from group BASE.
 
     Definition: subClassOf(x,z) ^ subClassOf(y,z) -> shareSuperClass(x,y)
 
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param taxonomy_closure: Closure of the graph's rdfs:subClassOf relations.
+    :type taxonomy_closure: TaxonomyClosure
     """
     rule_code = "RB03"
 
     LOGGER.debug(f"Starting rule {rule_code}.")
 
-    query_string = """
-    SELECT DISTINCT ?class_x ?class_y
-    WHERE {
-        ?class_x rdfs:subClassOf ?class_z .
-        ?class_y rdfs:subClassOf ?class_z .
-    } """
-
-    query_result = ontology_graph.query(query_string)
-
     scior_share_super_class = URIRef(SCIOR_NAMESPACE + "shareSuperClass")
 
-    for row in query_result:
-        ontology_graph.add((row.class_x, scior_share_super_class, row.class_y))
-        ontology_graph.add((row.class_y, scior_share_super_class, row.class_x))
+    for class_x in range(len(taxonomy_closure.nodes)):
+        for class_y in taxonomy_closure.get_share_super_class_ids(class_x):
+            ontology_graph.add((taxonomy_closure.nodes[class_x], scior_share_super_class,
+                                taxonomy_closure.nodes[class_y]))
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def execute_rules_base(ontology_graph):
+def execute_rules_base(ontology_graph: Graph, materialize_relations: bool = True,
+                       uri_table: UriTable | None = None) -> TaxonomyClosure:
     """Executes once all rules of the group BASE .
 
+    The reflexive (RB01) and transitive (RB02) closure of rdfs:subClassOf is calculated by the closure engine, which
+    also answers the relation scior:shareSuperClass (RB03) on demand. Their relations are only written into the graph
+    if materialize_relations is True, i.e., when they are read from the graph by the other rules.
+
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param materialize_relations: Indicates if the relations of the rules must be written into the graph as triples.
+    :type materialize_relations: bool
+    :param uri_table: Table whose ids are used for the closure's nodes. If None, a new table is created.
+    :type uri_table: UriTable | None
+    :return: Closure of the graph's rdfs:subClassOf relations.
+    :rtype: TaxonomyClosure
     """
 
     LOGGER.debug("Starting execution of all rules from group BASE.")
 
-    # Executing RB02 first than RB01 because it is faster and the results are the same.
-    run_rb01(ontology_graph)
-    run_rb02(ontology_graph)
-    run_rb03(ontology_graph)
+    taxonomy_closure = build_taxonomy_closure(ontology_graph, uri_table)
+
+    if materialize_relations:
+        run_rb01(ontology_graph, taxonomy_closure)
+        run_rb02(ontology_graph, taxonomy_closure)
+        run_rb03(ontology_graph, taxonomy_closure)
 
     LOGGER.debug("Execution of all rules from group BASE completed.")
+
+    return taxonomy_closure
@@ -1,17 +1,27 @@
 """ Implementation of all rules from the group CWA. """
-from rdflib import Graph, RDFS, URIRef
+from rdflib import Graph, RDFS
 
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
 from scior.modules.ontology_dataclassess.dataclass_moving import move_classification_to_not_type, \
     move_classification_to_is_type
-from scior.modules.resources_gufo import SCIOR_NAMESPACE
-from scior.modules.utils_dataclass import get_dataclass_by_uri
+from scior.modules.rules.rule_delta_definitions import RulesDelta, select_rows_touching_delta, \
+    select_groups_touching_delta, select_dataclasses_touching_delta, query_rows_touching_delta, \
+    query_groups_touching_delta
+from scior.modules.rules.rule_native_queries import query_intermediate_superclasses, query_isolated_classes, \
+    query_related_classes, query_share_kind, query_unrelated_siblings
+from scior.modules.rules.rule_prepared_queries import execute_rule_query
+from scior.modules.rules.rule_scheduler_definitions import RuleDeclaration
+from scior.modules.taxonomy_index import TaxonomyIndex, get_taxonomy_relations
+from scior.modules.type_aggregates import ANCESTORS
+from scior.modules.utils_dataclass import get_dataclass_by_id
 
 LOGGER = initialize_logger()
 
 
-def run_RC01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC01 from group CWA.
 
     Definition: ~(E z (RigidType(z) ^ Sortal(z) ^ subClassOf(x,z) ^ subClassOf(z,y))) ^ AntiRigidType(x) ^
@@ -22,6 +32,10 @@ def run_RC01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC01"
@@ -30,7 +44,7 @@ def run_RC01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
         PREFIX gufo: <http://purl.org/nemo/gufo#>
-        SELECT DISTINCT ?class_y ?class_z
+        SELECT DISTINCT ?class_x ?class_y ?class_z
         WHERE {
             ?class_x rdf:type gufo:AntiRigidType , gufo:Sortal .
             ?class_x rdfs:subClassOf ?class_y .
@@ -39,16 +53,21 @@ def run_RC01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_intermediate_superclasses, taxonomy_index,
+                                                 ["AntiRigidType", "Sortal"], [])
 
     # Setting Y as not Category if Z is known to not be (i.e., has in its not_type list) a Rigid Sortal.
     for row in query_result:
 
-        class_y = row.class_y.toPython()
-        class_z = row.class_z.toPython()
+        class_y = row.class_y
+        class_z = row.class_z
 
-        dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, class_y)
-        dataclass_z = get_dataclass_by_uri(ontology_dataclass_list, class_z)
+        dataclass_y = get_dataclass_by_id(ontology_dataclass_list, class_y)
+        dataclass_z = get_dataclass_by_id(ontology_dataclass_list, class_z)
 
         if "RigidType" in dataclass_z.not_type and "Sortal" in dataclass_z.not_type:
             move_classification_to_not_type(ontology_dataclass_list, dataclass_y, "Category", rule_code)
@@ -56,7 +75,9 @@ def run_RC01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC02 from group CWA.
 
     Definition: ~(E y, z (subClassOf(y,x) ^ AntiRigidType(y) ^ subClassOf(z,x) ^ RigidType(z))) -> ~Mixin(x)
@@ -68,27 +89,34 @@ def run_RC02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC02"
 
     LOGGER.debug(f"Starting rule {rule_code}")
 
-    for ontology_dataclass in ontology_dataclass_list:
+    # Subclasses are obtained from the taxonomy index, if used, or from the ontology graph
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+
+    for ontology_dataclass in select_dataclasses_touching_delta(ontology_dataclass_list, rules_delta):
         list_subclasses = []
         is_or_can_rigid_subclass = 0
         is_or_can_antirigid_subclass = 0
 
         # Creating list of subclasses for a dataclass
-        for subclass in ontology_graph.subjects(RDFS.subClassOf, URIRef(ontology_dataclass.uri)):
-            list_subclasses.append(subclass.toPython())
+        for subclass in taxonomy_relations.get_subclass_ids(ontology_dataclass.uri_id):
+            list_subclasses.append(subclass)
 
         # Removing the class itself from its list of subclasses
-        list_subclasses.remove(ontology_dataclass.uri)
+        list_subclasses.remove(ontology_dataclass.uri_id)
         num_subclasses = len(list_subclasses)
 
         for subclass in list_subclasses:
-            subclass_dataclass = get_dataclass_by_uri(ontology_dataclass_list, subclass)
+            subclass_dataclass = get_dataclass_by_id(ontology_dataclass_list, subclass)
 
             # At least one subclass must not have RigidType in its not_type list
             if "RigidType" not in subclass_dataclass.not_type:
@@ -105,7 +133,9 @@ def run_RC02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC03 from group CWA.
 
     Definition: ~(E y,z (x != y ^ x != z ^ subClassOf(x,y) ^ subClassOf(z,y)) -> Kind(x)
@@ -115,6 +145,10 @@ def run_RC03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC03"
@@ -139,16 +173,22 @@ def run_RC03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_isolated_classes, taxonomy_index)
 
     for row in query_result:
-        ontology_dataclass = get_dataclass_by_uri(ontology_dataclass_list, row.class_x.toPython())
+        ontology_dataclass = get_dataclass_by_id(ontology_dataclass_list, row.class_x)
         move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC04 from group CWA.
 
     Definition: ~(E y (subClassOf (x,y) ^ Kind(y))) -> ~Sortal(x)
@@ -159,34 +199,42 @@ def run_RC04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC04"
 
     LOGGER.debug(f"Starting rule {rule_code}")
 
-    for ontology_dataclass in ontology_dataclass_list:
-
-        # Creating list of superclasses that can be a Kind
-        for superclass in ontology_graph.objects(URIRef(ontology_dataclass.uri), RDFS.subClassOf):
-
-            # Else, check:
-            superclass_dataclass = get_dataclass_by_uri(ontology_dataclass_list, superclass.toPython())
+    # Superclasses are obtained from the ontology graph or, if the taxonomy index is used, the states of their
+    # classifications are obtained from the index's type aggregates
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+    type_aggregates = None if taxonomy_index is None else taxonomy_index.type_aggregates
 
-            # Checking if there is at least one superclass that IS or CAN BE a Kind. If there is, continue to the next
-
-            if "Kind" not in superclass_dataclass.not_type:
-                break
+    for ontology_dataclass in select_dataclasses_touching_delta(ontology_dataclass_list, rules_delta):
 
-        # If a break is not found:
-        # It means that all supertypes cannot be a Kind and that the evaluated dataclass cannot be a Sortal
+        # Checking if there is at least one superclass that IS or CAN BE a Kind. If there is, continue to the next
+        if taxonomy_index is None:
+            has_possible_superclass = any(
+                "Kind" not in get_dataclass_by_id(ontology_dataclass_list, superclass).not_type
+                for superclass in taxonomy_relations.get_superclass_ids(ontology_dataclass.uri_id))
         else:
+            _, _, not_count = type_aggregates.get_counts(ontology_dataclass.uri_id, ANCESTORS, "Kind")
+            has_possible_superclass = not_count < len(taxonomy_index.get_superclass_ids(ontology_dataclass.uri_id))
+
+        # If not, all supertypes cannot be a Kind and the evaluated dataclass cannot be a Sortal
+        if not has_possible_superclass:
             move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC05 from group CWA.
 
     Definition: ~(E y,z (y!=z ^ Sortal(y) ^ Sortal(z) ^ ~shareKind(y,z) ^ (subClassOf(y,x) v shareSuperClass(x,y)))^
@@ -197,6 +245,10 @@ def run_RC05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC05"
@@ -212,23 +264,31 @@ def run_RC05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_related_classes, taxonomy_index, None)
+
+    # Classes that share a Kind are in the same block of the partition kept by the taxonomy index, if used, or
+    # obtained from the ontology graph
+    kind_partition = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table,
+                                            taxonomy_index).kind_partition
 
-    scior_share_kind = URIRef(SCIOR_NAMESPACE + "shareKind")
     class_x_dict = {}
 
     # Creating dictionary for all evaluated classes with all classes related via subclasses or shareSuperClass
     for row in query_result:
 
-        class_x = row.class_x.toPython()
-        class_y = row.class_y.toPython()
+        class_x = row.class_x
+        class_y = row.class_y
 
         # Removing itself from the list
         if class_x == class_y:
             continue
 
         # Removing class_y if it cannot be a Sortal
-        dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, class_y)
+        dataclass_y = get_dataclass_by_id(ontology_dataclass_list, class_y)
         if "Sortal" in dataclass_y.not_type:
             continue
 
@@ -242,29 +302,18 @@ def run_RC05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     # Treating populated dictionary
     for evaluated_class in class_x_dict.keys():
 
-        # If the number of elements is smaller than two, set as not NonSortal
-        if len(class_x_dict[evaluated_class]) < 2:
-            dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, evaluated_class)
-            move_classification_to_not_type(ontology_dataclass_list, dataclass_x, "NonSortal")
-            continue
-
-        # Removing from evaluated_class's all elements that shareKind (leaving just one for each Kind)
-        for base_list_element in class_x_dict[evaluated_class]:
-            for comp_list_element in class_x_dict[evaluated_class]:
-                if base_list_element == comp_list_element:
-                    continue
-                elif (URIRef(base_list_element), scior_share_kind, URIRef(comp_list_element)) in ontology_graph:
-                    class_x_dict[evaluated_class].remove(comp_list_element)
-
-        # If the final list is smaller than two, than it cannot be a NonSortal:
-        if len(class_x_dict[evaluated_class]) < 2:
-            dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, evaluated_class)
+        # Counting the related classes once for each Kind (i.e., for each block of the partition). If the number of
+        # blocks is smaller than two, there are no two related Sortals that do not share a Kind: set as not NonSortal.
+        if kind_partition.count_partitions(class_x_dict[evaluated_class]) < 2:
+            dataclass_x = get_dataclass_by_id(ontology_dataclass_list, evaluated_class)
             move_classification_to_not_type(ontology_dataclass_list, dataclass_x, "NonSortal")
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC06 from group CWA.
 
     Definition: ~(E z (Phase(z) ^ subClassOf(x,z) ^ subClassOf(z,y))) ^ Role(x) ^ subClassOf(x,y) -> ~PhaseMixin(y)
@@ -274,6 +323,10 @@ def run_RC06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC06"
@@ -282,7 +335,7 @@ def run_RC06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
         PREFIX gufo: <http://purl.org/nemo/gufo#>
-        SELECT DISTINCT ?class_y ?class_z
+        SELECT DISTINCT ?class_x ?class_y ?class_z
         WHERE {
             ?class_x rdf:type gufo:Role .
             ?class_x rdfs:subClassOf ?class_y .
@@ -294,19 +347,24 @@ def run_RC06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_intermediate_superclasses, taxonomy_index, ["Role"],
+                                                 [], all_distinct=True)
 
     # Setting Y as not PhaseMixin if Z is known to not be (i.e., has in its not_type list) a Phase.
     for row in query_result:
 
-        class_y = row.class_y.toPython()
-        class_z = row.class_z.toPython()
+        class_y = row.class_y
+        class_z = row.class_z
 
         if class_y == class_z:
             continue
 
-        dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, class_y)
-        dataclass_z = get_dataclass_by_uri(ontology_dataclass_list, class_z)
+        dataclass_y = get_dataclass_by_id(ontology_dataclass_list, class_y)
+        dataclass_z = get_dataclass_by_id(ontology_dataclass_list, class_z)
 
         if "Phase" in dataclass_z.not_type:
             move_classification_to_not_type(ontology_dataclass_list, dataclass_y, "PhaseMixin", rule_code)
@@ -314,7 +372,9 @@ def run_RC06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC07 from group CWA.
 
     Definition: ~(E z (Phase(z) ^ subClassOf(x,z) ^ subClassOf(z,y))) ^ PhaseMixin(y) ^ subClassOf(x,y) -> ~Role(x)
@@ -324,6 +384,10 @@ def run_RC07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC07"
@@ -332,7 +396,7 @@ def run_RC07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
         PREFIX gufo: <http://purl.org/nemo/gufo#>
-        SELECT DISTINCT ?class_x ?class_z
+        SELECT DISTINCT ?class_x ?class_y ?class_z
         WHERE {
             ?class_y rdf:type gufo:PhaseMixin .
             ?class_x rdfs:subClassOf ?class_y .
@@ -344,19 +408,24 @@ def run_RC07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_intermediate_superclasses, taxonomy_index, [],
+                                                 ["PhaseMixin"], all_distinct=True)
 
     # Setting X as not Role if Z is known to not be (i.e., has in its not_type list) a Phase.
     for row in query_result:
 
-        class_x = row.class_x.toPython()
-        class_z = row.class_z.toPython()
+        class_x = row.class_x
+        class_z = row.class_z
 
         if class_x == class_z:
             continue
 
-        dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, class_x)
-        dataclass_z = get_dataclass_by_uri(ontology_dataclass_list, class_z)
+        dataclass_x = get_dataclass_by_id(ontology_dataclass_list, class_x)
+        dataclass_z = get_dataclass_by_id(ontology_dataclass_list, class_z)
 
         if "Phase" in dataclass_z.not_type:
             move_classification_to_not_type(ontology_dataclass_list, dataclass_x, "Role", rule_code)
@@ -364,7 +433,9 @@ def run_RC07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC08 from group CWA.
 
     Definition: ~(E y (Phase (y) ^ shareKind(x,y) ^ ~isSubClassOf(x,y) ^ ~isSubClassOf(y,x))) -> ~Phase(x)
@@ -374,6 +445,10 @@ def run_RC08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC08"
@@ -388,17 +463,24 @@ def run_RC08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_share_kind, taxonomy_index, None)
+
+    # Relations are verified in the taxonomy index, if used, or in the ontology graph
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
 
     # Creating dictionary for query results
     class_x_dict = {}
     for row in query_result:
 
-        class_x = row.class_x.toPython()
-        class_y = row.class_y.toPython()
+        class_x = row.class_x
+        class_y = row.class_y
 
         # A dictionary key is going to be created for each Phase candidate only
-        dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, class_x)
+        dataclass_x = get_dataclass_by_id(ontology_dataclass_list, class_x)
         if "Phase" in dataclass_x.not_type:
             continue
 
@@ -411,12 +493,12 @@ def run_RC08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             continue
 
         # Excluding population of class_y if it cannot be a Phase
-        dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, class_y)
+        dataclass_y = get_dataclass_by_id(ontology_dataclass_list, class_y)
         if "Phase" in dataclass_y.not_type:
             continue
 
         # Excluding population of class_y if it is a subclass of class_x
-        if (URIRef(dataclass_y.uri), RDFS.subClassOf, URIRef(dataclass_x.uri)) in ontology_graph:
+        if (class_y, RDFS.subClassOf, class_x) in taxonomy_relations:
             continue
 
         # Populate dictionary
@@ -424,13 +506,15 @@ def run_RC08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     for evaluated_class in class_x_dict.keys():
         if len(class_x_dict[evaluated_class]) == 0:
-            dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, evaluated_class)
+            dataclass_x = get_dataclass_by_id(ontology_dataclass_list, evaluated_class)
             move_classification_to_not_type(ontology_dataclass_list, dataclass_x, "Phase", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC09 from group CWA.
 
     Definition: ~(E y (Category (y) ^ isSubClassOf(x,y))) -> ~PhaseMixin(x)
@@ -441,34 +525,42 @@ def run_RC09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC09"
 
     LOGGER.debug(f"Starting rule {rule_code}")
 
-    for ontology_dataclass in ontology_dataclass_list:
-
-        # Creating list of superclasses that can be a Category
-        for superclass in ontology_graph.objects(URIRef(ontology_dataclass.uri), RDFS.subClassOf):
-
-            # Else, check:
-            superclass_dataclass = get_dataclass_by_uri(ontology_dataclass_list, superclass.toPython())
+    # Superclasses are obtained from the ontology graph or, if the taxonomy index is used, the states of their
+    # classifications are obtained from the index's type aggregates
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+    type_aggregates = None if taxonomy_index is None else taxonomy_index.type_aggregates
 
-            # Checking if is at least one superclass that IS or CAN BE a Category. If there is, continue to the next.
+    for ontology_dataclass in select_dataclasses_touching_delta(ontology_dataclass_list, rules_delta):
 
-            if "Category" not in superclass_dataclass.not_type:
-                break
-
-        # If a break is not found:
-        # It means that all supertypes cannot be a Category and that the evaluated dataclass cannot be a PhaseMixin
+        # Checking if is at least one superclass that IS or CAN BE a Category. If there is, continue to the next.
+        if taxonomy_index is None:
+            has_possible_superclass = any(
+                "Category" not in get_dataclass_by_id(ontology_dataclass_list, superclass).not_type
+                for superclass in taxonomy_relations.get_superclass_ids(ontology_dataclass.uri_id))
         else:
+            _, _, not_count = type_aggregates.get_counts(ontology_dataclass.uri_id, ANCESTORS, "Category")
+            has_possible_superclass = not_count < len(taxonomy_index.get_superclass_ids(ontology_dataclass.uri_id))
+
+        # If not, all supertypes cannot be a Category and the evaluated dataclass cannot be a PhaseMixin
+        if not has_possible_superclass:
             move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC10(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC10(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC10 from group CWA.
 
     Definition: ~(E z (PhaseMixin(z) ^ Category(y) ^ subClassOf(x,y) ^ ~isSubClassOf(x,z) ^ ~isSubClassOf(z,x) ^
@@ -481,6 +573,10 @@ def run_RC10(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC10"
@@ -489,7 +585,7 @@ def run_RC10(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
         PREFIX gufo: <http://purl.org/nemo/gufo#>
-        SELECT DISTINCT ?class_x ?class_y
+        SELECT DISTINCT ?class_x ?class_y ?class_z
         WHERE {
             ?class_x rdfs:subClassOf ?class_y .
             ?class_z rdfs:subClassOf ?class_y .
@@ -501,14 +597,18 @@ def run_RC10(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_unrelated_siblings, taxonomy_index, "PhaseMixin")
 
     dictionary_y = {}
 
     for row in query_result:
 
-        class_y = row.class_y.toPython()
-        class_x = row.class_x.toPython()
+        class_y = row.class_y
+        class_x = row.class_x
 
         # If dictionary entry does not exist, create a new one
         if class_y not in dictionary_y.keys():
@@ -517,18 +617,20 @@ def run_RC10(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         dictionary_y[class_y].append(class_x)
 
     for class_y in dictionary_y.keys():
-        dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, class_y)
+        dataclass_y = get_dataclass_by_id(ontology_dataclass_list, class_y)
 
         # If the superclass Y cannot be a Category, then all its subtypes (different then Z) cannot be PhaseMixins
         if "Category" in dataclass_y.not_type:
             for class_x in dictionary_y[class_y]:
-                dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, class_x)
+                dataclass_x = get_dataclass_by_id(ontology_dataclass_list, class_x)
                 move_classification_to_not_type(ontology_dataclass_list, dataclass_x, "PhaseMixin", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def run_RC11(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_RC11(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Implements rule RC11 from group CWA.
 
     Definition: ~(E z (PhaseMixin(z) ^ PhaseMixin(x) ^ subClassOf(x,y) ^ ~isSubClassOf(x,z) ^ ~isSubClassOf(z,x) ^
@@ -541,6 +643,10 @@ def run_RC11(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RC11"
@@ -561,14 +667,19 @@ def run_RC11(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         }
         """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_y", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_y", query_unrelated_siblings, taxonomy_index,
+                                                   "PhaseMixin", project_z=False)
 
     dictionary_y = {}
 
     for row in query_result:
 
-        class_y = row.class_y.toPython()
-        class_x = row.class_x.toPython()
+        class_y = row.class_y
+        class_x = row.class_x
 
         # If dictionary entry does not exist, create a new one
         if class_y not in dictionary_y.keys():
@@ -578,40 +689,80 @@ def run_RC11(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     for class_y in dictionary_y.keys():
         for class_x in dictionary_y[class_y]:
-            dataclass_x = get_dataclass_by_uri(ontology_dataclass_list, class_x)
+            dataclass_x = get_dataclass_by_id(ontology_dataclass_list, class_x)
 
             # If positive, at least one subclass can be a PhaseMixin, then Y can be a Category.
             if "PhaseMixin" not in dataclass_x.not_type:
                 break
         else:
             # If it is here is because all elements in the list dictionary_y[class_y] cannot be PhaseMixins
-            dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, class_y)
+            dataclass_y = get_dataclass_by_id(ontology_dataclass_list, class_y)
             move_classification_to_not_type(ontology_dataclass_list, dataclass_y, "Category", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
-def execute_rules_ufo_cwa(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+# Declaration of the rules of the group CWA and of their read and write sets, used by the rules scheduler.
+UFO_CWA_RULES = [
+    RuleDeclaration("RC01", "rule_group_ufo_cwa", run_RC01,
+                    reads=["AntiRigidType", "RigidType", "Sortal", "rdfs:subClassOf"],
+                    writes=["Category"]),
+    RuleDeclaration("RC02", "rule_group_ufo_cwa", run_RC02,
+                    reads=["AntiRigidType", "RigidType", "rdfs:subClassOf"],
+                    writes=["Mixin"]),
+    RuleDeclaration("RC03", "rule_group_ufo_cwa", run_RC03, reads=["owl:Class", "rdfs:subClassOf"], writes=["Kind"]),
+    RuleDeclaration("RC04", "rule_group_ufo_cwa", run_RC04, reads=["Kind", "rdfs:subClassOf"], writes=["Sortal"]),
+    RuleDeclaration("RC05", "rule_group_ufo_cwa", run_RC05,
+                    reads=["Sortal", "rdfs:subClassOf", "scior:shareKind", "scior:shareSuperClass"],
+                    writes=["NonSortal"]),
+    RuleDeclaration("RC06", "rule_group_ufo_cwa", run_RC06,
+                    reads=["Phase", "Role", "rdfs:subClassOf"],
+                    writes=["PhaseMixin"]),
+    RuleDeclaration("RC07", "rule_group_ufo_cwa", run_RC07,
+                    reads=["Phase", "PhaseMixin", "rdfs:subClassOf"],
+                    writes=["Role"]),
+    RuleDeclaration("RC08", "rule_group_ufo_cwa", run_RC08,
+                    reads=["Phase", "rdfs:subClassOf", "scior:shareKind"],
+                    writes=["Phase"]),
+    RuleDeclaration("RC09", "rule_group_ufo_cwa", run_RC09,
+                    reads=["Category", "rdfs:subClassOf"],
+                    writes=["PhaseMixin"]),
+    RuleDeclaration("RC10", "rule_group_ufo_cwa", run_RC10,
+                    reads=["Category", "PhaseMixin", "rdfs:subClassOf"],
+                    writes=["PhaseMixin"]),
+    RuleDeclaration("RC11", "rule_group_ufo_cwa", run_RC11,
+                    reads=["PhaseMixin", "rdfs:subClassOf"],
+                    writes=["Category"]),
+]
+
+
+def execute_rules_ufo_cwa(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+                          rules_delta: RulesDelta | None = None,
+                          taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Call execution all rules from the group UFO CWA.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the group's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     LOGGER.debug("Starting execution of all rules from group UFO CWA.")
 
-    run_RC01(ontology_dataclass_list, ontology_graph)
-    run_RC02(ontology_dataclass_list, ontology_graph)
-    run_RC03(ontology_dataclass_list, ontology_graph)
-    run_RC04(ontology_dataclass_list, ontology_graph)
-    run_RC05(ontology_dataclass_list, ontology_graph)
-    run_RC06(ontology_dataclass_list, ontology_graph)
-    run_RC07(ontology_dataclass_list, ontology_graph)
-    run_RC08(ontology_dataclass_list, ontology_graph)
-    run_RC09(ontology_dataclass_list, ontology_graph)
-    run_RC10(ontology_dataclass_list, ontology_graph)
-    run_RC11(ontology_dataclass_list, ontology_graph)
+    run_RC01(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC02(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC03(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC04(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC05(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC06(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC07(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC08(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC09(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC10(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_RC11(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
 
     LOGGER.debug("Execution of all rules from group UFO Some completed.")
@@ -1,110 +1,87 @@
 """ Implementation of all rules from the group gUFO Leaves. """
 
-# Used this way to avoid circular dependency
-import scior.modules.ontology_dataclassess.dataclass_moving as m
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.rules.rule_gufo_definitions import GufoRule, execute_gufo_rules_table
 
 LOGGER = initialize_logger()
 
+# Rules are executed in the order they are declared.
+GUFO_LEAVES_RULES = [
+    # RL01: RigidType(x) ^ ~Kind(x) ^ ~SubKind(x) -> Category(x)
+    GufoRule("RL01", is_premises=["RigidType"], not_premises=["Kind", "SubKind"], is_conclusions=["Category"]),
+
+    # RL02: RigidType(x) ^ ~SubKind(x) ^ ~Category(x) -> Kind(x)
+    GufoRule("RL02", is_premises=["RigidType"], not_premises=["SubKind", "Category"], is_conclusions=["Kind"]),
+
+    # RL03: RigidType(x) ^ ~Kind(x) ^ ~Category(x) -> SubKind(x)
+    GufoRule("RL03", is_premises=["RigidType"], not_premises=["Kind", "Category"], is_conclusions=["SubKind"]),
+
+    # RL04: AntiRigidType(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) -> Role(x)
+    GufoRule("RL04", is_premises=["AntiRigidType"], not_premises=["Phase", "RoleMixin", "PhaseMixin"],
+             is_conclusions=["Role"]),
+
+    # RL05: AntiRigidType(x) ^ ~Role(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) -> Phase(x)
+    GufoRule("RL05", is_premises=["AntiRigidType"], not_premises=["Role", "RoleMixin", "PhaseMixin"],
+             is_conclusions=["Phase"]),
+
+    # RL06: AntiRigidType(x) ^ ~Role(x) ^ ~Phase(x) ^ ~PhaseMixin(x) -> RoleMixin(x)
+    GufoRule("RL06", is_premises=["AntiRigidType"], not_premises=["Role", "Phase", "PhaseMixin"],
+             is_conclusions=["RoleMixin"]),
+
+    # RL07: AntiRigidType(x) ^ ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) -> PhaseMixin(x)
+    GufoRule("RL07", is_premises=["AntiRigidType"], not_premises=["Role", "Phase", "RoleMixin"],
+             is_conclusions=["PhaseMixin"]),
+
+    # RL08: Sortal(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x) -> Kind(x)
+    GufoRule("RL08", is_premises=["Sortal"], not_premises=["Phase", "Role", "SubKind"], is_conclusions=["Kind"]),
+
+    # RL09: Sortal(x) ^ ~Kind(x) ^ ~Role(x) ^ ~SubKind(x) -> Phase(x)
+    GufoRule("RL09", is_premises=["Sortal"], not_premises=["Kind", "Role", "SubKind"], is_conclusions=["Phase"]),
+
+    # RL10: Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~SubKind(x) -> Role(x)
+    GufoRule("RL10", is_premises=["Sortal"], not_premises=["Kind", "Phase", "SubKind"], is_conclusions=["Role"]),
+
+    # RL11: Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~Role(x) -> SubKind(x)
+    GufoRule("RL11", is_premises=["Sortal"], not_premises=["Kind", "Phase", "Role"], is_conclusions=["SubKind"]),
+
+    # RL12: NonSortal(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x) -> Category(x)
+    GufoRule("RL12", is_premises=["NonSortal"], not_premises=["PhaseMixin", "RoleMixin", "Mixin"],
+             is_conclusions=["Category"]),
+
+    # RL13: NonSortal(x) ^ ~Category(x) ^ ~RoleMixin(x) ^ ~Mixin(x) -> PhaseMixin(x)
+    GufoRule("RL13", is_premises=["NonSortal"], not_premises=["Category", "RoleMixin", "Mixin"],
+             is_conclusions=["PhaseMixin"]),
+
+    # RL14: NonSortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~Mixin(x) -> RoleMixin(x)
+    GufoRule("RL14", is_premises=["NonSortal"], not_premises=["Category", "PhaseMixin", "Mixin"],
+             is_conclusions=["RoleMixin"]),
+
+    # RL15: NonSortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) -> Mixin(x)
+    GufoRule("RL15", is_premises=["NonSortal"], not_premises=["Category", "PhaseMixin", "RoleMixin"],
+             is_conclusions=["Mixin"]),
+]
+
 
 def execute_gufo_leaves_rules(ontology_dataclass_list: list[OntologyDataClass]) -> None:
-    """ Executes once all rules of the group gUFO Leaves.
+    """ Executes once all rules of the group gUFO Leaves for all dataclasses of the list.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     """
 
-    # LOGGER.debug("Executing all positive rules from group gUFO.")
-
     for ontology_dataclass in ontology_dataclass_list:
+        execute_gufo_leaves_rules_dataclass(ontology_dataclass_list, ontology_dataclass)
+
+
+def execute_gufo_leaves_rules_dataclass(ontology_dataclass_list: list[OntologyDataClass],
+                                        ontology_dataclass: OntologyDataClass) -> None:
+    """ Executes once all rules of the group gUFO Leaves for a single dataclass.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param ontology_dataclass: Data structure that contains information about the class to be evaluated.
+    :type ontology_dataclass: OntologyDataClass
+    """
 
-        # RL01: RigidType(x) ^ ~Kind(x) ^ ~SubKind(x) -> Category(x)
-        if "RigidType" in ontology_dataclass.is_type and "Kind" in ontology_dataclass.not_type and "SubKind" in ontology_dataclass.not_type:
-            rule_code = "RL01"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-
-        # RL02: RigidType(x) ^ ~SubKind(x) ^ ~Category(x) -> Kind(x)
-        if "RigidType" in ontology_dataclass.is_type and "SubKind" in ontology_dataclass.not_type and "Category" in ontology_dataclass.not_type:
-            rule_code = "RL02"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-
-        # RL03: RigidType(x) ^ ~Kind(x) ^ ~Category(x) -> SubKind(x)
-        if "RigidType" in ontology_dataclass.is_type and "Kind" in ontology_dataclass.not_type and "Category" in ontology_dataclass.not_type:
-            rule_code = "RL03"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RL04: AntiRigidType(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) -> Role(x)
-        if "AntiRigidType" in ontology_dataclass.is_type and "Phase" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type:
-            rule_code = "RL04"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-
-        # RL05: AntiRigidType(x) ^ ~Role(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) -> Phase(x)
-        if "AntiRigidType" in ontology_dataclass.is_type and "Role" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type:
-            rule_code = "RL05"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-
-        # RL06: AntiRigidType(x) ^ ~Role(x) ^ ~Phase(x) ^ ~PhaseMixin(x) -> RoleMixin(x)
-        if "AntiRigidType" in ontology_dataclass.is_type and "Role" in ontology_dataclass.not_type and "Phase" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type:
-            rule_code = "RL06"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-
-        # RL07: AntiRigidType(x) ^ ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) -> PhaseMixin(x)
-        if "AntiRigidType" in ontology_dataclass.is_type and "Role" in ontology_dataclass.not_type and "Phase" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type:
-            rule_code = "RL07"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-
-        # RL08: Sortal(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x) -> Kind(x)
-        if "Sortal" in ontology_dataclass.is_type and "Phase" in ontology_dataclass.not_type and "Role" in ontology_dataclass.not_type and "SubKind" in ontology_dataclass.not_type:
-            rule_code = "RL08"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-
-        # RL09: Sortal(x) ^ ~Kind(x) ^ ~Role(x) ^ ~SubKind(x) -> Phase(x)
-        if "Sortal" in ontology_dataclass.is_type and "Kind" in ontology_dataclass.not_type and "Role" in ontology_dataclass.not_type and "SubKind" in ontology_dataclass.not_type:
-            rule_code = "RL09"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-
-        # RL10: Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~SubKind(x) -> Role(x)
-        if "Sortal" in ontology_dataclass.is_type and "Kind" in ontology_dataclass.not_type and "Phase" in ontology_dataclass.not_type and "SubKind" in ontology_dataclass.not_type:
-            rule_code = "RL10"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-
-        # RL11: Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~Role(x) -> SubKind(x)
-        if "Sortal" in ontology_dataclass.is_type and "Kind" in ontology_dataclass.not_type and "Phase" in ontology_dataclass.not_type and "Role" in ontology_dataclass.not_type:
-            rule_code = "RL11"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RL12: NonSortal(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x) -> Category(x)
-        if "NonSortal" in ontology_dataclass.is_type and "PhaseMixin" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type and "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RL12"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-
-        # RL13: NonSortal(x) ^ ~Category(x) ^ ~RoleMixin(x) ^ ~Mixin(x) -> PhaseMixin(x)
-        if "NonSortal" in ontology_dataclass.is_type and "Category" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type and "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RL13"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-
-        # RL14: NonSortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~Mixin(x) -> RoleMixin(x)
-        if "NonSortal" in ontology_dataclass.is_type and "Category" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type and "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RL14"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-
-        # RL15: NonSortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) -> Mixin(x)
-        if "NonSortal" in ontology_dataclass.is_type and "Category" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type:
-            rule_code = "RL15"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
+    execute_gufo_rules_table(ontology_dataclass_list, ontology_dataclass, GUFO_LEAVES_RULES)
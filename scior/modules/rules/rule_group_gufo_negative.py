@@ -1,116 +1,75 @@
 """ Implementation of all rules from the group gUFO Negative. """
 
-# Used this way to avoid circular dependency
-import scior.modules.ontology_dataclassess.dataclass_moving as m
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.rules.rule_gufo_definitions import GufoRule, execute_gufo_rules_table
 
 LOGGER = initialize_logger()
 
+# Rules are executed in the order they are declared.
+GUFO_NEGATIVE_RULES = [
+    # RN01: ~NonRigidType(x) -> RigidType(x)
+    GufoRule("RN01", not_premises=["NonRigidType"], is_conclusions=["RigidType"]),
+
+    # RN02: ~AntiRigidType(x) ^ ~SemiRigidType(x) -> RigidType(x)
+    GufoRule("RN02", not_premises=["AntiRigidType", "SemiRigidType"], is_conclusions=["RigidType"]),
+
+    # RN03:    ~Category(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) ->
+    #           SemiRigidType(x)
+    GufoRule("RN03", not_premises=["Category", "Kind", "SubKind", "Role", "Phase", "RoleMixin", "PhaseMixin"],
+             is_conclusions=["SemiRigidType"]),
+
+    # RN04: ~Category(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Mixin(x) -> AntiRigidType(x)
+    GufoRule("RN04", not_premises=["Category", "Kind", "SubKind", "Mixin"], is_conclusions=["AntiRigidType"]),
+
+    # RN05: ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) ^ ~Mixin(x) -> RigidType(x)
+    GufoRule("RN05", not_premises=["Role", "Phase", "RoleMixin", "PhaseMixin", "Mixin"], is_conclusions=["RigidType"]),
+
+    # RN06: ~RigidType(x) -> NonRigidType(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Category(x)
+    GufoRule("RN06", not_premises=["RigidType"], is_conclusions=["NonRigidType"],
+             not_conclusions=["Kind", "SubKind", "Category"]),
+
+    # RN07: ~Sortal(x) -> NonSortal(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Role(x) ^ ~Phase(x)
+    GufoRule("RN07", not_premises=["Sortal"], is_conclusions=["NonSortal"],
+             not_conclusions=["Kind", "SubKind", "Role", "Phase"]),
+
+    # RN08: ~NonSortal(x) -> Sortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x)
+    GufoRule("RN08", not_premises=["NonSortal"], is_conclusions=["Sortal"],
+             not_conclusions=["Category", "PhaseMixin", "RoleMixin", "Mixin"]),
+
+    # RN09: ~Kind(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x) -> NonSortal(x)
+    GufoRule("RN09", not_premises=["Kind", "Phase", "Role", "SubKind"], is_conclusions=["NonSortal"]),
+
+    # RN10: ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x) -> Sortal(x)
+    GufoRule("RN10", not_premises=["Category", "PhaseMixin", "RoleMixin", "Mixin"], is_conclusions=["Sortal"]),
+
+    # RN11: ~AntiRigidType(x) -> ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x)
+    GufoRule("RN11", not_premises=["AntiRigidType"], not_conclusions=["Role", "Phase", "RoleMixin", "PhaseMixin"]),
+
+    # RN12: ~Mixin(x) -> ~SemiRigidType
+    GufoRule("RN12", not_premises=["Mixin"], not_conclusions=["SemiRigidType"]),
+]
+
 
 def execute_gufo_negative_rules(ontology_dataclass_list: list[OntologyDataClass]) -> None:
-    """ Executes once all rules of the group gUFO Negative.
+    """ Executes once all rules of the group gUFO Negative for all dataclasses of the list.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     """
 
-    # LOGGER.debug("Executing all negative rules from group gUFO.")
-
     for ontology_dataclass in ontology_dataclass_list:
+        execute_gufo_negative_rules_dataclass(ontology_dataclass_list, ontology_dataclass)
+
+
+def execute_gufo_negative_rules_dataclass(ontology_dataclass_list: list[OntologyDataClass],
+                                          ontology_dataclass: OntologyDataClass) -> None:
+    """ Executes once all rules of the group gUFO Negative for a single dataclass.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param ontology_dataclass: Data structure that contains information about the class to be evaluated.
+    :type ontology_dataclass: OntologyDataClass
+    """
 
-        # RN01: ~NonRigidType(x) -> RigidType(x)
-        if "NonRigidType" in ontology_dataclass.not_type:
-            rule_code = "RN01"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-
-        # RN02: ~AntiRigidType(x) ^ ~SemiRigidType(x) -> RigidType(x)
-        if "AntiRigidType" in ontology_dataclass.not_type and "SemiRigidType" in ontology_dataclass.not_type:
-            rule_code = "RN02"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-
-        # RN03:    ~Category(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) ->
-        #           SemiRigidType(x)
-        if "Category" in ontology_dataclass.not_type and "Kind" in ontology_dataclass.not_type and \
-                "SubKind" in ontology_dataclass.not_type and "Role" in ontology_dataclass.not_type and \
-                "Phase" in ontology_dataclass.not_type and "RoleMixin" in ontology_dataclass.not_type and \
-                "PhaseMixin" in ontology_dataclass.not_type:
-            rule_code = "RN03"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "SemiRigidType",
-                                             rule_code)
-
-        # RN04: ~Category(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Mixin(x) -> AntiRigidType(x)
-        if "Category" in ontology_dataclass.not_type and "Kind" in ontology_dataclass.not_type and \
-                "SubKind" in ontology_dataclass.not_type and "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RN04"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-
-        # RN05: ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) ^ ~Mixin(x) -> RigidType(x)
-        if "Role" in ontology_dataclass.not_type and "Phase" in ontology_dataclass.not_type and \
-                "RoleMixin" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type and \
-                "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RN05"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-
-        # RN06: ~RigidType(x) -> NonRigidType(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Category(x)
-        if "RigidType" in ontology_dataclass.not_type:
-            rule_code = "RN06"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-
-        # RN07: ~Sortal(x) -> NonSortal(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Role(x) ^ ~Phase(x)
-        if "Sortal" in ontology_dataclass.not_type:
-            rule_code = "RN07"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-
-        # RN08: ~NonSortal(x) -> Sortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x)
-        if "NonSortal" in ontology_dataclass.not_type:
-            rule_code = "RN08"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-
-        # RN09: ~Kind(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x) -> NonSortal(x)
-        if "Kind" in ontology_dataclass.not_type and "Phase" in ontology_dataclass.not_type and \
-                "Role" in ontology_dataclass.not_type and "SubKind" in ontology_dataclass.not_type:
-            rule_code = "RN09"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-
-        # RN10: ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x) -> Sortal(x)
-        if "Category" in ontology_dataclass.not_type and "PhaseMixin" in ontology_dataclass.not_type and \
-                "RoleMixin" in ontology_dataclass.not_type and "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RN10"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-
-        # RN11: ~AntiRigidType(x) -> ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x)
-        if "AntiRigidType" in ontology_dataclass.not_type:
-            rule_code = "RN11"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-
-        # RN12: ~Mixin(x) -> ~SemiRigidType
-        if "Mixin" in ontology_dataclass.not_type:
-            rule_code = "RN12"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SemiRigidType", rule_code)
+    execute_gufo_rules_table(ontology_dataclass_list, ontology_dataclass, GUFO_NEGATIVE_RULES)
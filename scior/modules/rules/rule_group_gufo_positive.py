@@ -1,186 +1,98 @@
 """ Implementation of all rules from the group gUFO Positive. """
 
-# Used this way to avoid circular dependency
-import scior.modules.ontology_dataclassess.dataclass_moving as m
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.rules.rule_gufo_definitions import GufoRule, execute_gufo_rules_table
 
 LOGGER = initialize_logger()
 
+# Rules are executed in the order they are declared.
+GUFO_POSITIVE_RULES = [
+    # RP01: NonRigidType(x) -> ~RigidType(x)
+    GufoRule("RP01", is_premises=["NonRigidType"], not_conclusions=["RigidType"]),
+
+    # RP02: RigidType(x) -> ~NonRigidType(x) ^ ~AntiRigidType(x) ^ ~SemiRigidType(x) ^
+    #                       ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) ^ ~Mixin(x)
+    GufoRule("RP02", is_premises=["RigidType"],
+             not_conclusions=["NonRigidType", "AntiRigidType", "SemiRigidType", "Role", "Phase", "RoleMixin",
+                              "PhaseMixin", "Mixin"]),
+
+    # RP03: AntiRigidType(x) -> NonRigidType(x) ^
+    #                           ~SemiRigidType(x) ^ ~Category(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Mixin(x)
+    GufoRule("RP03", is_premises=["AntiRigidType"], is_conclusions=["NonRigidType"],
+             not_conclusions=["SemiRigidType", "Category", "Kind", "SubKind", "Mixin"]),
+
+    # RP04: SemiRigidType(x) -> Mixin(x) ^ NonRigidType(x) ^ ~AntiRigidType(x) ^ ~Category(x) ^
+    #                           ~Kind(x) ^ ~SubKind(x) ^ ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x)
+    GufoRule("RP04", is_premises=["SemiRigidType"], is_conclusions=["Mixin", "NonRigidType"],
+             not_conclusions=["AntiRigidType", "Category", "Kind", "SubKind", "Role", "Phase", "RoleMixin",
+                              "PhaseMixin"]),
+
+    # RP05: NonSortal(x) -> ~Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x)
+    GufoRule("RP05", is_premises=["NonSortal"], not_conclusions=["Sortal", "Kind", "Phase", "Role", "SubKind"]),
+
+    # RP06: Sortal(x) -> ~NonSortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x)
+    GufoRule("RP06", is_premises=["Sortal"],
+             not_conclusions=["NonSortal", "Category", "PhaseMixin", "RoleMixin", "Mixin"]),
+
+    # RP07: Kind(x) -> RigidType(x) ^ Sortal(x) ^ ~Category(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x)
+    GufoRule("RP07", is_premises=["Kind"], is_conclusions=["RigidType", "Sortal"],
+             not_conclusions=["Category", "Phase", "Role", "SubKind"]),
+
+    # RP08: SubKind(x) -> RigidType(x) ^ Sortal(x) ^ ~Category(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~Role(x)
+    GufoRule("RP08", is_premises=["SubKind"], is_conclusions=["RigidType", "Sortal"],
+             not_conclusions=["Category", "Kind", "Phase", "Role"]),
+
+    # RP09: Role(x) ->   AntiRigidType(x) ^ Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^
+    #                   ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~SubKind(x)
+    GufoRule("RP09", is_premises=["Role"], is_conclusions=["AntiRigidType", "Sortal"],
+             not_conclusions=["Kind", "Phase", "PhaseMixin", "RoleMixin", "SubKind"]),
+
+    # RP10: Phase(x) ->  AntiRigidType(x) ^ Sortal(x) ^ ~Kind(x) ^
+    #                   ~PhaseMixin(x) ^ ~Role(x) ^ ~RoleMixin(x) ^ ~SubKind(x)
+    GufoRule("RP10", is_premises=["Phase"], is_conclusions=["AntiRigidType", "Sortal"],
+             not_conclusions=["Kind", "PhaseMixin", "Role", "RoleMixin", "SubKind"]),
+
+    # RP11: Category(x) ->   NonSortal(x) ^ RigidType(x) ^
+    #                       ~Kind(x) ^ ~Mixin(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~SubKind(x)
+    GufoRule("RP11", is_premises=["Category"], is_conclusions=["NonSortal", "RigidType"],
+             not_conclusions=["Kind", "Mixin", "PhaseMixin", "RoleMixin", "SubKind"]),
+
+    # RP12: RoleMixin(x) -> AntiRigidType(x) ^ NonSortal(x) ^
+    #                       ~Category(x) ^ ~Mixin(x) ^ ~Phase(x) ^ ~PhaseMixin(x) ^ ~Role(x)
+    GufoRule("RP12", is_premises=["RoleMixin"], is_conclusions=["AntiRigidType", "NonSortal"],
+             not_conclusions=["Category", "Mixin", "Phase", "PhaseMixin", "Role"]),
+
+    # RP13: PhaseMixin(x) ->    AntiRigidType(x) ^ NonSortal(x) ^
+    #                           ~Category(x) ^ ~Mixin(x) ^ ~Phase(x) ^ ~Role(x) ^ ~RoleMixin(x)
+    GufoRule("RP13", is_premises=["PhaseMixin"], is_conclusions=["AntiRigidType", "NonSortal"],
+             not_conclusions=["Category", "Mixin", "Phase", "Role", "RoleMixin"]),
+
+    # RP14: Mixin(x) -> NonSortal(x) ^ SemiRigidType(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x)
+    GufoRule("RP14", is_premises=["Mixin"], is_conclusions=["NonSortal", "SemiRigidType"],
+             not_conclusions=["Category", "PhaseMixin", "RoleMixin"]),
+]
+
 
 def execute_gufo_positive_rules(ontology_dataclass_list: list[OntologyDataClass]) -> None:
-    """ Executes once all rules of the group gUFO Positive.
+    """ Executes once all rules of the group gUFO Positive for all dataclasses of the list.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     """
 
-    # LOGGER.debug("Executing all positive rules from group gUFO.")
-
     for ontology_dataclass in ontology_dataclass_list:
+        execute_gufo_positive_rules_dataclass(ontology_dataclass_list, ontology_dataclass)
+
+
+def execute_gufo_positive_rules_dataclass(ontology_dataclass_list: list[OntologyDataClass],
+                                          ontology_dataclass: OntologyDataClass) -> None:
+    """ Executes once all rules of the group gUFO Positive for a single dataclass.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param ontology_dataclass: Data structure that contains information about the class to be evaluated.
+    :type ontology_dataclass: OntologyDataClass
+    """
 
-        # RP01: NonRigidType(x) -> ~RigidType(x)
-        if "NonRigidType" in ontology_dataclass.is_type:
-            rule_code = "RP01"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-
-        # RP02: RigidType(x) -> ~NonRigidType(x) ^ ~AntiRigidType(x) ^ ~SemiRigidType(x) ^
-        #                       ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x) ^ ~Mixin(x)
-        if "RigidType" in ontology_dataclass.is_type:
-            rule_code = "RP02"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "NonRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SemiRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-
-        # RP03: AntiRigidType(x) -> NonRigidType(x) ^
-        #                           ~SemiRigidType(x) ^ ~Category(x) ^ ~Kind(x) ^ ~SubKind(x) ^ ~Mixin(x)
-        if "AntiRigidType" in ontology_dataclass.is_type:
-            rule_code = "RP03"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SemiRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-
-        # RP04: SemiRigidType(x) -> Mixin(x) ^ NonRigidType(x) ^ ~AntiRigidType(x) ^ ~Category(x) ^
-        #                           ~Kind(x) ^ ~SubKind(x) ^ ~Role(x) ^ ~Phase(x) ^ ~RoleMixin(x) ^ ~PhaseMixin(x)
-        if "SemiRigidType" in ontology_dataclass.is_type:
-            rule_code = "RP04"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-
-        # RP05: NonSortal(x) -> ~Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x)
-        if "NonSortal" in ontology_dataclass.is_type:
-            rule_code = "RP05"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RP06: Sortal(x) -> ~NonSortal(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~Mixin(x)
-        if "Sortal" in ontology_dataclass.is_type:
-            rule_code = "RP06"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-
-        # RP07: Kind(x) -> RigidType(x) ^ Sortal(x) ^ ~Category(x) ^ ~Phase(x) ^ ~Role(x) ^ ~SubKind(x)
-        if "Kind" in ontology_dataclass.is_type:
-            rule_code = "RP07"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RP08: SubKind(x) -> RigidType(x) ^ Sortal(x) ^ ~Category(x) ^ ~Kind(x) ^ ~Phase(x) ^ ~Role(x)
-        if "SubKind" in ontology_dataclass.is_type:
-            rule_code = "RP08"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-
-        # RP09: Role(x) ->   AntiRigidType(x) ^ Sortal(x) ^ ~Kind(x) ^ ~Phase(x) ^
-        #                   ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~SubKind(x)
-        if "Role" in ontology_dataclass.is_type:
-            rule_code = "RP09"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RP10: Phase(x) ->  AntiRigidType(x) ^ Sortal(x) ^ ~Kind(x) ^
-        #                   ~PhaseMixin(x) ^ ~Role(x) ^ ~RoleMixin(x) ^ ~SubKind(x)
-        if "Phase" in ontology_dataclass.is_type:
-            rule_code = "RP10"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "Sortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RP11: Category(x) ->   NonSortal(x) ^ RigidType(x) ^
-        #                       ~Kind(x) ^ ~Mixin(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x) ^ ~SubKind(x)
-        if "Category" in ontology_dataclass.is_type:
-            rule_code = "RP11"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "RigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Kind", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "SubKind", rule_code)
-
-        # RP12: RoleMixin(x) -> AntiRigidType(x) ^ NonSortal(x) ^
-        #                       ~Category(x) ^ ~Mixin(x) ^ ~Phase(x) ^ ~PhaseMixin(x) ^ ~Role(x)
-        if "RoleMixin" in ontology_dataclass.is_type:
-            rule_code = "RP12"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-
-        # RP13: PhaseMixin(x) ->    AntiRigidType(x) ^ NonSortal(x) ^
-        #                           ~Category(x) ^ ~Mixin(x) ^ ~Phase(x) ^ ~Role(x) ^ ~RoleMixin(x)
-        if "PhaseMixin" in ontology_dataclass.is_type:
-            rule_code = "RP13"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Mixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Phase", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
-
-        # RP14: Mixin(x) -> NonSortal(x) ^ SemiRigidType(x) ^ ~Category(x) ^ ~PhaseMixin(x) ^ ~RoleMixin(x)
-        if "Mixin" in ontology_dataclass.is_type:
-            rule_code = "RP14"
-            # LOGGER.debug(f"Executing rule {rule_code} for {ontology_dataclass.uri}.")
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
-            m.move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "SemiRigidType", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Category", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "PhaseMixin", rule_code)
-            m.move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
+    execute_gufo_rules_table(ontology_dataclass_list, ontology_dataclass, GUFO_POSITIVE_RULES)
@@ -0,0 +1,137 @@
+""" Vectorized execution of all rules of the group gUFO for all classes at once.
+
+    The IS and NOT states of all classes are kept as NumPy packed uint16 arrays (one bit per gUFO endurant type, as in
+    the OntologyDataClass' bitmasks) and each gUFO rule is applied to all classes as a single masked array operation.
+    NumPy is an optional dependency, required only when this execution mode is selected.
+"""
+
+# Used this way to avoid circular dependency
+import scior.modules.ontology_dataclassess.dataclass_moving as m
+from scior.modules.logger_config import initialize_logger
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, mask_to_classifications
+from scior.modules.problems_treatment.treat_errors import report_error_requirement_not_met
+from scior.modules.problems_treatment.treat_inconsistent import report_inconsistency_case_moving
+from scior.modules.rules.rule_group_gufo_leaves import GUFO_LEAVES_RULES
+from scior.modules.rules.rule_group_gufo_negative import GUFO_NEGATIVE_RULES
+from scior.modules.rules.rule_group_gufo_positive import GUFO_POSITIVE_RULES
+from scior.modules.rules.rule_gufo_definitions import GufoRule
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LOGGER = initialize_logger()
+
+GUFO_VECTORIZED_RULES = GUFO_POSITIVE_RULES + GUFO_NEGATIVE_RULES + GUFO_LEAVES_RULES
+
+
+def report_vectorized_conflict(ontology_dataclass_list: list[OntologyDataClass], conflicts, conflict_is_mask: int,
+                               conflict_not_mask: int, is_array, not_array, caller: str) -> None:
+    """ Maps the first conflict found in the vectorized execution back to its OntologyDataClass and reports it as an
+    inconsistency when moving classifications.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param conflicts: Boolean array indicating the positions of the classes with conflicts.
+    :param conflict_is_mask: Classifications whose moving to the is_type list are evaluated for conflicts.
+    :type conflict_is_mask: int
+    :param conflict_not_mask: Classifications whose moving to the not_type list are evaluated for conflicts.
+    :type conflict_not_mask: int
+    :param is_array: Array with the IS bitmasks of all classes.
+    :param not_array: Array with the NOT bitmasks of all classes.
+    :param caller: Code of the rule (or name of the operation) in which the conflict was detected.
+    :type caller: str
+    """
+
+    position = int(np.flatnonzero(conflicts)[0])
+    ontology_dataclass = ontology_dataclass_list[position]
+
+    conflicts_to_is = mask_to_classifications(conflict_is_mask & int(not_array[position]))
+
+    if conflicts_to_is:
+        additional_message = f"{caller}: Classification {conflicts_to_is[0]} is in NOT_LIST and " \
+                             f"cannot be moved to IS_TYPE. "
+    else:
+        conflicts_to_not = mask_to_classifications(conflict_not_mask & int(is_array[position]))
+        additional_message = f"{caller}: Classification {conflicts_to_not[0]} is in IS_LIST and " \
+                             f"cannot be moved to NOT_TYPE. "
+
+    report_inconsistency_case_moving(ontology_dataclass, additional_message)
+
+
+def apply_gufo_rule_vectorized(ontology_dataclass_list: list[OntologyDataClass], gufo_rule: GufoRule, is_array,
+                               not_array) -> None:
+    """ Applies a gUFO rule, in place, to the IS and NOT arrays of all classes.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param gufo_rule: gUFO rule to be applied.
+    :type gufo_rule: GufoRule
+    :param is_array: Array with the IS bitmasks of all classes.
+    :param not_array: Array with the NOT bitmasks of all classes.
+    """
+
+    applicable = ((is_array & gufo_rule.is_premises_mask) == gufo_rule.is_premises_mask) & \
+                 ((not_array & gufo_rule.not_premises_mask) == gufo_rule.not_premises_mask)
+
+    if not applicable.any():
+        return
+
+    conflicts = applicable & (((not_array & gufo_rule.is_conclusions_mask) |
+                               (is_array & gufo_rule.not_conclusions_mask)) != 0)
+
+    if conflicts.any():
+        report_vectorized_conflict(ontology_dataclass_list, conflicts, gufo_rule.is_conclusions_mask,
+                                   gufo_rule.not_conclusions_mask, is_array, not_array, gufo_rule.rule_code)
+
+    is_array |= applicable.astype(np.uint16) * np.uint16(gufo_rule.is_conclusions_mask)
+    not_array |= applicable.astype(np.uint16) * np.uint16(gufo_rule.not_conclusions_mask)
+
+
+def execute_gufo_rules_vectorized(ontology_dataclass_list: list[OntologyDataClass]) -> None:
+    """ Executes in loop all rules of the group gUFO for all classes, as whole-array operations, until the IS and NOT
+    arrays stop changing. The resulting states are then moved back into the OntologyDataClasses.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    """
+
+    if np is None:
+        report_error_requirement_not_met("The vectorized gUFO execution mode requires NumPy, which is not installed.")
+
+    number_classes = len(ontology_dataclass_list)
+    is_array = np.fromiter((ontology_dataclass.is_mask for ontology_dataclass in ontology_dataclass_list),
+                           dtype=np.uint16, count=number_classes)
+    not_array = np.fromiter((ontology_dataclass.not_mask for ontology_dataclass in ontology_dataclass_list),
+                            dtype=np.uint16, count=number_classes)
+
+    # Classifications known to be in both lists (e.g., asserted in the input ontology)
+    initial_conflicts = (is_array & not_array) != 0
+    if initial_conflicts.any():
+        report_vectorized_conflict(ontology_dataclass_list, initial_conflicts, int(np.bitwise_or.reduce(is_array)), 0,
+                                   is_array, not_array, "gUFO vectorized")
+
+    initial_is_array = is_array.copy()
+    initial_not_array = not_array.copy()
+
+    modified = True
+    number_iterations = 0
+
+    while modified:
+        previous_is_array = is_array.copy()
+        previous_not_array = not_array.copy()
+
+        for gufo_rule in GUFO_VECTORIZED_RULES:
+            apply_gufo_rule_vectorized(ontology_dataclass_list, gufo_rule, is_array, not_array)
+
+        modified = not (np.array_equal(is_array, previous_is_array) and np.array_equal(not_array, previous_not_array))
+        number_iterations += 1
+
+    LOGGER.debug(f"Vectorized gUFO rules executed for {number_classes} classes in {number_iterations} iterations.")
+
+    changed_positions = np.flatnonzero((is_array != initial_is_array) | (not_array != initial_not_array))
+
+    for position in changed_positions:
+        m.move_classifications_to_closed_state(ontology_dataclass_list, ontology_dataclass_list[position],
+                                               int(is_array[position]), int(not_array[position]), "gUFO vectorized")
@@ -5,12 +5,20 @@ from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
 from scior.modules.ontology_dataclassess.dataclass_moving import move_classification_to_is_type, \
     move_classification_to_not_type
-from scior.modules.utils_dataclass import get_dataclass_by_uri
+from scior.modules.rules.rule_delta_definitions import RulesDelta, select_rows_touching_delta, \
+    query_rows_touching_delta
+from scior.modules.rules.rule_native_queries import query_typed_subclasses, query_typed_superclasses
+from scior.modules.rules.rule_prepared_queries import execute_rule_query
+from scior.modules.rules.rule_scheduler_definitions import RuleDeclaration
+from scior.modules.taxonomy_index import TaxonomyIndex
+from scior.modules.utils_dataclass import get_dataclass_by_id
 
 LOGGER = initialize_logger()
 
 
-def run_ra01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA01 from group UFO All.
 
     Definition: Sortal(x) ^ subClassOf(y,x) -> Sortal(y)
@@ -20,6 +28,10 @@ def run_ra01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA01"
@@ -28,22 +40,28 @@ def run_ra01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
         PREFIX gufo: <http://purl.org/nemo/gufo#>
-        SELECT DISTINCT ?class_y
+        SELECT DISTINCT ?class_x ?class_y
         WHERE {
             ?class_x rdf:type gufo:Sortal .
             ?class_y rdfs:subClassOf ?class_x .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_subclasses, taxonomy_index, "Sortal")
 
     for row in query_result:
-        new_sortal = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        new_sortal = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_is_type(ontology_dataclass_list, new_sortal, "Sortal", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def run_ra02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA02 from group UFO All.
 
     Definition: RigidType(x) ^ subClassOf(x,y) -> ~AntiRigidType(y)
@@ -53,6 +71,10 @@ def run_ra02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA02"
@@ -61,22 +83,28 @@ def run_ra02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
     PREFIX gufo: <http://purl.org/nemo/gufo#>
-    SELECT DISTINCT ?class_y
+    SELECT DISTINCT ?class_x ?class_y
     WHERE {
         ?class_x rdf:type gufo:RigidType .
         ?class_x rdfs:subClassOf ?class_y .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_superclasses, taxonomy_index, "RigidType")
 
     for row in query_result:
-        ontology_dataclass = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        ontology_dataclass = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def run_ra03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA03 from group UFO All.
 
     Definition: SemiRigidType(x) ^ subClassOf(x,y) -> ~AntiRigidType(y)
@@ -86,6 +114,10 @@ def run_ra03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA03"
@@ -94,22 +126,28 @@ def run_ra03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
     PREFIX gufo: <http://purl.org/nemo/gufo#>
-    SELECT DISTINCT ?class_y
+    SELECT DISTINCT ?class_x ?class_y
     WHERE {
         ?class_x rdf:type gufo:SemiRigidType .
         ?class_x rdfs:subClassOf ?class_y .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_superclasses, taxonomy_index, "SemiRigidType")
 
     for row in query_result:
-        ontology_dataclass = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        ontology_dataclass = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "AntiRigidType", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def run_ra04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA04 from group UFO All.
 
     Definition: x != y ^ Kind(x) ^ subClassOf(x,y) -> NonSortal(y)
@@ -119,6 +157,10 @@ def run_ra04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA04"
@@ -134,16 +176,23 @@ def run_ra04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
         FILTER (?class_x != ?class_y)
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_superclasses, taxonomy_index, "Kind",
+                                                 include_itself=False)
 
     for row in query_result:
-        dataclass_y = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        dataclass_y = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_is_type(ontology_dataclass_list, dataclass_y, "NonSortal", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def run_ra05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA05 from group UFO All.
 
     Definition: NonSortal(x) ^ subClassOf(x,y) -> NonSortal(y)
@@ -153,6 +202,10 @@ def run_ra05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA05"
@@ -161,22 +214,28 @@ def run_ra05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
     PREFIX gufo: <http://purl.org/nemo/gufo#>
-    SELECT DISTINCT ?class_y
+    SELECT DISTINCT ?class_x ?class_y
     WHERE {
         ?class_x rdf:type gufo:NonSortal .
         ?class_x rdfs:subClassOf ?class_y .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_superclasses, taxonomy_index, "NonSortal")
 
     for row in query_result:
-        ontology_dataclass = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        ontology_dataclass = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_is_type(ontology_dataclass_list, ontology_dataclass, "NonSortal", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def run_ra06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA06 from group UFO All.
 
     Definition: Phase(x) ^ subClassOf(x,y) -> ~Role(y) ^ ~RoleMixin(y)
@@ -186,6 +245,10 @@ def run_ra06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA06"
@@ -194,23 +257,29 @@ def run_ra06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
     PREFIX gufo: <http://purl.org/nemo/gufo#>
-    SELECT DISTINCT ?class_y
+    SELECT DISTINCT ?class_x ?class_y
     WHERE {
         ?class_x rdf:type gufo:Phase .
         ?class_x rdfs:subClassOf ?class_y .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_superclasses, taxonomy_index, "Phase")
 
     for row in query_result:
-        ontology_dataclass = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        ontology_dataclass = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "Role", rule_code)
         move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def run_ra07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+def run_ra07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+             rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """ Executes rule RA07 from group UFO All.
 
     Definition: PhaseMixin(x) ^ subClassOf(x,y) -> ~RoleMixin(y)
@@ -220,6 +289,10 @@ def run_ra07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     rule_code = "RA07"
@@ -228,38 +301,70 @@ def run_ra07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     query_string = """
     PREFIX gufo: <http://purl.org/nemo/gufo#>
-    SELECT DISTINCT ?class_y
+    SELECT DISTINCT ?class_x ?class_y
     WHERE {
         ?class_x rdf:type gufo:PhaseMixin .
         ?class_x rdfs:subClassOf ?class_y .
     } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_rows_touching_delta(query_result, rules_delta)
+    else:
+        query_result = query_rows_touching_delta(rules_delta, query_typed_superclasses, taxonomy_index, "PhaseMixin")
 
     for row in query_result:
-        ontology_dataclass = get_dataclass_by_uri(ontology_dataclass_list, row.class_y.toPython())
+        ontology_dataclass = get_dataclass_by_id(ontology_dataclass_list, row.class_y)
         move_classification_to_not_type(ontology_dataclass_list, ontology_dataclass, "RoleMixin", rule_code)
 
     LOGGER.debug(f"Rule {rule_code} concluded")
 
 
-def execute_rules_ufo_all(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> None:
+# Declaration of the rules of the group UFO All and of their read and write sets, used by the rules scheduler.
+UFO_ALL_RULES = [
+    RuleDeclaration("RA01", "rule_group_ufo_all", run_ra01, reads=["Sortal", "rdfs:subClassOf"], writes=["Sortal"]),
+    RuleDeclaration("RA02", "rule_group_ufo_all", run_ra02,
+                    reads=["RigidType", "rdfs:subClassOf"],
+                    writes=["AntiRigidType"]),
+    RuleDeclaration("RA03", "rule_group_ufo_all", run_ra03,
+                    reads=["SemiRigidType", "rdfs:subClassOf"],
+                    writes=["AntiRigidType"]),
+    RuleDeclaration("RA04", "rule_group_ufo_all", run_ra04, reads=["Kind", "rdfs:subClassOf"], writes=["NonSortal"]),
+    RuleDeclaration("RA05", "rule_group_ufo_all", run_ra05,
+                    reads=["NonSortal", "rdfs:subClassOf"],
+                    writes=["NonSortal"]),
+    RuleDeclaration("RA06", "rule_group_ufo_all", run_ra06,
+                    reads=["Phase", "rdfs:subClassOf"],
+                    writes=["Role", "RoleMixin"]),
+    RuleDeclaration("RA07", "rule_group_ufo_all", run_ra07,
+                    reads=["PhaseMixin", "rdfs:subClassOf"],
+                    writes=["RoleMixin"]),
+]
+
+
+def execute_rules_ufo_all(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
+                          rules_delta: RulesDelta | None = None,
+                          taxonomy_index: TaxonomyIndex | None = None) -> None:
     """Call the execution of all rules from the group UFO All.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
     :type ontology_graph: Graph
+    :param rules_delta: Classes changed since the group's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     LOGGER.debug("Starting execution of all rules from group UFO All.")
 
-    run_ra01(ontology_dataclass_list, ontology_graph)
-    run_ra02(ontology_dataclass_list, ontology_graph)
-    run_ra03(ontology_dataclass_list, ontology_graph)
-    run_ra04(ontology_dataclass_list, ontology_graph)
-    run_ra05(ontology_dataclass_list, ontology_graph)
-    run_ra06(ontology_dataclass_list, ontology_graph)
-    run_ra07(ontology_dataclass_list, ontology_graph)
+    run_ra01(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_ra02(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_ra03(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_ra04(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_ra05(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_ra06(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+    run_ra07(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
 
     LOGGER.debug("Execution of all rules from group UFO All completed.")
@@ -11,24 +11,34 @@ from scior.modules.ontology_dataclassess.dataclass_moving import move_classifica
 from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
 from scior.modules.problems_treatment.treat_incomplete import IncompletenessEntry, register_incompleteness
 from scior.modules.problems_treatment.treat_inconsistent import report_inconsistency_case_in_rule
-from scior.modules.utils_dataclass import get_dataclass_by_uri
+from scior.modules.resources_gufo import SCIOR_NAMESPACE
+from scior.modules.rules.rule_delta_definitions import RulesDelta, select_groups_touching_delta, \
+    query_groups_touching_delta
+from scior.modules.rules.rule_native_queries import query_intermediate_superclasses, query_typed_subclasses, \
+    query_related_classes, query_related_class_pairs, query_share_kind, query_typed_superclasses, \
+    query_sibling_subclasses
+from scior.modules.rules.rule_prepared_queries import execute_rule_query
+from scior.modules.rules.rule_scheduler_definitions import CandidateSets, RuleDeclaration
+from scior.modules.taxonomy_index import TaxonomyIndex, get_taxonomy_relations
+from scior.modules.utils_dataclass import get_dataclass_by_id
 
 LOGGER = initialize_logger()
 
 
 def treat_result_ufo_some(ontology_dataclass_list: list[OntologyDataClass], evaluated_dataclass: OntologyDataClass,
-                          can_classes_list: list[str], is_classes_list: list[str], types_to_set_list: list[str],
+                          can_classes_list: list[int], is_classes_list: list[int], types_to_set_list: list[str],
                           rule_code: str, incompleteness_stack: list[IncompletenessEntry]) -> None:
-    """ Treats the results from all rules from the group UFO Some.
+    """ Treats the results from all rules from the group UFO Some. Classes are received as their URIs' ids and are
+        only converted into URIs in the reported messages.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param evaluated_dataclass:
     :type evaluated_dataclass: OntologyDataClass
     :param can_classes_list: List of candidate classes to solve the rule.
-    :type can_classes_list: list[str]
+    :type can_classes_list: list[int]
     :param is_classes_list: List classes that already solve the rule.
-    :type is_classes_list: list[str]
+    :type is_classes_list: list[int]
     :param types_to_set_list: gUFO types that must be set to the candidates to solve the rule.
     :type types_to_set_list: list[str]
     :param rule_code: Code of the rule being handled.
@@ -42,8 +52,10 @@ def treat_result_ufo_some(ontology_dataclass_list: list[OntologyDataClass], eval
     length_is_list = len(is_classes_list)
     length_can_list = len(can_classes_list)
 
-    is_classes_list.sort()
-    can_classes_list.sort()
+    # Sorting by the classes' URIs
+    uri_table = ontology_dataclass_list.uri_table
+    is_classes_list.sort(key=uri_table.get_uri)
+    can_classes_list.sort(key=uri_table.get_uri)
 
     if length_is_list > 0:
         LOGGER.debug(f"Rule {rule_code} satisfied for {evaluated_dataclass.uri}. No action is required.")
@@ -51,7 +63,8 @@ def treat_result_ufo_some(ontology_dataclass_list: list[OntologyDataClass], eval
     # IS = 0 AND CAN > 1
     elif length_can_list > 1:
         # Incompleteness found. Reporting problems_treatment and possibilities (OR).
-        additional_message = f"Solution: set one or more classes from {can_classes_list} as {types_to_set_list}."
+        additional_message = f"Solution: set one or more classes from {uri_table.get_uris(can_classes_list)} as " \
+                             f"{types_to_set_list}."
         register_incompleteness(incompleteness_stack, rule_code, evaluated_dataclass, additional_message)
 
     # IS = 0 AND CAN = 1
@@ -59,12 +72,12 @@ def treat_result_ufo_some(ontology_dataclass_list: list[OntologyDataClass], eval
 
         if args.ARGUMENTS["is_owa"]:
             # Incompleteness found. Reporting problems_treatment and single possibility.
-            additional_message = f"Solution: set class {can_classes_list[0]} as {types_to_set_list}."
+            additional_message = f"Solution: set class {uri_table.get_uri(can_classes_list[0])} as {types_to_set_list}."
             register_incompleteness(incompleteness_stack, rule_code, evaluated_dataclass, additional_message)
 
         elif args.ARGUMENTS["is_owaf"] or args.ARGUMENTS["is_cwa"]:
             # Set single candidate as desired types.
-            candidate_dataclass = get_dataclass_by_uri(ontology_dataclass_list, can_classes_list[0])
+            candidate_dataclass = get_dataclass_by_id(ontology_dataclass_list, can_classes_list[0])
             move_classifications_list_to_is_type(ontology_dataclass_list, candidate_dataclass, types_to_set_list,
                                                  rule_code)
         else:
@@ -88,7 +101,8 @@ def treat_result_ufo_some(ontology_dataclass_list: list[OntologyDataClass], eval
 
 
 def run_rs01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS01 from group UFO.
 
     Definition: AntiRigidType(x) ^ Sortal(x) ^ Category(y) ^ subClassOf(x,y) ->
@@ -101,6 +115,12 @@ def run_rs01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS01"
@@ -119,23 +139,29 @@ def run_rs01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_z rdfs:subClassOf ?class_y .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_y", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_y", query_intermediate_superclasses,
+                                                   taxonomy_index, ["AntiRigidType", "Sortal"], ["Category"])
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_y.toPython()
+        evaluated_class = row.class_y
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_z.toPython()
+        selected_class = row.class_z
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "RigidType" in selected_dataclass.is_type and "Sortal" in selected_dataclass.is_type:
@@ -147,7 +173,11 @@ def run_rs01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     # Treat after collecting all necessary information
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["RigidType", "Sortal"], rule_code, incompleteness_stack)
 
@@ -155,7 +185,8 @@ def run_rs01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS02 from group UFO Some.
 
     Definition: Mixin(x) -> E y (subClassOf(y,x) ^ AntiRigidType(y))
@@ -167,6 +198,12 @@ def run_rs02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS02"
@@ -181,23 +218,30 @@ def run_rs02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_y rdfs:subClassOf ?class_x .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        # Mixins with a subclass that IS an AntiRigidType already satisfy the rule and are not evaluated
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_typed_subclasses, taxonomy_index,
+                                                   "Mixin", satisfying_type="AntiRigidType")
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_x.toPython()
+        evaluated_class = row.class_x
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_y.toPython()
+        selected_class = row.class_y
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "AntiRigidType" in selected_dataclass.is_type:
@@ -209,7 +253,11 @@ def run_rs02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     # Treat after collecting all necessary information
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["AntiRigidType"], rule_code, incompleteness_stack)
 
@@ -217,7 +265,8 @@ def run_rs02(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS03 from group UFO Some.
 
     Definition: Mixin(x) -> E y (subClassOf(y,x) ^ RigidType(y))
@@ -229,6 +278,12 @@ def run_rs03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS03"
@@ -243,23 +298,30 @@ def run_rs03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_y rdfs:subClassOf ?class_x .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        # Mixins with a subclass that IS a RigidType already satisfy the rule and are not evaluated
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_typed_subclasses, taxonomy_index,
+                                                   "Mixin", satisfying_type="RigidType")
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_x.toPython()
+        evaluated_class = row.class_x
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_y.toPython()
+        selected_class = row.class_y
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "RigidType" in selected_dataclass.is_type:
@@ -271,7 +333,11 @@ def run_rs03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
     # Treat after collecting all necessary information
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["RigidType"], rule_code, incompleteness_stack)
 
@@ -279,7 +345,8 @@ def run_rs03(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS04 from group UFO Some.
 
     Definition: NonSortal(x) -> E y (Sortal(y) ^ (subClassOf(y,x) v shareSuperClass(x,y)))
@@ -292,6 +359,12 @@ def run_rs04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS04"
@@ -307,23 +380,29 @@ def run_rs04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_y rdfs:subClassOf|scior:shareSuperClass ?class_x .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_related_classes, taxonomy_index,
+                                                   "NonSortal")
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_x.toPython()
+        evaluated_class = row.class_x
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_y.toPython()
+        selected_class = row.class_y
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "Sortal" in selected_dataclass.is_type:
@@ -334,7 +413,11 @@ def run_rs04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             can_dictionary[evaluated_class].append(selected_class)
 
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["Sortal"], rule_code, incompleteness_stack)
 
@@ -342,7 +425,8 @@ def run_rs04(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS05 from group UFO Some.
 
     Definition: NonSortal(x) ^ Sortal(y) ^ (subClassOf(y,x) v shareSuperClass(x,y)) ->
@@ -356,6 +440,12 @@ def run_rs05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS05"
@@ -372,26 +462,41 @@ def run_rs05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_y rdfs:subClassOf|scior:shareSuperClass ?class_x .
             ?class_z rdfs:subClassOf|scior:shareSuperClass ?class_x .
             FILTER (?class_y != ?class_z) .
-            FILTER (NOT EXISTS {?class_y scior:shareKind ?class_z}) .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_related_class_pairs, taxonomy_index,
+                                                   "NonSortal", "Sortal")
+
+    # Relations are verified in the taxonomy index, if used, or in the ontology graph
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+
     is_dictionary = {}
     can_dictionary = {}
 
+    scior_share_kind = URIRef(SCIOR_NAMESPACE + "shareKind")
+
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_x.toPython()
+        evaluated_class = row.class_x
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_z.toPython()
+        selected_class = row.class_z
+
+        # Classes y and z must not share the same Kind. Verified here (and not in the query) so that new shareKind
+        # relations are perceived by the delta-driven execution as changes in the rows of the evaluated class.
+        if (row.class_y, scior_share_kind, row.class_z) in taxonomy_relations:
+            continue
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "Sortal" in selected_dataclass.is_type:
@@ -402,7 +507,11 @@ def run_rs05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             can_dictionary[evaluated_class].append(selected_class)
 
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["Sortal"], rule_code, incompleteness_stack)
 
@@ -410,7 +519,8 @@ def run_rs05(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS06 from group UFO Some.
 
     Definition: Role(x) ^ PhaseMixin(y) ^ subClassOf(x,y) -> E z (Phase(z) ^ subClassOf(x,z) ^ subClassOf(z,y))
@@ -422,6 +532,12 @@ def run_rs06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS06"
@@ -439,23 +555,29 @@ def run_rs06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_z rdfs:subClassOf ?class_y .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_y", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_y", query_intermediate_superclasses,
+                                                   taxonomy_index, ["Role"], ["PhaseMixin"])
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_y.toPython()
+        evaluated_class = row.class_y
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_z.toPython()
+        selected_class = row.class_z
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "Phase" in selected_dataclass.is_type:
@@ -466,7 +588,11 @@ def run_rs06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             can_dictionary[evaluated_class].append(selected_class)
 
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["Phase"], rule_code, incompleteness_stack)
 
@@ -474,7 +600,8 @@ def run_rs06(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS07 from group UFO Some.
 
     Definition: Phase(x) -> E y (Phase (y) ^ shareKind(x,y) ^ ~isSubClassOf(x,y) ^ ~isSubClassOf(y,x))
@@ -486,6 +613,12 @@ def run_rs07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS07"
@@ -502,32 +635,41 @@ def run_rs07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
                 FILTER (?class_x != ?class_y)
             } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_share_kind, taxonomy_index, "Phase",
+                                                   include_itself=False)
+
+    # Relations are verified in the taxonomy index, if used, or in the ontology graph
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_x.toPython()
+        evaluated_class = row.class_x
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_y.toPython()
+        selected_class = row.class_y
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # x must not specialize y
-        if (URIRef(evaluated_class), RDFS.subClassOf, URIRef(selected_class)) in ontology_graph:
+        if (evaluated_class, RDFS.subClassOf, selected_class) in taxonomy_relations:
             is_subclass = True
         else:
             is_subclass = False
 
         # y must not specialize x
-        if (URIRef(selected_class), RDFS.subClassOf, URIRef(evaluated_class)) in ontology_graph:
+        if (selected_class, RDFS.subClassOf, evaluated_class) in taxonomy_relations:
             is_superclass = True
         else:
             is_superclass = False
@@ -536,14 +678,18 @@ def run_rs07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
             # Creating IS List
             if "Phase" in selected_dataclass.is_type:
-                is_dictionary[evaluated_class].append(selected_dataclass.uri)
+                is_dictionary[evaluated_class].append(selected_dataclass.uri_id)
 
             # Creating CAN List
             elif "Phase" in selected_dataclass.can_type:
-                can_dictionary[evaluated_class].append(selected_dataclass.uri)
+                can_dictionary[evaluated_class].append(selected_dataclass.uri_id)
 
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["Phase"], rule_code, incompleteness_stack)
 
@@ -551,7 +697,8 @@ def run_rs07(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS08 from group UFO Some.
 
     Definition: PhaseMixin(x) -> E y (Category (y) ^ isSubClassOf(x,y))
@@ -563,6 +710,12 @@ def run_rs08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS08"
@@ -577,23 +730,30 @@ def run_rs08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             ?class_x rdfs:subClassOf ?class_y .
         } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_x", rules_delta)
+    else:
+        # PhaseMixins with a superclass that IS a Category already satisfy the rule and are not evaluated
+        query_result = query_groups_touching_delta(rules_delta, "class_x", query_typed_superclasses, taxonomy_index,
+                                                   "PhaseMixin", satisfying_type="Category")
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_x.toPython()
+        evaluated_class = row.class_x
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_y.toPython()
+        selected_class = row.class_y
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Creating IS List
         if "Category" in selected_dataclass.is_type:
@@ -604,7 +764,11 @@ def run_rs08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
             can_dictionary[evaluated_class].append(selected_class)
 
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["Category"], rule_code, incompleteness_stack)
 
@@ -612,7 +776,8 @@ def run_rs08(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
 
 
 def run_rs09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RS09 from group UFO Some.
 
     Definition: PhaseMixin(x) ^ Category(y) ^ subClassOf(x,y) ->
@@ -626,6 +791,12 @@ def run_rs09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the rule's previous treatments. If None, all results are treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RS09"
@@ -642,34 +813,43 @@ def run_rs09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
                 ?class_z rdfs:subClassOf ?class_y .
             } """
 
-    query_result = ontology_graph.query(query_string)
+    if taxonomy_index is None:
+        query_result = execute_rule_query(rule_code, query_string, ontology_graph, ontology_dataclass_list.uri_table)
+        query_result = select_groups_touching_delta(query_result, "class_y", rules_delta)
+    else:
+        query_result = query_groups_touching_delta(rules_delta, "class_y", query_sibling_subclasses, taxonomy_index,
+                                                   "PhaseMixin", "Category")
+
+    # Relations are verified in the taxonomy index, if used, or in the ontology graph
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+
     is_dictionary = {}
     can_dictionary = {}
 
     for row in query_result:
 
         # Class to be completed or that may be incomplete
-        evaluated_class = row.class_y.toPython()
+        evaluated_class = row.class_y
         # Class that may be used to complete the evaluated_dataclass
-        selected_class = row.class_z.toPython()
+        selected_class = row.class_z
         # Class to be used during the analysis
-        related_class = row.class_x.toPython()
+        related_class = row.class_x
 
         # If evaluated_class not in dictionary yet, create it
         if evaluated_class not in is_dictionary.keys():
             is_dictionary[evaluated_class] = []
             can_dictionary[evaluated_class] = []
 
-        selected_dataclass = get_dataclass_by_uri(ontology_dataclass_list, selected_class)
+        selected_dataclass = get_dataclass_by_id(ontology_dataclass_list, selected_class)
 
         # Class z must not be subclass of class x
-        if (URIRef(selected_class), RDFS.subClassOf, URIRef(related_class)) in ontology_graph:
+        if (selected_class, RDFS.subClassOf, related_class) in taxonomy_relations:
             is_subclass = True
         else:
             is_subclass = False
 
         # Class x must not be subclass of class z
-        if (URIRef(related_class), RDFS.subClassOf, URIRef(selected_class)) in ontology_graph:
+        if (related_class, RDFS.subClassOf, selected_class) in taxonomy_relations:
             is_superclass = True
         else:
             is_superclass = False
@@ -686,15 +866,53 @@ def run_rs09(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
                 can_dictionary[evaluated_class].append(selected_class)
 
     for evaluated in is_dictionary.keys():
-        evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
+        # Results whose candidate sets did not change since their previous treatment are not treated again
+        if candidate_sets is not None and \
+                not candidate_sets.register_if_changed(evaluated, is_dictionary[evaluated], can_dictionary[evaluated]):
+            continue
+        evaluated_dataclass = get_dataclass_by_id(ontology_dataclass_list, evaluated)
         treat_result_ufo_some(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
                               is_dictionary[evaluated], ["PhaseMixin"], rule_code, incompleteness_stack)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
+# Declaration of the rules of the group UFO Some and of their read and write sets, used by the rules scheduler.
+UFO_SOME_RULES = [
+    RuleDeclaration("RS01", "rule_group_ufo_some", run_rs01,
+                    reads=["AntiRigidType", "Category", "RigidType", "Sortal", "rdfs:subClassOf"],
+                    writes=["RigidType", "Sortal"]),
+    RuleDeclaration("RS02", "rule_group_ufo_some", run_rs02,
+                    reads=["AntiRigidType", "Mixin", "rdfs:subClassOf"],
+                    writes=["AntiRigidType"]),
+    RuleDeclaration("RS03", "rule_group_ufo_some", run_rs03,
+                    reads=["Mixin", "RigidType", "rdfs:subClassOf"],
+                    writes=["RigidType"]),
+    RuleDeclaration("RS04", "rule_group_ufo_some", run_rs04,
+                    reads=["NonSortal", "Sortal", "rdfs:subClassOf", "scior:shareSuperClass"],
+                    writes=["Sortal"]),
+    RuleDeclaration("RS05", "rule_group_ufo_some", run_rs05,
+                    reads=["NonSortal", "Sortal", "rdfs:subClassOf", "scior:shareKind", "scior:shareSuperClass"],
+                    writes=["Sortal"]),
+    RuleDeclaration("RS06", "rule_group_ufo_some", run_rs06,
+                    reads=["Phase", "PhaseMixin", "Role", "rdfs:subClassOf"],
+                    writes=["Phase"]),
+    RuleDeclaration("RS07", "rule_group_ufo_some", run_rs07,
+                    reads=["Phase", "rdfs:subClassOf", "scior:shareKind"],
+                    writes=["Phase"]),
+    RuleDeclaration("RS08", "rule_group_ufo_some", run_rs08,
+                    reads=["Category", "PhaseMixin", "rdfs:subClassOf"],
+                    writes=["Category"]),
+    RuleDeclaration("RS09", "rule_group_ufo_some", run_rs09,
+                    reads=["Category", "PhaseMixin", "rdfs:subClassOf"],
+                    writes=["PhaseMixin"]),
+]
+
+
 def execute_rules_ufo_some(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-                           incompleteness_stack: list[IncompletenessEntry]) -> None:
+                           incompleteness_stack: list[IncompletenessEntry],
+                           rules_delta: RulesDelta | None = None,
+                           taxonomy_index: TaxonomyIndex | None = None) -> None:
     """Call execution all rules from the group UFO Some.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
@@ -703,18 +921,22 @@ def execute_rules_ufo_some(ontology_dataclass_list: list[OntologyDataClass], ont
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the group's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     LOGGER.debug("Starting execution of all rules from group UFO Some.")
 
-    run_rs01(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs02(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs03(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs04(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs05(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs06(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs07(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs08(ontology_dataclass_list, ontology_graph, incompleteness_stack)
-    run_rs09(ontology_dataclass_list, ontology_graph, incompleteness_stack)
+    run_rs01(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs02(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs03(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs04(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs05(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs06(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs07(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs08(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
+    run_rs09(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
 
     LOGGER.debug("Execution of all rules from group UFO Some completed.")
@@ -1,7 +1,7 @@
 """ Implementation of rules from the group UFO Unique. """
 import inspect
 
-from rdflib import RDFS, URIRef, Graph
+from rdflib import Graph
 
 import scior.modules.initialization_arguments as args
 from scior.modules.logger_config import initialize_logger
@@ -11,24 +11,29 @@ from scior.modules.ontology_dataclassess.dataclass_moving import move_classifica
 from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
 from scior.modules.problems_treatment.treat_incomplete import IncompletenessEntry, register_incompleteness
 from scior.modules.problems_treatment.treat_inconsistent import report_inconsistency_case_in_rule
-from scior.modules.utils_dataclass import get_dataclass_by_uri
+from scior.modules.rules.rule_delta_definitions import RulesDelta, select_dataclasses_touching_delta
+from scior.modules.rules.rule_scheduler_definitions import CandidateSets, RuleDeclaration
+from scior.modules.taxonomy_index import TaxonomyIndex, get_taxonomy_relations
+from scior.modules.type_aggregates import ANCESTORS
+from scior.modules.utils_dataclass import get_dataclass_by_id
 
 LOGGER = initialize_logger()
 
 
 def treat_result_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], evaluated_dataclass: OntologyDataClass,
-                            can_classes_list: list[str], is_classes_list: list[str], types_to_set_list: list[str],
+                            can_classes_list: list[int], is_classes_list: list[int], types_to_set_list: list[str],
                             rule_code: str, incompleteness_stack: list[IncompletenessEntry]) -> None:
-    """ Treats the results from all rules from the group UFO Unique.
+    """ Treats the results from all rules from the group UFO Unique. Classes are received as their URIs' ids and are
+        only converted into URIs in the reported messages.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     :param evaluated_dataclass:
     :type evaluated_dataclass: OntologyDataClass
     :param can_classes_list: List of candidate classes to solve the rule.
-    :type can_classes_list: list[str]
+    :type can_classes_list: list[int]
     :param is_classes_list: List classes that already solve the rule.
-    :type is_classes_list: list[str]
+    :type is_classes_list: list[int]
     :param types_to_set_list: gUFO types that must be set to the candidates to solve the rule.
     :type types_to_set_list: list[str]
     :param rule_code: Code of the rule being handled.
@@ -41,12 +46,15 @@ def treat_result_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], ev
 
     length_is_list = len(is_classes_list)
     length_can_list = len(can_classes_list)
-    can_classes_list.sort()
-    is_classes_list.sort()
+    # Sorting by the classes' URIs
+    uri_table = ontology_dataclass_list.uri_table
+    can_classes_list.sort(key=uri_table.get_uri)
+    is_classes_list.sort(key=uri_table.get_uri)
 
     if length_is_list > 1:
         # report inconsistency
-        additional_message = f"A unique class was expected, but {length_is_list} were found ({is_classes_list})."
+        additional_message = f"A unique class was expected, but {length_is_list} were found " \
+                             f"({uri_table.get_uris(is_classes_list)})."
         report_inconsistency_case_in_rule(rule_code, evaluated_dataclass, additional_message)
 
     # IS = 1 AND CAN = 0
@@ -58,14 +66,15 @@ def treat_result_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], ev
 
         # Set all classes in can list as not type.
         for can_class in can_classes_list:
-            candidate_dataclass = get_dataclass_by_uri(ontology_dataclass_list, can_class)
+            candidate_dataclass = get_dataclass_by_id(ontology_dataclass_list, can_class)
             move_classifications_list_to_not_type(ontology_dataclass_list, candidate_dataclass, types_to_set_list,
                                                   rule_code)
 
     # IS = 0 AND CAN > 1
     elif length_is_list == 0 and length_can_list > 1:
         # Incompleteness found. Reporting problems_treatment and possibilities (XOR).
-        additional_message = f"Solution: set exactly one class from {can_classes_list} as {types_to_set_list}."
+        additional_message = f"Solution: set exactly one class from {uri_table.get_uris(can_classes_list)} as " \
+                             f"{types_to_set_list}."
         register_incompleteness(incompleteness_stack, rule_code, evaluated_dataclass, additional_message)
 
     # IS = 0 AND CAN = 1
@@ -73,12 +82,12 @@ def treat_result_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], ev
 
         if args.ARGUMENTS["is_owa"]:
             # Incompleteness found. Reporting problems_treatment and single possibility.
-            additional_message = f"Solution: set class {can_classes_list[0]} as {types_to_set_list}."
+            additional_message = f"Solution: set class {uri_table.get_uri(can_classes_list[0])} as {types_to_set_list}."
             register_incompleteness(incompleteness_stack, rule_code, evaluated_dataclass, additional_message)
 
         elif args.ARGUMENTS["is_owaf"] or args.ARGUMENTS["is_cwa"]:
             # Set single candidate as desired types.
-            candidate_dataclass = get_dataclass_by_uri(ontology_dataclass_list, can_classes_list[0])
+            candidate_dataclass = get_dataclass_by_id(ontology_dataclass_list, can_classes_list[0])
             move_classifications_list_to_is_type(ontology_dataclass_list, candidate_dataclass, types_to_set_list,
                                                  rule_code)
         else:
@@ -102,7 +111,8 @@ def treat_result_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], ev
 
 
 def run_ru01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-             incompleteness_stack: list[IncompletenessEntry]) -> None:
+             incompleteness_stack: list[IncompletenessEntry], rules_delta: RulesDelta | None = None,
+             taxonomy_index: TaxonomyIndex | None = None, candidate_sets: CandidateSets | None = None) -> None:
     """ Executes rule RU01 from group UFO.
 
     Definition: Sortal(x) -> E! y (subClassOf (x,y) ^ Kind(y))
@@ -114,51 +124,76 @@ def run_ru01(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: G
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the rule's previous execution. If None, all classes are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
+    :param candidate_sets: Candidate sets of the previous treatments of the rule's results. If None, all results are
+                           treated.
+    :type candidate_sets: CandidateSets | None
     """
 
     rule_code = "RU01"
 
     LOGGER.debug(f"Starting rule {rule_code}")
 
-    is_dictionary = {}
-    can_dictionary = {}
+    # Superclasses are obtained from the taxonomy index, if used, or from the ontology graph
+    taxonomy_relations = get_taxonomy_relations(ontology_graph, ontology_dataclass_list.uri_table, taxonomy_index)
+    # Numbers of superclasses that are and can be a Kind, kept by the taxonomy index's type aggregates
+    type_aggregates = None if taxonomy_index is None else taxonomy_index.type_aggregates
 
-    for ontology_dataclass in ontology_dataclass_list:
+    for ontology_dataclass in select_dataclasses_touching_delta(ontology_dataclass_list, rules_delta):
 
         # For every Sortal
-        if "Sortal" in ontology_dataclass.is_type:
-
-            # Class to be completed or that may be incomplete
-            evaluated_class = ontology_dataclass.uri
-
-            # If dataclass not in dictionary yet, create it
-            if evaluated_class not in is_dictionary.keys():
-                is_dictionary[evaluated_class] = []
-                can_dictionary[evaluated_class] = []
-
-            # Collecting all superclasses
-            for superclass in ontology_graph.objects(URIRef(evaluated_class), RDFS.subClassOf):
-                superclass_dataclass = get_dataclass_by_uri(ontology_dataclass_list, superclass.toPython())
-
-                # if IS Kind, add to is dictionary
-                if "Kind" in superclass_dataclass.is_type:
-                    is_dictionary[evaluated_class].append(superclass_dataclass.uri)
-                # if CAN BE Kind, add to can dictionary (else, do nothing)
-                elif "Kind" in superclass_dataclass.can_type:
-                    can_dictionary[evaluated_class].append(superclass_dataclass.uri)
-                # if CANNOT BE Kind, evaluate the next superclass
-
-        # Treat after collecting all necessary information
-        for evaluated in is_dictionary.keys():
-            evaluated_dataclass = get_dataclass_by_uri(ontology_dataclass_list, evaluated)
-            treat_result_ufo_unique(ontology_dataclass_list, evaluated_dataclass, can_dictionary[evaluated],
-                                    is_dictionary[evaluated], ["Kind"], rule_code, incompleteness_stack)
+        if "Sortal" not in ontology_dataclass.is_type:
+            continue
+
+        # Class to be completed or that may be incomplete
+        evaluated_class = ontology_dataclass.uri_id
+
+        # A Sortal with a single superclass that IS a Kind and none that CAN BE a Kind satisfies the rule
+        if type_aggregates is not None:
+            is_count, can_count, _ = type_aggregates.get_counts(evaluated_class, ANCESTORS, "Kind")
+            if is_count == 1 and can_count == 0:
+                continue
+
+        is_classes_list = []
+        can_classes_list = []
+
+        # Collecting all superclasses
+        for superclass in taxonomy_relations.get_superclass_ids(evaluated_class):
+            superclass_dataclass = get_dataclass_by_id(ontology_dataclass_list, superclass)
+
+            # if IS Kind, add to is list
+            if "Kind" in superclass_dataclass.is_type:
+                is_classes_list.append(superclass)
+            # if CAN BE Kind, add to can list (else, do nothing)
+            elif "Kind" in superclass_dataclass.can_type:
+                can_classes_list.append(superclass)
+            # if CANNOT BE Kind, evaluate the next superclass
+
+        # Treat after collecting all necessary information, unless the candidate sets did not change since the
+        # class' previous treatment
+        if candidate_sets is None or \
+                candidate_sets.register_if_changed(evaluated_class, is_classes_list, can_classes_list):
+            treat_result_ufo_unique(ontology_dataclass_list, ontology_dataclass, can_classes_list, is_classes_list,
+                                    ["Kind"], rule_code, incompleteness_stack)
 
     LOGGER.debug(f"Rule {rule_code} concluded.")
 
 
+# Declaration of the rules of the group UFO Unique and of their read and write sets, used by the rules scheduler.
+UFO_UNIQUE_RULES = [
+    RuleDeclaration("RU01", "rule_group_ufo_unique", run_ru01,
+                    reads=["Kind", "Sortal", "rdfs:subClassOf"],
+                    writes=["Kind"]),
+]
+
+
 def execute_rules_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-                             incompleteness_stack: list[IncompletenessEntry]) -> None:
+                             incompleteness_stack: list[IncompletenessEntry],
+                             rules_delta: RulesDelta | None = None,
+                             taxonomy_index: TaxonomyIndex | None = None) -> None:
     """Call execution of all rules from the group UFO Unique.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
@@ -167,10 +202,14 @@ def execute_rules_ufo_unique(ontology_dataclass_list: list[OntologyDataClass], o
     :type ontology_graph: Graph
     :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
     :type incompleteness_stack: list[IncompletenessEntry]
+    :param rules_delta: Classes changed since the group's previous execution. If None, all bindings are evaluated.
+    :type rules_delta: RulesDelta | None
+    :param taxonomy_index: Native index of the working graph's taxonomy. If None, the SPARQL queries are used.
+    :type taxonomy_index: TaxonomyIndex | None
     """
 
     LOGGER.debug("Starting execution of all rules from group UFO Unique.")
 
-    run_ru01(ontology_dataclass_list, ontology_graph, incompleteness_stack)
+    run_ru01(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index)
 
     LOGGER.debug("Execution of all rules from group UFO Unique completed.")
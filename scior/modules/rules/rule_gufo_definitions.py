@@ -0,0 +1,96 @@
+""" Definition of the data structure used for declaring the rules of the group gUFO and functions for executing them.
+
+    All gUFO rules are local: their premises and conclusions refer only to the IS and NOT classifications of a single
+    class. Hence, they can be evaluated using the dataclass' bitmasks only.
+"""
+from dataclasses import dataclass, field
+
+# Used this way to avoid circular dependency
+import scior.modules.ontology_dataclassess.dataclass_moving as m
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, classifications_to_mask
+
+
+@dataclass
+class GufoRule(object):
+    """ A gUFO rule in the form: IS premises ^ NOT premises -> IS conclusions ^ NOT conclusions.
+        Bitmasks for all premises and conclusions are calculated when the rule is created.
+    """
+
+    rule_code: str
+    is_premises: list[str] = field(default_factory=list)
+    not_premises: list[str] = field(default_factory=list)
+    is_conclusions: list[str] = field(default_factory=list)
+    not_conclusions: list[str] = field(default_factory=list)
+
+    is_premises_mask: int = field(init=False)
+    not_premises_mask: int = field(init=False)
+    is_conclusions_mask: int = field(init=False)
+    not_conclusions_mask: int = field(init=False)
+
+    def __post_init__(self):
+        self.is_premises_mask = classifications_to_mask(self.is_premises)
+        self.not_premises_mask = classifications_to_mask(self.not_premises)
+        self.is_conclusions_mask = classifications_to_mask(self.is_conclusions)
+        self.not_conclusions_mask = classifications_to_mask(self.not_conclusions)
+
+    def is_applicable(self, is_mask: int, not_mask: int) -> bool:
+        """ Checks if all premises of the rule are satisfied by the received IS and NOT bitmasks. """
+        return (is_mask & self.is_premises_mask) == self.is_premises_mask and \
+            (not_mask & self.not_premises_mask) == self.not_premises_mask
+
+
+def execute_gufo_rules_table(ontology_dataclass_list: list[OntologyDataClass], ontology_dataclass: OntologyDataClass,
+                             gufo_rules: list[GufoRule]) -> None:
+    """ Executes once, in order, all received gUFO rules for a single dataclass, moving its classifications when the
+    rules' premises are satisfied.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param ontology_dataclass: Data structure that contains information about the class to be evaluated.
+    :type ontology_dataclass: OntologyDataClass
+    :param gufo_rules: List of gUFO rules to be executed.
+    :type gufo_rules: list[GufoRule]
+    """
+
+    for gufo_rule in gufo_rules:
+        if gufo_rule.is_applicable(ontology_dataclass.is_mask, ontology_dataclass.not_mask):
+            m.move_classifications_list_to_is_type(ontology_dataclass_list, ontology_dataclass,
+                                                   gufo_rule.is_conclusions, gufo_rule.rule_code)
+            m.move_classifications_list_to_not_type(ontology_dataclass_list, ontology_dataclass,
+                                                    gufo_rule.not_conclusions, gufo_rule.rule_code)
+
+
+def close_gufo_state(is_mask: int, not_mask: int, gufo_rules: list[GufoRule]) -> tuple[int, int] | None:
+    """ Executes in loop the received gUFO rules over an IS and NOT classification state until no rule changes it.
+
+    :param is_mask: Bitmask of the classifications in the is_type list.
+    :type is_mask: int
+    :param not_mask: Bitmask of the classifications in the not_type list.
+    :type not_mask: int
+    :param gufo_rules: List of gUFO rules to be executed.
+    :type gufo_rules: list[GufoRule]
+    :return: Tuple with the closed IS and NOT bitmasks or None if the closure leads to an inconsistent state (i.e., a
+    classification that must be in both lists).
+    :rtype: tuple[int, int] | None
+    """
+
+    modified = True
+
+    while modified:
+        modified = False
+
+        for gufo_rule in gufo_rules:
+            if not gufo_rule.is_applicable(is_mask, not_mask):
+                continue
+
+            if (gufo_rule.is_conclusions_mask & not_mask) or (gufo_rule.not_conclusions_mask & is_mask):
+                return None
+
+            new_is_mask = is_mask | gufo_rule.is_conclusions_mask
+            new_not_mask = not_mask | gufo_rule.not_conclusions_mask
+
+            if new_is_mask != is_mask or new_not_mask != not_mask:
+                is_mask, not_mask = new_is_mask, new_not_mask
+                modified = True
+
+    return is_mask, not_mask
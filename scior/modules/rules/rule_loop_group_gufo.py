@@ -1,46 +1,147 @@
-""" Implementation of caller/switcher for rules of group GUFO. """
+""" Implementation of caller/switcher for rules of group GUFO.
+
+    As all rules of the group gUFO evaluate a single class, they are executed by a worklist closure engine: every
+    classification move enqueues only the affected dataclass, and the gUFO rules are executed only for the dequeued
+    dataclasses until the worklist is drained. The reached fixpoint is the same of a full re-execution of all rules
+    for all classes after every move.
+
+    As the result of the gUFO rules depends only on the class' IS and NOT states, the closed state of each evaluated
+    state is memoized, so that the evaluation of a dequeued dataclass is usually a single dictionary lookup.
+"""
 
 import random
 import string
+from collections import deque
+from functools import lru_cache
 
 # Used this way to avoid circular dependency
 import scior.modules.initialization_arguments as args
+import scior.modules.ontology_dataclassess.dataclass_moving as m
 from scior.modules.logger_config import initialize_logger
 from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
-from scior.modules.ontology_dataclassess.dataclass_hashing import create_ontology_dataclass_list_hash
-from scior.modules.rules.rule_group_gufo_leaves import execute_gufo_leaves_rules
-from scior.modules.rules.rule_group_gufo_negative import execute_gufo_negative_rules
-from scior.modules.rules.rule_group_gufo_positive import execute_gufo_positive_rules
+from scior.modules.rules.rule_group_gufo_leaves import execute_gufo_leaves_rules_dataclass, GUFO_LEAVES_RULES
+from scior.modules.rules.rule_group_gufo_negative import execute_gufo_negative_rules_dataclass, GUFO_NEGATIVE_RULES
+from scior.modules.rules.rule_group_gufo_positive import execute_gufo_positive_rules_dataclass, GUFO_POSITIVE_RULES
+from scior.modules.rules.rule_group_gufo_vectorized import execute_gufo_rules_vectorized
+from scior.modules.rules.rule_gufo_definitions import close_gufo_state
 
 LOGGER = initialize_logger()
 
+GUFO_ALL_RULES = GUFO_POSITIVE_RULES + GUFO_NEGATIVE_RULES + GUFO_LEAVES_RULES
+
+# Maximum number of memoized (is_mask, not_mask) states. Least recently used states are evicted first.
+GUFO_CLOSURE_CACHE_SIZE = 4096
+
+# Dataclasses waiting to be (re-)evaluated by the gUFO rules and the ids of the ones already in the worklist.
+GUFO_WORKLIST: deque[OntologyDataClass] = deque()
+GUFO_WORKLIST_PENDING: set[int] = set()
+
+# Indicates if the worklist is being drained. Moves performed by the gUFO rules only enqueue their dataclasses.
+_worklist_draining = False
+
+
+@lru_cache(maxsize=GUFO_CLOSURE_CACHE_SIZE)
+def get_gufo_closure(is_mask: int, not_mask: int) -> tuple[int, int] | None:
+    """ Returns the memoized closure under all gUFO rules of the received IS and NOT classification state.
+
+    :param is_mask: Bitmask of the classifications in the is_type list.
+    :type is_mask: int
+    :param not_mask: Bitmask of the classifications in the not_type list.
+    :type not_mask: int
+    :return: Tuple with the closed IS and NOT bitmasks or None if the state is inconsistent with the gUFO rules.
+    :rtype: tuple[int, int] | None
+    """
+
+    return close_gufo_state(is_mask, not_mask, GUFO_ALL_RULES)
 
-def loop_execute_gufo_rules(ontology_dataclass_list: list[OntologyDataClass]) -> None:
-    """ Executes in loop all rules of the GUFO group.
+
+def enqueue_gufo_evaluation(ontology_dataclass: OntologyDataClass) -> None:
+    """ Inserts the received dataclass into the gUFO worklist if it is not already waiting for evaluation.
+
+    :param ontology_dataclass: Data structure that contains information about the class to be evaluated.
+    :type ontology_dataclass: OntologyDataClass
+    """
+
+    if id(ontology_dataclass) not in GUFO_WORKLIST_PENDING:
+        GUFO_WORKLIST_PENDING.add(id(ontology_dataclass))
+        GUFO_WORKLIST.append(ontology_dataclass)
+
+
+def drain_gufo_worklist(ontology_dataclass_list: list[OntologyDataClass]) -> None:
+    """ Executes all rules of the gUFO group for the dataclasses in the worklist until it is empty.
+
+    Each dequeued dataclass is moved at once to its memoized closed state. Only when its state is inconsistent the rules
+    are executed: a dataclass is removed from the pending set before its evaluation, hence moves performed by the rules
+    re-enqueue it and it is re-evaluated until the inconsistency is reported. If called while the worklist is already
+    being drained (i.e., by a move performed by a gUFO rule) nothing is done, as the outer call processes the worklist.
 
     :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
     :type ontology_dataclass_list: list[OntologyDataClass]
     """
 
-    if args.ARGUMENTS["is_debug"]:
-        loop_id = ''.join(random.choices(string.ascii_lowercase, k=4))
-        LOGGER.debug(f"gUFO loop ID = {loop_id}. Executing in loop all rules from group gUFO.")
+    global _worklist_draining
 
-    initial_hash = create_ontology_dataclass_list_hash(ontology_dataclass_list)
-    final_hash = initial_hash + 1
+    if _worklist_draining:
+        return
 
-    while initial_hash != final_hash:
-        initial_hash = final_hash
+    _worklist_draining = True
 
-        execute_gufo_positive_rules(ontology_dataclass_list)
-        execute_gufo_negative_rules(ontology_dataclass_list)
-        execute_gufo_leaves_rules(ontology_dataclass_list)
+    try:
+        while GUFO_WORKLIST:
+            ontology_dataclass = GUFO_WORKLIST.popleft()
+            GUFO_WORKLIST_PENDING.discard(id(ontology_dataclass))
 
-        final_hash = create_ontology_dataclass_list_hash(ontology_dataclass_list)
+            closed_state = get_gufo_closure(ontology_dataclass.is_mask, ontology_dataclass.not_mask)
 
-        if args.ARGUMENTS["is_debug"]:
-            if initial_hash == final_hash:
-                LOGGER.debug(f"gUFO loop ID = {loop_id}. Final hash equals initial hash "
-                             f"gUFO types hierarchy rules successfully concluded.")
+            if closed_state is not None:
+                m.move_classifications_to_closed_state(ontology_dataclass_list, ontology_dataclass, *closed_state,
+                                                       "gUFO closure")
             else:
-                LOGGER.debug(f"gUFO loop ID = {loop_id}. Final hash does not equals initial hash. Re-executing rules.")
+                # Inconsistent states are evaluated by the rules themselves, which report the inconsistency found.
+                execute_gufo_positive_rules_dataclass(ontology_dataclass_list, ontology_dataclass)
+                execute_gufo_negative_rules_dataclass(ontology_dataclass_list, ontology_dataclass)
+                execute_gufo_leaves_rules_dataclass(ontology_dataclass_list, ontology_dataclass)
+
+    finally:
+        # When an inconsistency is found the remaining entries must not affect future executions.
+        GUFO_WORKLIST.clear()
+        GUFO_WORKLIST_PENDING.clear()
+        _worklist_draining = False
+
+
+def execute_gufo_rules_for_dataclass(ontology_dataclass_list: list[OntologyDataClass],
+                                     ontology_dataclass: OntologyDataClass) -> None:
+    """ Enqueues a dataclass whose classifications were changed and closes it under the gUFO rules.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    :param ontology_dataclass: Data structure that contains information about the changed class.
+    :type ontology_dataclass: OntologyDataClass
+    """
+
+    enqueue_gufo_evaluation(ontology_dataclass)
+    drain_gufo_worklist(ontology_dataclass_list)
+
+
+def loop_execute_gufo_rules(ontology_dataclass_list: list[OntologyDataClass]) -> None:
+    """ Executes all rules of the GUFO group for all dataclasses of the list until no rule changes them anymore.
+        If the vectorized gUFO mode is selected, the rules are executed for all classes at once as array operations.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: list[OntologyDataClass]
+    """
+
+    if args.ARGUMENTS["is_debug"]:
+        loop_id = ''.join(random.choices(string.ascii_lowercase, k=4))
+        LOGGER.debug(f"gUFO loop ID = {loop_id}. Executing all rules from group gUFO for all classes.")
+
+    if args.ARGUMENTS["is_vectorized_gufo"]:
+        execute_gufo_rules_vectorized(ontology_dataclass_list)
+    else:
+        for ontology_dataclass in ontology_dataclass_list:
+            enqueue_gufo_evaluation(ontology_dataclass)
+
+        drain_gufo_worklist(ontology_dataclass_list)
+
+    if args.ARGUMENTS["is_debug"]:
+        LOGGER.debug(f"gUFO loop ID = {loop_id}. gUFO types hierarchy rules successfully concluded.")
@@ -0,0 +1,414 @@
+""" Native implementations, over the TaxonomyIndex, of the SPARQL queries used by the rules executed in loop.
+
+    Each function returns the same (distinct) bindings of the query patterns it replaces, as rows whose attributes are
+    named as the projected query variables and hold the integer ids (see UriTable) of the bound nodes. Hence, the rows
+    can be treated exactly as the rows of the SPARQL queries' results, whose nodes are also converted into their ids
+    (see execute_rule_query). The SPARQL queries are kept in the rules as the reference mode.
+
+    The functions used by existential rules can also exclude the evaluated classes that already satisfy the rule, i.e.,
+    that have an ancestor or descendant with the required type, using the index's type aggregates (TypeAggregates).
+
+    All queries can be seeded (see QuerySeed), in which case only the rows in which a seeded variable is bound to one of
+    the seed's classes are returned. The seeded rows are obtained from the seed's classes through the index's relations,
+    without evaluating the rest of the query, and are used by the semi-naive execution (see rule_delta_definitions).
+
+    When the rules profiling is selected, the time and the number of rows of each query are recorded (see
+    rules_profiling).
+"""
+from collections import namedtuple
+
+from scior.modules.rules.rules_profiling import profiled_query
+from scior.modules.taxonomy_index import TaxonomyIndex
+from scior.modules.type_aggregates import ANCESTORS, DESCENDANTS, IS_STATE
+
+QueryRowX = namedtuple("QueryRowX", ["class_x"])
+QueryRowXY = namedtuple("QueryRowXY", ["class_x", "class_y"])
+QueryRowXYZ = namedtuple("QueryRowXYZ", ["class_x", "class_y", "class_z"])
+
+# Restriction of a query to the rows in which at least one of the variables (all projected ones, if None) is bound to
+# one of the classes (set of ids)
+QuerySeed = namedtuple("QuerySeed", ["classes", "variables"])
+
+
+def get_seeded_candidates(seed: QuerySeed | None, candidates_x, access_paths: dict) -> list[int] | object:
+    """ Returns the candidates of class_x that may be bound in the rows selected by the received seed.
+
+    :param seed: Restriction of the query's rows. If None, all candidates are returned.
+    :type seed: QuerySeed | None
+    :param candidates_x: Ids of all candidates of class_x (any container that answers the 'in' operator).
+    :param access_paths: Function of each projected variable other than class_x that returns, for a class bound to
+    the variable, the ids of the classes class_x that may be bound together with it in a row.
+    :type access_paths: dict
+    :return: Candidates of class_x of the seeded rows or candidates_x if there is no seed.
+    """
+
+    if seed is None:
+        return candidates_x
+
+    seeded_variables = seed.variables if seed.variables is not None else ["class_x", *access_paths]
+    seeded_candidates = set()
+
+    for variable in seeded_variables:
+        if variable == "class_x":
+            seeded_candidates.update(seed.classes)
+        else:
+            for seed_class in seed.classes:
+                seeded_candidates.update(access_paths[variable](seed_class))
+
+    return [class_x for class_x in seeded_candidates if class_x in candidates_x]
+
+
+def is_seeded_row(row: tuple, seed: QuerySeed | None) -> bool:
+    """ Informs if the received row is selected by the seed, i.e., if a seeded variable is bound to a seed class. """
+
+    if seed is None:
+        return True
+
+    seeded_variables = seed.variables if seed.variables is not None else row._fields
+
+    return any(getattr(row, variable) in seed.classes for variable in seeded_variables)
+
+
+def get_members_of_all_types(taxonomy_index: TaxonomyIndex, gufo_types: list[str]) -> set[int]:
+    """ Returns the ids of the nodes that have all received gUFO types as rdf:type. """
+
+    members = set(taxonomy_index.get_type_members(gufo_types[0]))
+
+    for gufo_type in gufo_types[1:]:
+        members &= taxonomy_index.get_type_members(gufo_type)
+
+    return members
+
+
+def get_unsatisfied_members(taxonomy_index: TaxonomyIndex, x_type: str, direction: str,
+                            satisfying_type: str | None) -> set[int]:
+    """ Returns the ids of the nodes that have x_type as rdf:type. If a satisfying_type is received, the nodes with
+        an ancestor or descendant (according to the direction) that IS of this type are not returned.
+    """
+
+    if satisfying_type is None:
+        return taxonomy_index.get_type_members(x_type)
+
+    type_aggregates = taxonomy_index.type_aggregates
+
+    return {class_x for class_x in taxonomy_index.get_type_members(x_type)
+            if type_aggregates.get_counts(class_x, direction, satisfying_type)[IS_STATE] == 0}
+
+
+@profiled_query
+def query_typed_subclasses(taxonomy_index: TaxonomyIndex, x_type: str, satisfying_type: str | None = None,
+                           seed: QuerySeed | None = None) -> list[QueryRowXY]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_type> . ?class_y rdfs:subClassOf ?class_x .
+        If a satisfying_type is received, the bindings of the classes class_x that have a subclass of this type are
+        not returned.
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_type: gUFO type of class_x.
+    :type x_type: str
+    :param satisfying_type: gUFO type of the subclasses that exclude the bindings of class_x.
+    :type satisfying_type: str | None
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x and class_y.
+    :rtype: list[QueryRowXY]
+    """
+
+    candidates_x = get_seeded_candidates(
+        seed, get_unsatisfied_members(taxonomy_index, x_type, DESCENDANTS, satisfying_type),
+        {"class_y": lambda class_y: taxonomy_index.superclasses[class_y]})
+
+    return [row for class_x in candidates_x
+            for row in (QueryRowXY(class_x, class_y) for class_y in taxonomy_index.subclasses[class_x])
+            if is_seeded_row(row, seed)]
+
+
+@profiled_query
+def query_typed_superclasses(taxonomy_index: TaxonomyIndex, x_type: str, include_itself: bool = True,
+                             satisfying_type: str | None = None, seed: QuerySeed | None = None) -> list[QueryRowXY]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_type> . ?class_x rdfs:subClassOf ?class_y .
+        If include_itself is False, the pattern also has the filter: FILTER (?class_x != ?class_y).
+        If a satisfying_type is received, the bindings of the classes class_x that have a superclass of this type are
+        not returned.
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_type: gUFO type of class_x.
+    :type x_type: str
+    :param include_itself: Indicates if the bindings in which class_x is equal to class_y are returned.
+    :type include_itself: bool
+    :param satisfying_type: gUFO type of the superclasses that exclude the bindings of class_x.
+    :type satisfying_type: str | None
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x and class_y.
+    :rtype: list[QueryRowXY]
+    """
+
+    candidates_x = get_seeded_candidates(
+        seed, get_unsatisfied_members(taxonomy_index, x_type, ANCESTORS, satisfying_type),
+        {"class_y": lambda class_y: taxonomy_index.subclasses[class_y]})
+
+    return [row for class_x in candidates_x
+            for row in (QueryRowXY(class_x, class_y) for class_y in taxonomy_index.superclasses[class_x]
+                        if include_itself or class_x != class_y)
+            if is_seeded_row(row, seed)]
+
+
+@profiled_query
+def query_intermediate_superclasses(taxonomy_index: TaxonomyIndex, x_types: list[str], y_types: list[str],
+                                    all_distinct: bool = False, seed: QuerySeed | None = None) -> list[QueryRowXYZ]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_types> . ?class_y rdf:type gufo:<y_types> .
+        ?class_x rdfs:subClassOf ?class_y . ?class_x rdfs:subClassOf ?class_z . ?class_z rdfs:subClassOf ?class_y .
+        If all_distinct is True, the pattern also has the filters: FILTER(?class_x != ?class_z),
+        FILTER(?class_y != ?class_z) and FILTER(?class_x != ?class_y).
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_types: gUFO types of class_x. If empty, class_x can be any node.
+    :type x_types: list[str]
+    :param y_types: gUFO types of class_y. If empty, class_y can be any node.
+    :type y_types: list[str]
+    :param all_distinct: Indicates if only the bindings in which the three classes are different are returned.
+    :type all_distinct: bool
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x, class_y and class_z.
+    :rtype: list[QueryRowXYZ]
+    """
+
+    superclasses = taxonomy_index.superclasses
+
+    candidates_x = get_members_of_all_types(taxonomy_index, x_types) if x_types else range(len(taxonomy_index.nodes))
+    candidates_x = get_seeded_candidates(seed, candidates_x,
+                                         {"class_y": lambda class_y: taxonomy_index.subclasses[class_y],
+                                          "class_z": lambda class_z: taxonomy_index.subclasses[class_z]})
+    candidates_y = get_members_of_all_types(taxonomy_index, y_types) if y_types else None
+    query_result = []
+
+    for class_x in candidates_x:
+        for class_y in superclasses[class_x]:
+            if candidates_y is not None and class_y not in candidates_y:
+                continue
+            if all_distinct and class_x == class_y:
+                continue
+            for class_z in superclasses[class_x]:
+                if all_distinct and (class_z == class_x or class_z == class_y):
+                    continue
+                if class_y in superclasses[class_z]:
+                    row = QueryRowXYZ(class_x, class_y, class_z)
+                    if is_seeded_row(row, seed):
+                        query_result.append(row)
+
+    return query_result
+
+
+def get_related_classes(taxonomy_index: TaxonomyIndex, class_x: int) -> set[int]:
+    """ Returns the ids of the nodes y bound by the pattern: ?class_y rdfs:subClassOf|scior:shareSuperClass ?class_x .
+    """
+
+    # scior:shareSuperClass is symmetric, hence the nodes related to class_x are also the ones class_x is related to
+    return taxonomy_index.subclasses[class_x] | taxonomy_index.get_share_super_class_ids(class_x)
+
+
+def get_inverse_related_classes(taxonomy_index: TaxonomyIndex, class_y: int) -> set[int]:
+    """ Returns the ids of the nodes x bound by the pattern: ?class_y rdfs:subClassOf|scior:shareSuperClass ?class_x .
+    """
+
+    return taxonomy_index.superclasses[class_y] | taxonomy_index.get_share_super_class_ids(class_y)
+
+
+@profiled_query
+def query_related_classes(taxonomy_index: TaxonomyIndex, x_type: str | None,
+                          seed: QuerySeed | None = None) -> list[QueryRowXY]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_type> .
+        ?class_y rdfs:subClassOf|scior:shareSuperClass ?class_x .
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_type: gUFO type of class_x. If None, class_x can be any node.
+    :type x_type: str | None
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x and class_y.
+    :rtype: list[QueryRowXY]
+    """
+
+    candidates_x = taxonomy_index.get_type_members(x_type) if x_type else range(len(taxonomy_index.nodes))
+    candidates_x = get_seeded_candidates(
+        seed, candidates_x, {"class_y": lambda class_y: get_inverse_related_classes(taxonomy_index, class_y)})
+
+    return [row for class_x in candidates_x
+            for row in (QueryRowXY(class_x, class_y) for class_y in get_related_classes(taxonomy_index, class_x))
+            if is_seeded_row(row, seed)]
+
+
+@profiled_query
+def query_related_class_pairs(taxonomy_index: TaxonomyIndex, x_type: str, y_type: str,
+                              seed: QuerySeed | None = None) -> list[QueryRowXYZ]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_type> . ?class_y rdf:type gufo:<y_type> .
+        ?class_y rdfs:subClassOf|scior:shareSuperClass ?class_x .
+        ?class_z rdfs:subClassOf|scior:shareSuperClass ?class_x . FILTER (?class_y != ?class_z) .
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_type: gUFO type of class_x.
+    :type x_type: str
+    :param y_type: gUFO type of class_y.
+    :type y_type: str
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x, class_y and class_z.
+    :rtype: list[QueryRowXYZ]
+    """
+
+    members_y = taxonomy_index.get_type_members(y_type)
+    query_result = []
+
+    candidates_x = get_seeded_candidates(
+        seed, taxonomy_index.get_type_members(x_type),
+        {"class_y": lambda class_y: get_inverse_related_classes(taxonomy_index, class_y),
+         "class_z": lambda class_z: get_inverse_related_classes(taxonomy_index, class_z)})
+
+    for class_x in candidates_x:
+        related_classes = get_related_classes(taxonomy_index, class_x)
+        for class_y in related_classes & members_y:
+            for class_z in related_classes:
+                if class_y != class_z:
+                    row = QueryRowXYZ(class_x, class_y, class_z)
+                    if is_seeded_row(row, seed):
+                        query_result.append(row)
+
+    return query_result
+
+
+@profiled_query
+def query_share_kind(taxonomy_index: TaxonomyIndex, x_type: str | None, include_itself: bool = True,
+                     seed: QuerySeed | None = None) -> list[QueryRowXY]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_type> . ?class_x scior:shareKind ?class_y .
+        If include_itself is False, the pattern also has the filter: FILTER (?class_x != ?class_y).
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_type: gUFO type of class_x. If None, class_x can be any node.
+    :type x_type: str | None
+    :param include_itself: Indicates if the bindings in which class_x is equal to class_y are returned.
+    :type include_itself: bool
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x and class_y.
+    :rtype: list[QueryRowXY]
+    """
+
+    kind_partition = taxonomy_index.kind_partition
+
+    candidates_x = taxonomy_index.get_type_members(x_type) if x_type else range(len(taxonomy_index.nodes))
+    candidates_x = get_seeded_candidates(seed, candidates_x, {"class_y": kind_partition.get_block_members})
+
+    return [row for class_x in candidates_x
+            for row in (QueryRowXY(class_x, class_y) for class_y in kind_partition.get_block_members(class_x)
+                        if include_itself or class_x != class_y)
+            if is_seeded_row(row, seed)]
+
+
+@profiled_query
+def query_sibling_subclasses(taxonomy_index: TaxonomyIndex, x_type: str, y_type: str,
+                             seed: QuerySeed | None = None) -> list[QueryRowXYZ]:
+    """ Native implementation of the pattern: ?class_x rdf:type gufo:<x_type> . ?class_y rdf:type gufo:<y_type> .
+        ?class_x rdfs:subClassOf ?class_y . ?class_z rdfs:subClassOf ?class_y .
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param x_type: gUFO type of class_x.
+    :type x_type: str
+    :param y_type: gUFO type of class_y.
+    :type y_type: str
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x, class_y and class_z.
+    :rtype: list[QueryRowXYZ]
+    """
+
+    members_y = taxonomy_index.get_type_members(y_type)
+    subclasses = taxonomy_index.subclasses
+
+    candidates_x = get_seeded_candidates(
+        seed, taxonomy_index.get_type_members(x_type),
+        {"class_y": lambda class_y: subclasses[class_y],
+         "class_z": lambda class_z: {class_x for class_y in taxonomy_index.superclasses[class_z] & members_y
+                                     for class_x in subclasses[class_y]}})
+
+    return [row for class_x in candidates_x
+            for row in (QueryRowXYZ(class_x, class_y, class_z)
+                        for class_y in taxonomy_index.superclasses[class_x] & members_y
+                        for class_z in subclasses[class_y])
+            if is_seeded_row(row, seed)]
+
+
+@profiled_query
+def query_isolated_classes(taxonomy_index: TaxonomyIndex, seed: QuerySeed | None = None) -> list[QueryRowX]:
+    """ Native implementation of the pattern: ?class_x rdf:type owl:Class . FILTER NOT EXISTS { ?class_y rdf:type
+        owl:Class . ?class_y rdfs:subClassOf ?class_x . FILTER (?class_y != ?class_x) } FILTER NOT EXISTS {
+        ?class_z rdf:type owl:Class . ?class_x rdfs:subClassOf ?class_z . FILTER (?class_z != ?class_x) } .
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param seed: Restriction of the returned rows. If None, all rows are returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x.
+    :rtype: list[QueryRowX]
+    """
+
+    owl_classes = taxonomy_index.owl_classes
+
+    return [QueryRowX(class_x) for class_x in get_seeded_candidates(seed, owl_classes, {})
+            if not any(class_y != class_x for class_y in taxonomy_index.subclasses[class_x] & owl_classes)
+            and not any(class_z != class_x for class_z in taxonomy_index.superclasses[class_x] & owl_classes)]
+
+
+@profiled_query
+def query_unrelated_siblings(taxonomy_index: TaxonomyIndex, z_type: str, project_z: bool = True,
+                             seed: QuerySeed | None = None) -> list[QueryRowXYZ] | list[QueryRowXY]:
+    """ Native implementation of the pattern: ?class_x rdfs:subClassOf ?class_y . ?class_z rdfs:subClassOf ?class_y .
+        ?class_z rdf:type gufo:<z_type> . MINUS {?class_x rdfs:subClassOf ?class_z}
+        MINUS {?class_z rdfs:subClassOf ?class_x} .
+        If project_z is False, only the distinct bindings of class_x and class_y are returned.
+
+    :param taxonomy_index: Native index of the working graph's taxonomy.
+    :type taxonomy_index: TaxonomyIndex
+    :param z_type: gUFO type of class_z.
+    :type z_type: str
+    :param project_z: Indicates if class_z is projected.
+    :type project_z: bool
+    :param seed: Restriction of the returned rows, whose seeded variables must be projected. If None, all rows are
+    returned.
+    :type seed: QuerySeed | None
+    :return: Rows with the distinct bindings of class_x, class_y and (if projected) class_z.
+    :rtype: list[QueryRowXYZ] | list[QueryRowXY]
+    """
+
+    superclasses = taxonomy_index.superclasses
+    subclasses = taxonomy_index.subclasses
+    members_z = taxonomy_index.get_type_members(z_type)
+
+    access_paths = {"class_y": lambda class_y: subclasses[class_y]}
+    if project_z:
+        access_paths["class_z"] = lambda class_z: {class_x for class_y in superclasses[class_z]
+                                                   for class_x in subclasses[class_y]}
+
+    candidates_x = get_seeded_candidates(seed, range(len(taxonomy_index.nodes)), access_paths)
+    query_result = []
+
+    for class_x in candidates_x:
+        for class_y in superclasses[class_x]:
+            unrelated_siblings = [class_z for class_z in subclasses[class_y] & members_z
+                                  if class_z not in superclasses[class_x] and class_x not in superclasses[class_z]]
+
+            if project_z:
+                rows = [QueryRowXYZ(class_x, class_y, class_z) for class_z in unrelated_siblings]
+            else:
+                rows = [QueryRowXY(class_x, class_y)] if unrelated_siblings else []
+
+            query_result.extend(row for row in rows if is_seeded_row(row, seed))
+
+    return query_result
@@ -0,0 +1,119 @@
+""" Registry of the rules' SPARQL queries, which are parsed and translated into SPARQL algebra (i.e., prepared) only
+    once per execution and reused in all following executions of the rules.
+
+    The time spent preparing and executing each rule's query is recorded, so that the costs of parsing/planning and of
+    evaluating the queries can be compared (see get_queries_timings). When the rules profiling is selected, the total
+    time and the number of rows of each query are also recorded for the rule's execution (see rules_profiling).
+
+    The queries' results are returned as rows holding the integer ids (see UriTable) of the bound nodes, in the same way
+    as the native implementations of the queries (see rule_native_queries).
+"""
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+
+from rdflib import Graph, Namespace, OWL, RDF, RDFS
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+
+from scior.modules.logger_config import initialize_logger
+from scior.modules.resources_gufo import GUFO_NAMESPACE, SCIOR_NAMESPACE
+from scior.modules.rules.rules_profiling import record_query
+from scior.modules.uri_table import UriTable
+
+LOGGER = initialize_logger()
+
+# Namespaces bound to all prepared queries, as the queries may use their prefixes without declaring them
+PREPARED_QUERIES_NAMESPACES = {"rdf": RDF, "rdfs": RDFS, "owl": OWL, "gufo": Namespace(GUFO_NAMESPACE),
+                               "scior": Namespace(SCIOR_NAMESPACE)}
+
+
+@dataclass
+class QueryTimings(object):
+    """ Accumulated times (in seconds) spent preparing and executing a rule's query and its number of executions. """
+
+    preparation_time: float = 0.0
+    execution_time: float = 0.0
+    executions: int = 0
+
+
+PREPARED_QUERIES: dict[str, Query] = {}
+QUERIES_TIMINGS: dict[str, QueryTimings] = {}
+
+# Types of the returned rows, indexed by the names of the projected variables
+QUERY_ROWS_TYPES: dict[tuple[str, ...], type] = {}
+
+
+def get_prepared_query(rule_code: str, query_string: str) -> Query:
+    """ Returns the prepared query of the received rule, preparing it if it was not prepared yet.
+
+    :param rule_code: Code of the rule that owns the query (e.g., RA01). Each rule has a single query.
+    :type rule_code: str
+    :param query_string: SPARQL query of the rule.
+    :type query_string: str
+    :return: Query already parsed and translated into SPARQL algebra.
+    :rtype: Query
+    """
+
+    prepared_query = PREPARED_QUERIES.get(rule_code)
+
+    if prepared_query is None:
+        start_time = time.perf_counter()
+        prepared_query = prepareQuery(query_string, initNs=PREPARED_QUERIES_NAMESPACES)
+        QUERIES_TIMINGS.setdefault(rule_code, QueryTimings()).preparation_time += time.perf_counter() - start_time
+        PREPARED_QUERIES[rule_code] = prepared_query
+        LOGGER.debug(f"Query of rule {rule_code} prepared.")
+
+    return prepared_query
+
+
+def execute_rule_query(rule_code: str, query_string: str, ontology_graph: Graph, uri_table: UriTable,
+                       init_bindings: dict | None = None) -> list[tuple]:
+    """ Executes the prepared query of the received rule over the ontology graph and returns its rows with the ids of
+        the bound nodes.
+
+    :param rule_code: Code of the rule that owns the query (e.g., RA01).
+    :type rule_code: str
+    :param query_string: SPARQL query of the rule. Only parsed in the rule's first execution.
+    :type query_string: str
+    :param ontology_graph: Ontology's working (RDFLib) graph to be queried.
+    :type ontology_graph: Graph
+    :param uri_table: Table used for converting the bound nodes into their ids.
+    :type uri_table: UriTable
+    :param init_bindings: Optional values of variables of the query (variable name -> RDFLib node), used when a rule
+    restricts its variables without needing a different query.
+    :type init_bindings: dict | None
+    :return: Rows of the query result, whose attributes are named as the projected variables and hold the nodes' ids.
+    :rtype: list[tuple]
+    """
+
+    call_start_time = time.perf_counter()
+    prepared_query = get_prepared_query(rule_code, query_string)
+
+    start_time = time.perf_counter()
+    query_result = ontology_graph.query(prepared_query, initBindings=init_bindings)
+    # Evaluating all bindings, so that the measured time includes the query's evaluation
+    query_result.bindings
+    query_timings = QUERIES_TIMINGS.setdefault(rule_code, QueryTimings())
+    query_timings.execution_time += time.perf_counter() - start_time
+    query_timings.executions += 1
+
+    variables_names = tuple(str(variable) for variable in query_result.vars)
+    row_type = QUERY_ROWS_TYPES.get(variables_names)
+
+    if row_type is None:
+        row_type = namedtuple("QueryRow", variables_names)
+        QUERY_ROWS_TYPES[variables_names] = row_type
+
+    get_id = uri_table.get_id
+    query_rows = [row_type._make([get_id(node) for node in row]) for row in query_result]
+
+    record_query(time.perf_counter() - call_start_time, len(query_rows))
+
+    return query_rows
+
+
+def get_queries_timings() -> dict[str, QueryTimings]:
+    """ Returns the accumulated preparation and execution times of the queries of all rules, indexed by rule code. """
+
+    return QUERIES_TIMINGS
@@ -0,0 +1,53 @@
+""" Definition of the data structures used for declaring the rules executed in loop to the rules scheduler and for
+    keeping the rules' results between their executions.
+
+    Each rule declares the gUFO classifications (in short form, e.g., Kind) and the graph predicates (in prefixed form,
+    e.g., rdfs:subClassOf) it reads, i.e., its inputs, and the ones it may write.
+"""
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RuleDeclaration(object):
+    """ Declaration of a rule: its code, group, implementing function and its read and write sets. """
+
+    rule_code: str
+    rule_group: str
+    rule_function: Callable
+    reads: list[str] = field(default_factory=list)
+    writes: list[str] = field(default_factory=list)
+
+
+class CandidateSets(object):
+    """ IS and CAN candidate sets (i.e., sets of ids of the classes that already solve or that may solve the rule) of
+        each class evaluated by a rule of groups UFO Unique or UFO Some, as of the last treatment of the class' result.
+
+        Kept by the RulesScheduler between the executions of the rule, so that the result of an evaluated class is
+        treated again only when its candidate sets change. Classes not evaluated in an execution keep their sets.
+    """
+
+    def __init__(self):
+        self.treated_sets = {}
+
+    def register_if_changed(self, evaluated_class: int, is_classes: list[int], can_classes: list[int]) -> bool:
+        """ Informs if the received candidate sets differ from the ones of the evaluated class' last treatment. If they
+            do, the received sets are registered as the ones of the class' new treatment.
+
+        :param evaluated_class: Id of the evaluated class.
+        :type evaluated_class: int
+        :param is_classes: Ids of the classes that already solve the rule for the evaluated class.
+        :type is_classes: list[int]
+        :param can_classes: Ids of the candidate classes that may solve the rule for the evaluated class.
+        :type can_classes: list[int]
+        :return: True if the result of the evaluated class must be treated and False otherwise.
+        :rtype: bool
+        """
+
+        new_sets = (frozenset(is_classes), frozenset(can_classes))
+
+        if self.treated_sets.get(evaluated_class) == new_sets:
+            return False
+
+        self.treated_sets[evaluated_class] = new_sets
+        return True
@@ -1,82 +1,95 @@
 """ Rules applied to the TYPES HIERARCHY. """
-import inspect
 import random
 import string
 
 from rdflib import Graph
 
 import scior.modules.initialization_arguments as args
-from scior.modules.graph_ontology import update_ontology_graph_with_gufo
 from scior.modules.logger_config import initialize_logger
-from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
-from scior.modules.ontology_dataclassess.dataclass_hashing import create_ontology_dataclass_list_hash
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, OntologyDataClassList
 from scior.modules.ontology_dataclassess.dataclass_verifications import verify_all_ontology_dataclasses_consistency
-from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
 from scior.modules.problems_treatment.treat_incomplete import IncompletenessEntry
-from scior.modules.rules.rule_group_aux import execute_rules_auxiliary
 from scior.modules.rules.rule_group_base import execute_rules_base
-from scior.modules.rules.rule_group_cwa import execute_rules_ufo_cwa
-from scior.modules.rules.rule_group_ufo_all import execute_rules_ufo_all
-from scior.modules.rules.rule_group_ufo_some import execute_rules_ufo_some
-from scior.modules.rules.rule_group_ufo_unique import execute_rules_ufo_unique
+from scior.modules.rules.rule_prepared_queries import get_queries_timings
+from scior.modules.rules.rules_profiling import start_rules_profiling
+from scior.modules.rules.rules_scheduler import RulesScheduler
+from scior.modules.taxonomy_closure import TaxonomyClosure
+from scior.modules.taxonomy_index import build_taxonomy_index
+from scior.modules.type_aggregates import TypeAggregates
 
 LOGGER = initialize_logger()
 
 
-def loop_rule(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph, list_rules_groups: list[str],
-              incompleteness_stack: list[IncompletenessEntry]) -> None:
-    """ Receives a list of rule groups to perform in loop until no modifications are found. """
+def loop_rule(ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph, list_rules_groups: list[str],
+              incompleteness_stack: list[IncompletenessEntry], taxonomy_closure: TaxonomyClosure | None = None) -> None:
+    """ Receives a list of rule groups to perform in loop until no modifications are found.
+
+        Modifications are detected by comparing the modifications counter of the ontology_dataclass_list before and
+        after each iteration. The first iteration never concludes the loop (i.e., at least two iterations are always
+        executed), as the ontology graph only receives the gUFO classifications after the execution of each rule group.
+
+        The groups' rules are executed by a RulesScheduler, in their dependency-aware order. Rules whose inputs were not
+        changed since their previous execution are skipped and the others are executed in a semi-naive (delta-driven)
+        way: the first execution of each rule is a full evaluation and the next ones evaluate only the bindings that
+        involve classes changed since the ontology graph update that preceded the rule's previous execution.
+
+        Unless the SPARQL rules mode is selected, the rules are evaluated over a native taxonomy index of the ontology
+        graph, built once before the loop and updated together with the graph. Its rdfs:subClassOf and shareSuperClass
+        relations are obtained from the received closure, which is not materialized in the graph in this case. The
+        relations inferred by the rules of group AUX (shareKind and the rdfs:subClassOf implied by it) are also kept in
+        the index only. The index's type aggregates count the classification states of each class' ancestors and
+        descendants.
+    """
 
     if args.ARGUMENTS["is_debug"]:
         loop_id = ''.join(random.choices(string.ascii_lowercase, k=4))
         LOGGER.debug(f"Rules loop ID = {loop_id}. Executing in loop rules groups.")
 
-    initial_hash = create_ontology_dataclass_list_hash(ontology_dataclass_list)
-    final_hash = initial_hash + 1
+    executed_iterations = 0
+    initial_counter = ontology_dataclass_list.modifications_counter
+    final_counter = initial_counter
 
-    while initial_hash != final_hash:
-
-        initial_hash = final_hash
-        for rule_group in list_rules_groups:
-            switch_rule_group_execution(ontology_dataclass_list, ontology_graph, rule_group, incompleteness_stack)
-        final_hash = create_ontology_dataclass_list_hash(ontology_dataclass_list)
-
-        if args.ARGUMENTS["is_debug"]:
-            if initial_hash == final_hash:
-                LOGGER.debug(f"Rules loop ID = {loop_id}. Final hash equals initial hash. Rules execution concluded.")
-            else:
-                LOGGER.debug(f"Rules loop ID = {loop_id}. Final hash does not equals initial hash. Re-executing rules.")
+    if args.ARGUMENTS["is_sparql_rules"]:
+        taxonomy_index = None
+    else:
+        taxonomy_index = build_taxonomy_index(ontology_graph, taxonomy_closure, ontology_dataclass_list.uri_table)
+        taxonomy_index.type_aggregates = TypeAggregates(taxonomy_index, ontology_dataclass_list)
 
+    if args.ARGUMENTS["is_rules_profiling"]:
+        start_rules_profiling()
 
-def switch_rule_group_execution(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph,
-                                rule_group_code: str, incompleteness_stack: list[IncompletenessEntry]) -> None:
-    """ A switch function that calls the rule received in its parameter.
-        AUXILIARY FUNCTION ONLY! MUST NOT BE USED OUTSIDE FUNCTION loop_rule.
-    """
+    rules_scheduler = RulesScheduler(list_rules_groups, taxonomy_index)
 
-    LOGGER.debug(f"Accessing rule {rule_group_code} ...")
+    while executed_iterations < 2 or initial_counter != final_counter:
 
-    if rule_group_code == "rule_group_aux":
-        execute_rules_auxiliary(ontology_graph)
+        executed_iterations += 1
+        initial_counter = final_counter
 
-    elif rule_group_code == "rule_group_ufo_all":
-        execute_rules_ufo_all(ontology_dataclass_list, ontology_graph)
+        rules_scheduler.execute_iteration(ontology_dataclass_list, ontology_graph, incompleteness_stack)
 
-    elif rule_group_code == "rule_group_ufo_unique":
-        execute_rules_ufo_unique(ontology_dataclass_list, ontology_graph, incompleteness_stack)
+        final_counter = ontology_dataclass_list.modifications_counter
 
-    elif rule_group_code == "rule_group_ufo_some":
-        execute_rules_ufo_some(ontology_dataclass_list, ontology_graph, incompleteness_stack)
+        if args.ARGUMENTS["is_debug"]:
+            if initial_counter == final_counter:
+                LOGGER.debug(f"Rules loop ID = {loop_id}. No modifications performed. Rules execution concluded.")
+            else:
+                LOGGER.debug(f"Rules loop ID = {loop_id}. {final_counter - initial_counter} modifications performed. "
+                             f"Re-executing rules.")
 
-    elif rule_group_code == "rule_group_ufo_cwa":
-        if args.ARGUMENTS["is_cwa"]:
-            execute_rules_ufo_cwa(ontology_dataclass_list, ontology_graph)
-    else:
-        current_function = inspect.stack()[0][3]
-        report_error_end_of_switch(rule_group_code, current_function)
+    total_invocations = rules_scheduler.executed_invocations + rules_scheduler.skipped_invocations
+    LOGGER.info(f"Rules loop concluded after {executed_iterations} iterations. "
+                f"{rules_scheduler.skipped_invocations} of {total_invocations} rule invocations were skipped as their "
+                f"inputs did not change.")
 
-    update_ontology_graph_with_gufo(ontology_dataclass_list, ontology_graph)
-    LOGGER.debug(f"Rule {rule_group_code} successfully performed.")
+    if args.ARGUMENTS["is_debug"]:
+        LOGGER.debug(f"Rules loop ID = {loop_id}. gUFO classification triples synced into the ontology graph per "
+                     f"rule group: {rules_scheduler.synced_triples}.")
+        if taxonomy_index is None:
+            queries_timings = get_queries_timings()
+            preparation_time = sum(timings.preparation_time for timings in queries_timings.values())
+            execution_time = sum(timings.execution_time for timings in queries_timings.values())
+            LOGGER.debug(f"Rules loop ID = {loop_id}. SPARQL queries of {len(queries_timings)} rules prepared in "
+                         f"{round(preparation_time, 4)} seconds and executed in {round(execution_time, 4)} seconds.")
 
 
 def execute_rules_types(ontology_dataclass_list: list[OntologyDataClass], ontology_graph: Graph) -> list[
@@ -107,11 +120,14 @@ def execute_rules_types(ontology_dataclass_list: list[OntologyDataClass], ontolo
     list_rules_groups = ["rule_group_aux", "rule_group_ufo_all", "rule_group_ufo_unique", "rule_group_ufo_some",
                          "rule_group_ufo_cwa"]
 
-    # Execute rule_group_base just once
-    execute_rules_base(ontology_graph)
+    # Execute rule_group_base just once. The closure of rdfs:subClassOf and the shareSuperClass relations are only
+    # written into the graph when they are read from there, i.e., when the rules are evaluated using SPARQL queries.
+    # The closure uses the ids of the dataclasses' URI table.
+    taxonomy_closure = execute_rules_base(ontology_graph, materialize_relations=args.ARGUMENTS["is_sparql_rules"],
+                                          uri_table=ontology_dataclass_list.uri_table)
 
     # Execute all groups of rules in loop (except groups base and gufo) until there are no new modifications
-    loop_rule(ontology_dataclass_list, ontology_graph, list_rules_groups, incompleteness_stack)
+    loop_rule(ontology_dataclass_list, ontology_graph, list_rules_groups, incompleteness_stack, taxonomy_closure)
 
     # Verify consistency once AFTER the rules' executions
     verify_all_ontology_dataclasses_consistency(ontology_dataclass_list)
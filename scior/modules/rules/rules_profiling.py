@@ -0,0 +1,242 @@
+""" Opt-in profiling of the rules executed in loop (see loop_rule).
+
+    When the rules profiling is selected, the RulesScheduler records one RuleExecutionProfile for each execution of a
+    rule in each iteration of the rules loop. While the rule is executed, its queries (SPARQL or native), the moves it
+    requests, the gUFO closures triggered by these moves and the incompleteness entries it registers are reported to the
+    profile being recorded by the functions of this module, which do nothing when no rule is being profiled.
+
+    At the end of the execution, the recorded profiles are saved as a JSON file and summarized per rule in a console
+    table, sorted by the rules' total wall time. Rules that read the taxonomy index directly, without a query (e.g., RU01
+    in the native rules mode), have no query measures, which are reported as N/A (null in the JSON file).
+"""
+import functools
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from prettytable import PrettyTable, SINGLE_BORDER
+
+import scior.modules.initialization_arguments as args
+from scior.modules.logger_config import initialize_logger
+from scior.modules.problems_treatment.treat_errors import report_error_io_write
+from scior.modules.utils_general import create_directory_if_not_exists
+
+LOGGER = initialize_logger()
+
+
+@dataclass
+class RuleExecutionProfile(object):
+    """ Measures of a single execution of a rule in an iteration of the rules loop. Times are in seconds.
+
+        The treatment time is the wall time not spent in the rule's queries and includes the time of the gUFO closures
+        triggered by the rule's moves. Moves and incompleteness entries of the gUFO rules are not counted. The query
+        time and the result rows are None if the rule executed no query.
+    """
+
+    rule_code: str
+    rule_group: str
+    iteration: int
+    wall_time: float = 0.0
+    query_time: float | None = None
+    treatment_time: float = 0.0
+    result_rows: int | None = None
+    effective_moves: int = 0
+    redundant_moves: int = 0
+    gufo_closure_time: float = 0.0
+    incompleteness_entries: int = 0
+
+
+# Measures of the RuleExecutionProfile that are summed per rule
+PROFILE_MEASURES = ["wall_time", "query_time", "treatment_time", "result_rows", "effective_moves", "redundant_moves",
+                    "gufo_closure_time", "incompleteness_entries"]
+
+# Profiles of all rules' executions recorded since the last call of start_rules_profiling
+RULES_PROFILES: list[RuleExecutionProfile] = []
+
+# Profile of the rule being executed, if any, and number of nested gUFO closures in its execution
+_current_profile: RuleExecutionProfile | None = None
+_gufo_closure_depth = 0
+
+
+def start_rules_profiling() -> None:
+    """ Discards the profiles recorded in previous executions. """
+
+    global _current_profile
+
+    RULES_PROFILES.clear()
+    _current_profile = None
+
+
+def start_rule_profile(rule_code: str, rule_group: str, iteration: int) -> float:
+    """ Starts recording the profile of an execution of the received rule. Returns the execution's start time. """
+
+    global _current_profile, _gufo_closure_depth
+
+    _current_profile = RuleExecutionProfile(rule_code, rule_group, iteration)
+    _gufo_closure_depth = 0
+
+    return time.perf_counter()
+
+
+def stop_rule_profile(start_time: float) -> None:
+    """ Concludes the profile of the rule's execution started at the received time (see start_rule_profile). """
+
+    global _current_profile
+
+    _current_profile.wall_time = time.perf_counter() - start_time
+    _current_profile.treatment_time = _current_profile.wall_time - (_current_profile.query_time or 0.0)
+    RULES_PROFILES.append(_current_profile)
+    _current_profile = None
+
+
+def record_query(query_time: float, number_rows: int) -> None:
+    """ Records the time and the number of result rows of a query of the rule being profiled. """
+
+    if _current_profile is not None:
+        _current_profile.query_time = (_current_profile.query_time or 0.0) + query_time
+        _current_profile.result_rows = (_current_profile.result_rows or 0) + number_rows
+
+
+def record_move(is_effective: bool) -> None:
+    """ Records a move requested by the rule being profiled. Moves whose classification was already in the destination
+        list are redundant. Moves requested by the gUFO rules are part of the gUFO closure and are not recorded.
+    """
+
+    if _current_profile is None or _gufo_closure_depth:
+        return
+
+    if is_effective:
+        _current_profile.effective_moves += 1
+    else:
+        _current_profile.redundant_moves += 1
+
+
+def record_incompleteness() -> None:
+    """ Records an incompleteness entry registered by the rule being profiled. """
+
+    if _current_profile is not None:
+        _current_profile.incompleteness_entries += 1
+
+
+def start_gufo_closure() -> float | None:
+    """ Starts measuring a gUFO closure triggered by a move. Returns its start time or None if no rule is profiled. """
+
+    global _gufo_closure_depth
+
+    if _current_profile is None:
+        return None
+
+    _gufo_closure_depth += 1
+
+    return time.perf_counter()
+
+
+def stop_gufo_closure(start_time: float | None) -> None:
+    """ Concludes the gUFO closure started at the received time (see start_gufo_closure). The time of nested closures
+        (i.e., triggered by moves of the gUFO rules) is already part of the outermost one.
+    """
+
+    global _gufo_closure_depth
+
+    if start_time is None or _current_profile is None:
+        return
+
+    _gufo_closure_depth -= 1
+
+    if not _gufo_closure_depth:
+        _current_profile.gufo_closure_time += time.perf_counter() - start_time
+
+
+def profiled_query(query_function):
+    """ Decorator of the native queries, which records their time and their number of result rows. """
+
+    @functools.wraps(query_function)
+    def query_wrapper(*query_args, **query_kwargs):
+        if _current_profile is None:
+            return query_function(*query_args, **query_kwargs)
+
+        start_time = time.perf_counter()
+        query_result = query_function(*query_args, **query_kwargs)
+        record_query(time.perf_counter() - start_time, len(query_result))
+
+        return query_result
+
+    return query_wrapper
+
+
+def get_rules_profiles_summary() -> list[dict]:
+    """ Returns the recorded profiles summed per rule, sorted by the rules' total wall time (descending). Measures that
+        are None in all executions of a rule are also None in its summary.
+    """
+
+    summary = {}
+
+    for profile in RULES_PROFILES:
+        rule_summary = summary.get(profile.rule_code)
+
+        if rule_summary is None:
+            rule_summary = {"rule_code": profile.rule_code, "rule_group": profile.rule_group, "executions": 0}
+            rule_summary |= {measure: None for measure in PROFILE_MEASURES}
+            summary[profile.rule_code] = rule_summary
+
+        rule_summary["executions"] += 1
+        for measure in PROFILE_MEASURES:
+            measure_value = getattr(profile, measure)
+            if measure_value is not None:
+                rule_summary[measure] = (rule_summary[measure] or 0) + measure_value
+
+    return sorted(summary.values(), key=lambda rule_summary: rule_summary["wall_time"], reverse=True)
+
+
+def print_rules_profiles() -> None:
+    """ Prints the summary of the recorded profiles per rule as a table, sorted by the rules' total wall time. """
+
+    columns = [("Rule", "rule_code"), ("Group", "rule_group"), ("Exec", "executions"), ("Wall (s)", "wall_time"),
+               ("Query (s)", "query_time"), ("Treat (s)", "treatment_time"), ("Rows", "result_rows"),
+               ("Moves", "effective_moves"), ("Redundant", "redundant_moves"), ("gUFO (s)", "gufo_closure_time"),
+               ("Incompl.", "incompleteness_entries")]
+
+    pretty_table = PrettyTable([title for title, _ in columns])
+
+    for rule_summary in get_rules_profiles_summary():
+        pretty_table.add_row(["N/A" if rule_summary[measure] is None
+                              else round(rule_summary[measure], 4) if isinstance(rule_summary[measure], float)
+                              else rule_summary[measure] for _, measure in columns])
+
+    pretty_table.align = "r"
+    pretty_table.align["Rule"] = "l"
+    pretty_table.align["Group"] = "l"
+    pretty_table.set_style(SINGLE_BORDER)
+
+    print("\nRULES PROFILING (sorted by total wall time):")
+    print(pretty_table.get_string())
+
+
+def save_rules_profiles(end_date_time: str) -> None:
+    """ Saves the recorded profiles (per execution and summed per rule) into a JSON file in the results directory.
+
+    :param end_date_time: String containing the software's execution end date and time.
+    :type end_date_time: str
+    """
+
+    results_directory = "results"
+    loaded_file_name = Path(args.ARGUMENTS["ontology_path"]).stem
+
+    create_directory_if_not_exists(results_directory)
+
+    output_file_path = os.path.join(os.getcwd(), results_directory,
+                                    f"{loaded_file_name}-{end_date_time}-rules-profiling.json")
+
+    profiling_content = {"rules": get_rules_profiles_summary(),
+                         "executions": [asdict(profile) for profile in RULES_PROFILES]}
+
+    try:
+        with open(output_file_path, "w", encoding="utf-8") as output_file:
+            json.dump(profiling_content, output_file, indent=2)
+    except OSError as error:
+        file_description = f"rules profiling file"
+        report_error_io_write(output_file_path, file_description, error)
+
+    LOGGER.info(f"Rules profiling file saved. Access it in {output_file_path}.")
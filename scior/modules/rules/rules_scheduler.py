@@ -0,0 +1,368 @@
+""" Dependency-aware scheduler of the rules executed in loop (i.e., rules of the groups AUX, UFO All, UFO Unique,
+    UFO Some and UFO CWA).
+
+    The rules' dependency graph has an edge from each rule to all rules that read a gUFO classification or a graph
+    predicate that it may write. As every classification move triggers the gUFO rules, the classifications written by a
+    rule are expanded with all classifications that the gUFO rules may conclude from them. The rules are executed in the
+    topological order of the graph's strongly connected components and, inside each component, in declaration order.
+
+    A rule is skipped when none of its inputs (read set) was changed since the ontology graph update that preceded its
+    previous execution, as it would produce the same results already obtained. Executed rules evaluate only the
+    bindings affected by the classes changed since this same update (see RulesDelta). Additionally, the rules of group
+    UFO Some treat again only the results whose candidate sets changed since their previous treatment (see
+    CandidateSets).
+"""
+import heapq
+import inspect
+
+from rdflib import Graph
+
+import scior.modules.initialization_arguments as args
+from scior.modules.graph_ontology import update_ontology_graph_with_gufo
+from scior.modules.logger_config import initialize_logger
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClassList
+from scior.modules.problems_treatment.treat_errors import report_error_end_of_switch
+from scior.modules.problems_treatment.treat_incomplete import IncompletenessEntry
+from scior.modules.resources_gufo import SCIOR_NAMESPACE
+from scior.modules.rules.rule_delta_definitions import RulesDelta
+from scior.modules.rules.rule_group_aux import AUX_RULES
+from scior.modules.rules.rule_group_cwa import UFO_CWA_RULES
+from scior.modules.rules.rule_group_ufo_all import UFO_ALL_RULES
+from scior.modules.rules.rule_group_ufo_some import UFO_SOME_RULES
+from scior.modules.rules.rule_group_ufo_unique import UFO_UNIQUE_RULES
+from scior.modules.rules.rule_loop_group_gufo import GUFO_ALL_RULES
+from scior.modules.rules.rule_scheduler_definitions import CandidateSets, RuleDeclaration
+from scior.modules.rules.rules_profiling import start_rule_profile, stop_rule_profile
+from scior.modules.taxonomy_index import TaxonomyIndex
+
+LOGGER = initialize_logger()
+
+RULES_GROUPS_DECLARATIONS = {
+    "rule_group_aux": AUX_RULES,
+    "rule_group_ufo_all": UFO_ALL_RULES,
+    "rule_group_ufo_unique": UFO_UNIQUE_RULES,
+    "rule_group_ufo_some": UFO_SOME_RULES,
+    "rule_group_ufo_cwa": UFO_CWA_RULES
+}
+
+
+def expand_written_items(written_items: list[str]) -> set[str]:
+    """ Expands the items written by a rule with all gUFO classifications that the gUFO rules may conclude when any of
+    the written classifications is moved.
+
+    :param written_items: gUFO classifications and graph predicates written by a rule.
+    :type written_items: list[str]
+    :return: Set with the written items and all classifications that may be concluded from them.
+    :rtype: set[str]
+    """
+
+    expanded_items = set(written_items)
+    modified = True
+
+    while modified:
+        modified = False
+
+        for gufo_rule in GUFO_ALL_RULES:
+            premises = set(gufo_rule.is_premises + gufo_rule.not_premises)
+            conclusions = set(gufo_rule.is_conclusions + gufo_rule.not_conclusions)
+
+            if premises & expanded_items and not conclusions <= expanded_items:
+                expanded_items |= conclusions
+                modified = True
+
+    return expanded_items
+
+
+def build_rules_dependency_graph(rule_declarations: list[RuleDeclaration]) -> dict[str, list[str]]:
+    """ Creates the rules' dependency graph, in which each rule has an edge to all rules reading any item it may write.
+
+    :param rule_declarations: Declarations of all rules to be scheduled.
+    :type rule_declarations: list[RuleDeclaration]
+    :return: Dictionary mapping each rule code to the codes of the rules that depend on it, in declaration order.
+    :rtype: dict[str, list[str]]
+    """
+
+    dependency_graph = {}
+
+    for writer_rule in rule_declarations:
+        written_items = expand_written_items(writer_rule.writes)
+        dependency_graph[writer_rule.rule_code] = [reader_rule.rule_code for reader_rule in rule_declarations
+                                                   if written_items & set(reader_rule.reads)]
+
+    return dependency_graph
+
+
+def get_strongly_connected_components(dependency_graph: dict[str, list[str]]) -> list[list[str]]:
+    """ Calculates the strongly connected components of the dependency graph using Tarjan's algorithm.
+
+    :param dependency_graph: Dictionary mapping each rule code to the codes of the rules that depend on it.
+    :type dependency_graph: dict[str, list[str]]
+    :return: List of components (lists of rule codes), in reverse topological order.
+    :rtype: list[list[str]]
+    """
+
+    indexes = {}
+    low_links = {}
+    stack = []
+    on_stack = set()
+    components = []
+
+    def visit(rule_code: str) -> None:
+        indexes[rule_code] = len(indexes)
+        low_links[rule_code] = indexes[rule_code]
+        stack.append(rule_code)
+        on_stack.add(rule_code)
+
+        for dependent_code in dependency_graph[rule_code]:
+            if dependent_code not in indexes:
+                visit(dependent_code)
+                low_links[rule_code] = min(low_links[rule_code], low_links[dependent_code])
+            elif dependent_code in on_stack:
+                low_links[rule_code] = min(low_links[rule_code], indexes[dependent_code])
+
+        if low_links[rule_code] == indexes[rule_code]:
+            component = []
+            while True:
+                component_code = stack.pop()
+                on_stack.discard(component_code)
+                component.append(component_code)
+                if component_code == rule_code:
+                    break
+            components.append(component)
+
+    for rule_code in dependency_graph:
+        if rule_code not in indexes:
+            visit(rule_code)
+
+    return components
+
+
+def order_rules_declarations(rule_declarations: list[RuleDeclaration]) -> list[RuleDeclaration]:
+    """ Orders the rules in the topological order of the strongly connected components of their dependency graph.
+    Independent components are ordered by their first rule in declaration order and rules inside each component are
+    kept in declaration order, so that the declaration order is kept whenever it respects the dependencies.
+
+    :param rule_declarations: Declarations of all rules to be scheduled, in declaration order.
+    :type rule_declarations: list[RuleDeclaration]
+    :return: Declarations of all rules in their execution order.
+    :rtype: list[RuleDeclaration]
+    """
+
+    declaration_positions = {rule_declaration.rule_code: position
+                             for position, rule_declaration in enumerate(rule_declarations)}
+    dependency_graph = build_rules_dependency_graph(rule_declarations)
+    components = get_strongly_connected_components(dependency_graph)
+
+    component_of_rule = {}
+    for component_number, component in enumerate(components):
+        component.sort(key=lambda rule_code: declaration_positions[rule_code])
+        for rule_code in component:
+            component_of_rule[rule_code] = component_number
+
+    # Edges and in-degrees of the condensed (acyclic) graph
+    component_successors = [set() for _ in components]
+    in_degrees = [0] * len(components)
+
+    for rule_code, dependent_codes in dependency_graph.items():
+        for dependent_code in dependent_codes:
+            source_component = component_of_rule[rule_code]
+            target_component = component_of_rule[dependent_code]
+            if source_component != target_component and target_component not in component_successors[source_component]:
+                component_successors[source_component].add(target_component)
+                in_degrees[target_component] += 1
+
+    # Kahn's algorithm, prioritizing the component whose first rule is declared first
+    ready_components = [(declaration_positions[component[0]], component_number)
+                        for component_number, component in enumerate(components) if in_degrees[component_number] == 0]
+    heapq.heapify(ready_components)
+    ordered_codes = []
+
+    while ready_components:
+        _, component_number = heapq.heappop(ready_components)
+        ordered_codes.extend(components[component_number])
+
+        for successor_component in component_successors[component_number]:
+            in_degrees[successor_component] -= 1
+            if in_degrees[successor_component] == 0:
+                heapq.heappush(ready_components,
+                               (declaration_positions[components[successor_component][0]], successor_component))
+
+    return [rule_declarations[declaration_positions[rule_code]] for rule_code in ordered_codes]
+
+
+def switch_rule_execution(rule_declaration: RuleDeclaration, ontology_dataclass_list: OntologyDataClassList,
+                          ontology_graph: Graph, incompleteness_stack: list[IncompletenessEntry],
+                          rules_delta: RulesDelta | None, taxonomy_index: TaxonomyIndex | None,
+                          candidate_sets: CandidateSets | None = None) -> None:
+    """ A switch function that calls the declared rule with the arguments required by its group.
+        AUXILIARY FUNCTION ONLY! MUST NOT BE USED OUTSIDE CLASS RulesScheduler.
+    """
+
+    rule_group_code = rule_declaration.rule_group
+
+    if rule_group_code == "rule_group_aux":
+        ontology_graph.bind("scior", SCIOR_NAMESPACE)
+        rule_declaration.rule_function(ontology_dataclass_list, ontology_graph, taxonomy_index)
+
+    elif rule_group_code in ["rule_group_ufo_all", "rule_group_ufo_cwa"]:
+        rule_declaration.rule_function(ontology_dataclass_list, ontology_graph, rules_delta, taxonomy_index)
+
+    elif rule_group_code in ["rule_group_ufo_unique", "rule_group_ufo_some"]:
+        rule_declaration.rule_function(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta,
+                                       taxonomy_index, candidate_sets)
+
+    else:
+        current_function = inspect.stack()[0][3]
+        report_error_end_of_switch(rule_group_code, current_function)
+
+
+class RulesScheduler(object):
+    """ Executes, at each iteration of the rules loop, the rules of the received groups in their dependency-aware order.
+
+        The ontology graph is updated with the known gUFO classifications after each sequence of rules of the same group
+        (i.e., after each rule group, when the declaration order is kept) in which at least one rule was executed.
+
+        If a TaxonomyIndex is received, the rules are evaluated over it (instead of using SPARQL queries over the
+        ontology graph) and it is updated together with the ontology graph.
+
+        The scheduler counts the executed and the skipped rule invocations. When the rules profiling is selected, each
+        executed invocation is also profiled (see rules_profiling).
+    """
+
+    def __init__(self, list_rules_groups: list[str], taxonomy_index: TaxonomyIndex | None = None):
+        rule_declarations = []
+
+        for rule_group in list_rules_groups:
+            if rule_group not in RULES_GROUPS_DECLARATIONS:
+                current_function = inspect.stack()[0][3]
+                report_error_end_of_switch(rule_group, current_function)
+
+            # The rules of group UFO CWA are only executed when using the Closed-World Assumption
+            if rule_group == "rule_group_ufo_cwa" and not args.ARGUMENTS["is_cwa"]:
+                continue
+
+            rule_declarations.extend(RULES_GROUPS_DECLARATIONS[rule_group])
+
+        self.execution_order = order_rules_declarations(rule_declarations)
+        self.taxonomy_index = taxonomy_index
+        self.executed_iterations = 0
+        self.executed_invocations = 0
+        self.skipped_invocations = 0
+        # Number of gUFO classification triples written into the ontology graph after each rule group
+        self.synced_triples = {}
+
+        # Changes journal position and changed items counters at the last ontology graph update
+        self._last_update_snapshot = None
+        # Position of the is_type classifications journal at the last ontology graph update
+        self._last_types_position = None
+        # Snapshot of the last ontology graph update performed before the previous execution of each rule
+        self._rules_snapshots = {}
+        # Candidate sets of the results treated by each rule of groups UFO Unique and UFO Some
+        self._candidate_sets = {rule_declaration.rule_code: CandidateSets() for rule_declaration in rule_declarations
+                                if rule_declaration.rule_group in ["rule_group_ufo_unique", "rule_group_ufo_some"]}
+
+        LOGGER.debug(f"Rules scheduled in the order: {[rule.rule_code for rule in self.execution_order]}.")
+
+    def _execute_rule(self, rule_declaration: RuleDeclaration, ontology_dataclass_list: OntologyDataClassList,
+                      ontology_graph: Graph, incompleteness_stack: list[IncompletenessEntry]) -> bool:
+        """ Executes the received rule if any of its inputs was changed since its previous execution.
+            Returns True if the rule was executed and False if it was skipped.
+        """
+
+        previous_snapshot = self._rules_snapshots.get(rule_declaration.rule_code)
+        self._rules_snapshots[rule_declaration.rule_code] = self._last_update_snapshot
+
+        if previous_snapshot is None:
+            rules_delta = None
+        else:
+            previous_position, previous_counters = previous_snapshot
+            current_counters = ontology_dataclass_list.changed_items_counters
+
+            if all(current_counters.get(item, 0) == previous_counters.get(item, 0) for item in rule_declaration.reads):
+                LOGGER.debug(f"No inputs of rule {rule_declaration.rule_code} changed since its previous execution. "
+                             f"Skipping it.")
+                self.skipped_invocations += 1
+                return False
+
+            rules_delta = RulesDelta(ontology_dataclass_list, ontology_graph, previous_position, self.taxonomy_index)
+
+        if args.ARGUMENTS["is_rules_profiling"]:
+            start_time = start_rule_profile(rule_declaration.rule_code, rule_declaration.rule_group,
+                                            self.executed_iterations)
+
+        switch_rule_execution(rule_declaration, ontology_dataclass_list, ontology_graph, incompleteness_stack,
+                              rules_delta, self.taxonomy_index, self._candidate_sets.get(rule_declaration.rule_code))
+
+        if args.ARGUMENTS["is_rules_profiling"]:
+            stop_rule_profile(start_time)
+
+        self.executed_invocations += 1
+        return True
+
+    def _update_ontology_graph(self, ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph,
+                               rule_group: str) -> None:
+        """ Updates the ontology graph (and the taxonomy index, if used) with the known gUFO classifications and records
+            the update's snapshot and the number of triples synced for the rule group.
+        """
+
+        # The is_type lists only grow, hence after the first update only the new classifications must be written
+        if self._last_types_position is None:
+            new_types = None
+        else:
+            new_types = ontology_dataclass_list.get_new_types_since(self._last_types_position)
+        self._last_types_position = ontology_dataclass_list.get_types_journal_position()
+
+        number_synced = update_ontology_graph_with_gufo(ontology_dataclass_list, ontology_graph, new_types)
+        self.synced_triples[rule_group] = self.synced_triples.get(rule_group, 0) + number_synced
+
+        if self.taxonomy_index is not None:
+            if new_types is None:
+                self.taxonomy_index.add_dataclasses_types(ontology_dataclass_list)
+            else:
+                for class_id, gufo_type in new_types:
+                    self.taxonomy_index.add_type(class_id, gufo_type)
+
+        self._last_update_snapshot = (ontology_dataclass_list.get_journal_position(),
+                                      dict(ontology_dataclass_list.changed_items_counters))
+
+    def execute_iteration(self, ontology_dataclass_list: OntologyDataClassList, ontology_graph: Graph,
+                          incompleteness_stack: list[IncompletenessEntry]) -> None:
+        """ Executes (or skips) once all scheduled rules in their execution order.
+
+        :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal
+        lists.
+        :type ontology_dataclass_list: OntologyDataClassList
+        :param ontology_graph: Updated ontology's working (RDFLib) graph on memory to be manipulated.
+        :type ontology_graph: Graph
+        :param incompleteness_stack: List of identified incompleteness to be updated if necessary.
+        :type incompleteness_stack: list[IncompletenessEntry]
+        """
+
+        self.executed_iterations += 1
+        position = 0
+
+        while position < len(self.execution_order):
+            rule_group = self.execution_order[position].rule_group
+            group_executed = False
+
+            LOGGER.debug(f"Accessing rule {rule_group} ...")
+
+            if args.ARGUMENTS["is_debug"]:
+                ontology_dataclass_list.start_change_log()
+
+            # Executing the sequence of scheduled rules of the same group
+            while position < len(self.execution_order) and self.execution_order[position].rule_group == rule_group:
+                if self._execute_rule(self.execution_order[position], ontology_dataclass_list, ontology_graph,
+                                      incompleteness_stack):
+                    group_executed = True
+                position += 1
+
+            if group_executed:
+                self._update_ontology_graph(ontology_dataclass_list, ontology_graph, rule_group)
+
+            if args.ARGUMENTS["is_debug"]:
+                group_changes = ontology_dataclass_list.stop_change_log()
+                LOGGER.debug(f"Rule group {rule_group} performed {len(group_changes)} modifications: "
+                             f"{group_changes}.")
+
+            LOGGER.debug(f"Rule {rule_group} successfully performed.")
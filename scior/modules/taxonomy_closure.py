@@ -0,0 +1,298 @@
+""" Closure engine for the reflexive and transitive rdfs:subClassOf relation (rules RB01 and RB02).
+
+    The direct rdfs:subClassOf relations of the graph are condensed into their strongly connected components (classes in
+    a cycle are equivalent), which form an acyclic graph. The reachability of each component is then calculated once,
+    following the components' topological order, as a bitset (a Python int) in which the bit i is set if the
+    component i is reachable. Hence, the closure is obtained in a single pass, without the materialization of the
+    n^2 triples it represents, which is only optionally performed.
+
+    The closure also answers on demand the relation scior:shareSuperClass (rule RB03), which holds between two nodes
+    whose superclasses intersect.
+"""
+
+from rdflib import Graph, OWL, RDF, RDFS
+
+from scior.modules.logger_config import initialize_logger
+from scior.modules.uri_table import UriTable
+
+LOGGER = initialize_logger()
+
+
+def get_bitset_positions(bitset: int):
+    """ Generator that yields the positions of all bits set in the received bitset, in increasing order. """
+
+    while bitset:
+        lowest_bit = bitset & -bitset
+        yield lowest_bit.bit_length() - 1
+        bitset ^= lowest_bit
+
+
+class TaxonomyClosure(object):
+    """ Queryable reflexive and transitive closure of the rdfs:subClassOf relation of an ontology graph.
+
+        The closure reproduces the relations obtained by the rules of group BASE: all direct rdfs:subClassOf relations
+        of the graph, plus the reflexive relation of every owl:Class (RB01) and the relation between every pair of
+        owl:Class instances connected by a path of rdfs:subClassOf relations (RB02).
+
+        The nodes' ids are the ones of the received UriTable, in which the nodes not registered yet are included.
+    """
+
+    def __init__(self, ontology_graph: Graph, uri_table: UriTable | None = None):
+        self.uri_table = UriTable() if uri_table is None else uri_table
+
+        # Original (RDFLib) nodes and their direct superclasses and subclasses, indexed by the nodes' ids. All nodes
+        # already registered in the URI table are part of the closure.
+        self.nodes = []
+        self.direct_superclasses = []
+        self.direct_subclasses = []
+        self.owl_classes = set()
+        self._extend_nodes(len(self.uri_table))
+
+        for ontology_class in ontology_graph.subjects(RDF.type, OWL.Class):
+            self.owl_classes.add(self._get_node_id(ontology_class))
+
+        for subclass, _, superclass in ontology_graph.triples((None, RDFS.subClassOf, None)):
+            subclass_id = self._get_node_id(subclass)
+            superclass_id = self._get_node_id(superclass)
+            self.direct_superclasses[subclass_id].add(superclass_id)
+            self.direct_subclasses[superclass_id].add(subclass_id)
+
+        # Component of each node, owl:Class instances of each component and the reachable components' bitsets
+        self.node_component = [0] * len(self.nodes)
+        self.component_classes = []
+        self.component_reachability = []
+        self._component_co_reachability = None
+        self._subclass_ids_cache = {}
+
+        self._calculate_components()
+        self._calculate_reachability()
+
+    def _extend_nodes(self, number_nodes: int) -> None:
+        """ Includes in the closure the URI table's nodes, up to the received number of nodes. """
+
+        for node_id in range(len(self.nodes), number_nodes):
+            self.nodes.append(self.uri_table.get_node(node_id))
+            self.direct_superclasses.append(set())
+            self.direct_subclasses.append(set())
+
+    def _get_node_id(self, node) -> int:
+        """ Returns the id of the received node, registering it if it does not exist. """
+
+        node_id = self.uri_table.get_id(node)
+
+        if node_id >= len(self.nodes):
+            self._extend_nodes(node_id + 1)
+
+        return node_id
+
+    def _calculate_components(self) -> None:
+        """ Calculates the strongly connected components of the direct relations using an iterative version of Tarjan's
+            algorithm, so that deep taxonomies do not reach Python's recursion limit. The components are numbered in
+            the order they are concluded, which is a reverse topological order: every component reachable from a
+            component has a smaller number.
+        """
+
+        indexes = [-1] * len(self.nodes)
+        low_links = [0] * len(self.nodes)
+        on_stack = [False] * len(self.nodes)
+        stack = []
+        next_index = 0
+
+        for root_id in range(len(self.nodes)):
+            if indexes[root_id] != -1:
+                continue
+
+            # Each frame has a node and an iterator over its direct superclasses
+            indexes[root_id] = low_links[root_id] = next_index
+            next_index += 1
+            stack.append(root_id)
+            on_stack[root_id] = True
+            frames = [(root_id, iter(self.direct_superclasses[root_id]))]
+
+            while frames:
+                node_id, superclasses_iterator = frames[-1]
+                visited_new_node = False
+
+                for superclass_id in superclasses_iterator:
+                    if indexes[superclass_id] == -1:
+                        indexes[superclass_id] = low_links[superclass_id] = next_index
+                        next_index += 1
+                        stack.append(superclass_id)
+                        on_stack[superclass_id] = True
+                        frames.append((superclass_id, iter(self.direct_superclasses[superclass_id])))
+                        visited_new_node = True
+                        break
+                    if on_stack[superclass_id]:
+                        low_links[node_id] = min(low_links[node_id], indexes[superclass_id])
+
+                if visited_new_node:
+                    continue
+
+                frames.pop()
+
+                if frames:
+                    parent_id = frames[-1][0]
+                    low_links[parent_id] = min(low_links[parent_id], low_links[node_id])
+
+                if low_links[node_id] == indexes[node_id]:
+                    component_number = len(self.component_classes)
+                    component_classes = []
+
+                    while True:
+                        member_id = stack.pop()
+                        on_stack[member_id] = False
+                        self.node_component[member_id] = component_number
+                        if member_id in self.owl_classes:
+                            component_classes.append(member_id)
+                        if member_id == node_id:
+                            break
+
+                    self.component_classes.append(component_classes)
+
+    def _calculate_reachability(self) -> None:
+        """ Calculates the bitset of reachable components of each component, following the components' numbering. """
+
+        component_successors = [set() for _ in self.component_classes]
+
+        for node_id, superclasses in enumerate(self.direct_superclasses):
+            for superclass_id in superclasses:
+                component_successors[self.node_component[node_id]].add(self.node_component[superclass_id])
+
+        for component_number, successors in enumerate(component_successors):
+            reachability = 1 << component_number
+            for successor in successors:
+                if successor != component_number:
+                    reachability |= self.component_reachability[successor]
+            self.component_reachability.append(reachability)
+
+    def _get_component_co_reachability(self) -> list[int]:
+        """ Returns, for each component, the bitset of the components from which it is reachable. Calculated on demand.
+        """
+
+        if self._component_co_reachability is None:
+            self._component_co_reachability = [0] * len(self.component_reachability)
+            for component_number, reachability in enumerate(self.component_reachability):
+                for reachable_component in get_bitset_positions(reachability):
+                    self._component_co_reachability[reachable_component] |= 1 << component_number
+
+        return self._component_co_reachability
+
+    def get_node_id(self, node) -> int | None:
+        """ Returns the id of the received RDFLib node or None if it is not part of the taxonomy. """
+
+        node_id = self.uri_table.get_id(node, create=False)
+
+        return node_id if node_id is not None and node_id < len(self.nodes) else None
+
+    def is_subclass_of(self, subclass_node, superclass_node) -> bool:
+        """ Informs if the relation rdfs:subClassOf(subclass_node, superclass_node) is part of the closure.
+
+        :param subclass_node: RDFLib node of the (possible) subclass.
+        :param superclass_node: RDFLib node of the (possible) superclass.
+        :return: True if the relation is part of the closure and False otherwise.
+        :rtype: bool
+        """
+
+        subclass_id = self.get_node_id(subclass_node)
+        superclass_id = self.get_node_id(superclass_node)
+
+        if subclass_id is None or superclass_id is None:
+            return False
+
+        if superclass_id in self.direct_superclasses[subclass_id]:
+            return True
+
+        if subclass_id not in self.owl_classes or superclass_id not in self.owl_classes:
+            return False
+
+        reachability = self.component_reachability[self.node_component[subclass_id]]
+        return bool(reachability >> self.node_component[superclass_id] & 1)
+
+    def get_superclass_ids(self, node_id: int) -> set[int]:
+        """ Returns the ids of all nodes y for which the relation rdfs:subClassOf(node, y) is part of the closure. """
+
+        superclass_ids = set(self.direct_superclasses[node_id])
+
+        if node_id in self.owl_classes:
+            for reachable_component in get_bitset_positions(self.component_reachability[self.node_component[node_id]]):
+                superclass_ids.update(self.component_classes[reachable_component])
+
+        return superclass_ids
+
+    def get_subclass_ids(self, node_id: int) -> set[int]:
+        """ Returns the ids of all nodes y for which the relation rdfs:subClassOf(y, node) is part of the closure.
+            The returned sets are memoized and must not be modified.
+        """
+
+        subclass_ids = self._subclass_ids_cache.get(node_id)
+
+        if subclass_ids is None:
+            subclass_ids = set(self.direct_subclasses[node_id])
+
+            if node_id in self.owl_classes:
+                co_reachability = self._get_component_co_reachability()[self.node_component[node_id]]
+                for reaching_component in get_bitset_positions(co_reachability):
+                    subclass_ids.update(self.component_classes[reaching_component])
+
+            self._subclass_ids_cache[node_id] = subclass_ids
+
+        return subclass_ids
+
+    def shares_super_class(self, node_id: int, other_node_id: int) -> bool:
+        """ Informs if the relation shareSuperClass(node, other_node) holds, i.e., if their superclasses intersect. """
+
+        return not self.get_superclass_ids(node_id).isdisjoint(self.get_superclass_ids(other_node_id))
+
+    def get_share_super_class_ids(self, node_id: int) -> set[int]:
+        """ Returns the ids of all nodes y for which the relation shareSuperClass(node, y) holds, i.e., all subclasses
+            of all superclasses of the node.
+        """
+
+        share_super_class_ids = set()
+
+        for superclass_id in self.get_superclass_ids(node_id):
+            share_super_class_ids |= self.get_subclass_ids(superclass_id)
+
+        return share_super_class_ids
+
+    def get_superclasses(self, node) -> list:
+        """ Returns the RDFLib nodes y for which the relation rdfs:subClassOf(node, y) is part of the closure. """
+
+        node_id = self.get_node_id(node)
+        if node_id is None:
+            return []
+        return [self.nodes[superclass_id] for superclass_id in self.get_superclass_ids(node_id)]
+
+    def get_subclasses(self, node) -> list:
+        """ Returns the RDFLib nodes y for which the relation rdfs:subClassOf(y, node) is part of the closure. """
+
+        node_id = self.get_node_id(node)
+        if node_id is None:
+            return []
+        return [self.nodes[subclass_id] for subclass_id in self.get_subclass_ids(node_id)]
+
+    def count_relations(self) -> int:
+        """ Returns the number of rdfs:subClassOf relations represented by the closure. """
+
+        return sum(len(self.get_superclass_ids(node_id)) for node_id in range(len(self.nodes)))
+
+
+def build_taxonomy_closure(ontology_graph: Graph, uri_table: UriTable | None = None) -> TaxonomyClosure:
+    """ Calculates the closure of the rdfs:subClassOf relations of the received graph.
+
+    :param ontology_graph: Ontology's working (RDFLib) graph.
+    :type ontology_graph: Graph
+    :param uri_table: Table whose ids are used for the closure's nodes. If None, a new table is created.
+    :type uri_table: UriTable | None
+    :return: Queryable reflexive and transitive closure of the graph's rdfs:subClassOf relations.
+    :rtype: TaxonomyClosure
+    """
+
+    LOGGER.debug("Calculating the closure of the rdfs:subClassOf relations...")
+
+    taxonomy_closure = TaxonomyClosure(ontology_graph, uri_table)
+
+    LOGGER.debug(f"Closure of the rdfs:subClassOf relations calculated for {len(taxonomy_closure.nodes)} nodes in "
+                 f"{len(taxonomy_closure.component_classes)} strongly connected components.")
+
+    return taxonomy_closure
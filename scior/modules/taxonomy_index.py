@@ -0,0 +1,462 @@
+""" Native (in-memory) index of the taxonomy contained in the ontology's working graph.
+
+    The index assigns an integer id to every node of the working graph's taxonomy and keeps adjacency sets for the
+    direct relations between them (rdfs:subClassOf and scior:shareSuperClass), the set of owl:Class instances and, for
+    every gUFO type, the set of nodes that have it as rdf:type. It mirrors exactly the triples of the working graph, so
+    that the rules evaluated over it produce the same bindings of the SPARQL queries over the graph. When built with a
+    taxonomy closure, the scior:shareSuperClass relation is not materialized and is answered by it. The scior:shareKind
+    relation is kept as the partition of the nodes that it induces (KindPartition), without materializing its pairs.
+
+    The nodes' ids are the ones of the execution's URI table (UriTable), shared with the dataclasses and the closure.
+"""
+
+from rdflib import Graph, OWL, RDF, RDFS, URIRef
+
+from scior.modules.logger_config import initialize_logger
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.resources_gufo import GUFO_NAMESPACE, SCIOR_NAMESPACE
+from scior.modules.taxonomy_closure import TaxonomyClosure
+from scior.modules.uri_table import UriTable
+
+LOGGER = initialize_logger()
+
+SCIOR_SHARE_KIND = URIRef(SCIOR_NAMESPACE + "shareKind")
+SCIOR_SHARE_SUPER_CLASS = URIRef(SCIOR_NAMESPACE + "shareSuperClass")
+
+
+class KindPartition(object):
+    """ Union-find partition of nodes (by their ids) in which the nodes related by scior:shareKind are in the same
+        block. Only nodes with scior:shareKind relations (i.e., subclasses of a Kind) are members of the partition.
+
+        As each Sortal has a single Kind, scior:shareKind is an equivalence relation and its blocks are the sets of
+        classes that have the same Kind. Two members share a Kind if and only if they have the same partition id. The
+        Kinds of each block are also kept, so that the relation is answered and its consequences (rule RX02) are
+        obtained without materializing its pairs.
+    """
+
+    def __init__(self):
+        # Parent of each member of the partition. The roots of the blocks are their own parents.
+        self.parents = {}
+
+        # Members and Kinds of each block, indexed by the block's root
+        self.members = {}
+        self.kinds = {}
+        self.kind_ids = set()
+
+        # Roots of the blocks whose members or Kinds changed since the last call of pop_changed_blocks
+        self.changed_roots = set()
+
+    def get_partition_id(self, node_id: int) -> int:
+        """ Returns the id of the block of the received node, i.e., the id of the block's root. Nodes that are not
+            members of the partition are alone in their blocks.
+        """
+
+        while True:
+            parent_id = self.parents.get(node_id, node_id)
+            if parent_id == node_id:
+                return node_id
+            # Path halving: each visited node is linked to its grandparent
+            grandparent_id = self.parents.get(parent_id, parent_id)
+            self.parents[node_id] = grandparent_id
+            node_id = grandparent_id
+
+    def _add_member(self, node_id: int) -> bool:
+        """ Includes the received node in the partition, alone in a new block. Returns True if it was not a member. """
+
+        if node_id in self.parents:
+            return False
+
+        self.parents[node_id] = node_id
+        self.members[node_id] = [node_id]
+        self.kinds[node_id] = []
+        self.changed_roots.add(node_id)
+
+        return True
+
+    def add_share_kind(self, node_x: int, node_y: int) -> bool:
+        """ Merges the blocks of the received nodes, which are related by scior:shareKind.
+            Returns True if the relation changed (i.e., if a node was not a member or if the blocks were distinct).
+        """
+
+        is_new_x = self._add_member(node_x)
+        is_new_y = self._add_member(node_y)
+
+        root_x = self.get_partition_id(node_x)
+        root_y = self.get_partition_id(node_y)
+
+        if root_x == root_y:
+            return is_new_x or is_new_y
+
+        # The smaller block is merged into the larger one, so that each node is moved a logarithmic number of times
+        if len(self.members[root_x]) < len(self.members[root_y]):
+            root_x, root_y = root_y, root_x
+
+        self.parents[root_y] = root_x
+        self.members[root_x].extend(self.members.pop(root_y))
+        self.kinds[root_x].extend(self.kinds.pop(root_y))
+        self.changed_roots.discard(root_y)
+        self.changed_roots.add(root_x)
+
+        return True
+
+    def add_kind_subclass(self, subclass_id: int, kind_id: int) -> bool:
+        """ Merges the blocks of the nodes of the relation rdfs:subClassOf(subclass, kind), in which kind is a Kind,
+            and registers the Kind in the resulting block. Returns True if the scior:shareKind relation changed.
+        """
+
+        is_changed = self.add_share_kind(subclass_id, kind_id)
+
+        if kind_id not in self.kind_ids:
+            self.kind_ids.add(kind_id)
+            kind_root = self.get_partition_id(kind_id)
+            self.kinds[kind_root].append(kind_id)
+            self.changed_roots.add(kind_root)
+
+        return is_changed
+
+    def shares_kind(self, node_x: int, node_y: int) -> bool:
+        """ Informs if the relation scior:shareKind(node_x, node_y) holds. """
+
+        return node_x in self.parents and node_y in self.parents and \
+            self.get_partition_id(node_x) == self.get_partition_id(node_y)
+
+    def get_block_members(self, node_id: int) -> list[int]:
+        """ Returns the ids of all nodes y for which the relation scior:shareKind(node, y) holds. """
+
+        if node_id not in self.parents:
+            return []
+
+        return self.members[self.get_partition_id(node_id)]
+
+    def pop_changed_blocks(self) -> list[tuple[list[int], list[int]]]:
+        """ Returns the members and the Kinds of the blocks changed since the last call and clears the changed blocks.
+        """
+
+        changed_blocks = [(self.members[root], self.kinds[root]) for root in self.changed_roots]
+        self.changed_roots = set()
+
+        return changed_blocks
+
+    def count_partitions(self, node_ids) -> int:
+        """ Returns the number of distinct blocks of the received nodes. """
+
+        return len({self.get_partition_id(node_id) for node_id in node_ids})
+
+
+class TaxonomyIndex(object):
+    """ Integer-id index of the nodes of the working graph's taxonomy and of their relations.
+
+        The relation sets of a node contain the ids of the nodes directly related to it in the graph. E.g.,
+        superclasses[x] has the ids of all nodes y for which the triple (x, rdfs:subClassOf, y) exists. As the rules of
+        group BASE make rdfs:subClassOf reflexive and transitive, these sets are, for classes, already closed.
+    """
+
+    def __init__(self, uri_table: UriTable | None = None):
+        self.uri_table = UriTable() if uri_table is None else uri_table
+
+        # Original (RDFLib) nodes, indexed by their ids
+        self.nodes = []
+
+        # Direct relations of each node, indexed by the node's id
+        self.superclasses = []
+        self.subclasses = []
+        self.share_super_class = []
+        self.share_super_class_inverse = []
+
+        # Ids of all owl:Class instances and of the nodes classified as each gUFO type (in short form, e.g., Kind)
+        self.owl_classes = set()
+        self.type_members = {}
+
+        # Blocks of the nodes related by scior:shareKind, updated when the relation is added
+        self.kind_partition = KindPartition()
+
+        # Ancestors closures already calculated. Cleared when a new rdfs:subClassOf relation is added.
+        self._ancestors_cache = {}
+
+        # Closure used for answering the scior:shareSuperClass relation when it is not materialized. Its node ids are
+        # the same of the index.
+        self.taxonomy_closure = None
+
+        # Aggregates of the classification states of the nodes' ancestors and descendants (see TypeAggregates),
+        # informed of the new rdfs:subClassOf relations
+        self.type_aggregates = None
+
+        # All nodes already registered in the URI table are part of the index
+        self._extend_nodes(len(self.uri_table))
+
+    def _extend_nodes(self, number_nodes: int) -> None:
+        """ Includes in the index the URI table's nodes, up to the received number of nodes. """
+
+        for node_id in range(len(self.nodes), number_nodes):
+            self.nodes.append(self.uri_table.get_node(node_id))
+            self.superclasses.append(set())
+            self.subclasses.append(set())
+            self.share_super_class.append(set())
+            self.share_super_class_inverse.append(set())
+
+    def get_node_id(self, node, create: bool = True) -> int | None:
+        """ Returns the id of the received node (or URI), creating it if it does not exist and create is True.
+
+        :param node: RDFLib node or URI string.
+        :param create: Indicates if a new id must be created for an unknown node.
+        :type create: bool
+        :return: Id of the node or None if the node is unknown and create is False.
+        :rtype: int | None
+        """
+
+        node_id = self.uri_table.get_id(node, create)
+
+        if node_id is not None and node_id >= len(self.nodes):
+            if not create:
+                return None
+            self._extend_nodes(node_id + 1)
+
+        return node_id
+
+    def __contains__(self, triple: tuple) -> bool:
+        """ Informs if the received triple of an indexed relation (rdfs:subClassOf, scior:shareSuperClass or
+            scior:shareKind) exists, in the same way as the 'in' operator of RDFLib graphs. The triple's subject and
+            object are the ids of the nodes.
+        """
+
+        subject_id, predicate, object_id = triple
+
+        if subject_id >= len(self.nodes) or object_id >= len(self.nodes):
+            return False
+
+        if predicate == RDFS.subClassOf:
+            return object_id in self.superclasses[subject_id]
+        if predicate == SCIOR_SHARE_SUPER_CLASS:
+            if self.taxonomy_closure is None:
+                return object_id in self.share_super_class[subject_id]
+            closure_size = len(self.taxonomy_closure.nodes)
+            return subject_id < closure_size and object_id < closure_size and \
+                self.taxonomy_closure.shares_super_class(subject_id, object_id)
+        if predicate == SCIOR_SHARE_KIND:
+            return self.kind_partition.shares_kind(subject_id, object_id)
+
+        return False
+
+    def get_share_super_class_ids(self, node_id: int) -> set[int]:
+        """ Returns the ids of all nodes y for which the relation scior:shareSuperClass(node, y) holds. The relation is
+            answered by the taxonomy closure, if used, or by the relations materialized in the graph.
+        """
+
+        if self.taxonomy_closure is None:
+            return self.share_super_class[node_id]
+
+        if node_id >= len(self.taxonomy_closure.nodes):
+            return set()
+
+        return self.taxonomy_closure.get_share_super_class_ids(node_id)
+
+    def get_type_members(self, gufo_type: str) -> set[int]:
+        """ Returns the ids of all nodes that have the received gUFO type as rdf:type. """
+
+        return self.type_members.get(gufo_type, set())
+
+    def add_triple(self, triple: tuple) -> bool:
+        """ Inserts into the index the relation represented by the received graph triple.
+            Triples whose predicates are not indexed are ignored.
+
+        :param triple: (subject, predicate, object) triple of the working graph.
+        :type triple: tuple
+        :return: True if the index was changed and False otherwise.
+        :rtype: bool
+        """
+
+        subject_node, predicate, object_node = triple
+
+        if predicate == RDF.type:
+            if object_node == OWL.Class:
+                subject_id = self.get_node_id(subject_node)
+                if subject_id in self.owl_classes:
+                    return False
+                self.owl_classes.add(subject_id)
+                return True
+            if isinstance(object_node, URIRef) and object_node.startswith(GUFO_NAMESPACE):
+                return self.add_type(self.get_node_id(subject_node), object_node[len(GUFO_NAMESPACE):])
+            return False
+
+        if predicate not in [RDFS.subClassOf, SCIOR_SHARE_SUPER_CLASS, SCIOR_SHARE_KIND]:
+            return False
+
+        return self.add_relation(self.get_node_id(subject_node), predicate, self.get_node_id(object_node))
+
+    def add_relation(self, subject_id: int, predicate: URIRef, object_id: int) -> bool:
+        """ Inserts into the index the relation (rdfs:subClassOf, scior:shareSuperClass or scior:shareKind) between the
+            nodes with the received ids. Returns True if the index was changed and False otherwise.
+        """
+
+        if predicate == RDFS.subClassOf:
+            relation, inverse_relation = self.superclasses, self.subclasses
+        elif predicate == SCIOR_SHARE_SUPER_CLASS:
+            relation, inverse_relation = self.share_super_class, self.share_super_class_inverse
+        elif predicate == SCIOR_SHARE_KIND:
+            return self.kind_partition.add_share_kind(subject_id, object_id)
+        else:
+            return False
+
+        if object_id in relation[subject_id]:
+            return False
+
+        relation[subject_id].add(object_id)
+        inverse_relation[object_id].add(subject_id)
+
+        if predicate == RDFS.subClassOf:
+            self._ancestors_cache.clear()
+            if self.type_aggregates is not None:
+                self.type_aggregates.add_subclass_relation(subject_id, object_id)
+
+        return True
+
+    def add_type(self, node_id: int, gufo_type: str) -> bool:
+        """ Registers the received gUFO type (in short form, e.g., Kind) as a rdf:type of the node with the received id.
+            Returns True if the index was changed and False otherwise.
+        """
+
+        members = self.type_members.setdefault(gufo_type, set())
+
+        if node_id in members:
+            return False
+
+        members.add(node_id)
+        return True
+
+    def add_dataclasses_types(self, ontology_dataclasses: list[OntologyDataClass]) -> None:
+        """ Registers all known gUFO types (is_type list) of the received dataclasses, mirroring the ontology graph
+            update performed by the function update_ontology_graph_with_gufo.
+
+        :param ontology_dataclasses: Dataclasses whose is_type lists must be registered.
+        :type ontology_dataclasses: list[OntologyDataClass]
+        """
+
+        for ontology_dataclass in ontology_dataclasses:
+            for gufo_type in ontology_dataclass.is_type:
+                self.add_type(ontology_dataclass.uri_id, gufo_type)
+
+    def get_superclass_ids(self, node_id: int) -> set[int]:
+        """ Returns the ids of the nodes y for which the triple (node, rdfs:subClassOf, y) exists. """
+        return self.superclasses[node_id]
+
+    def get_subclass_ids(self, node_id: int) -> set[int]:
+        """ Returns the ids of the nodes y for which the triple (y, rdfs:subClassOf, node) exists. """
+        return self.subclasses[node_id]
+
+    def get_ancestors(self, node_id: int) -> set[int]:
+        """ Returns the ids of all ancestors of the received node, i.e., of the reflexive and transitive closure of its
+            rdfs:subClassOf relations. Closures are memoized until a new rdfs:subClassOf relation is added.
+
+        :param node_id: Id of the node whose ancestors are requested.
+        :type node_id: int
+        :return: Set with the ids of the node and of all its direct and indirect superclasses.
+        :rtype: set[int]
+        """
+
+        ancestors = self._ancestors_cache.get(node_id)
+
+        if ancestors is None:
+            ancestors = {node_id}
+            pending_ids = [node_id]
+
+            while pending_ids:
+                for superclass_id in self.superclasses[pending_ids.pop()]:
+                    if superclass_id not in ancestors:
+                        ancestors.add(superclass_id)
+                        pending_ids.append(superclass_id)
+
+            self._ancestors_cache[node_id] = ancestors
+
+        return ancestors
+
+
+class GraphTaxonomyRelations(object):
+    """ View of the relations of the working graph that answers the 'in' operator for triples whose subject and object
+        are the ids of the nodes, the nodes' direct superclasses and subclasses and the scior:shareKind partition, in
+        the same way as the TaxonomyIndex. Used when the rules are evaluated using the SPARQL queries.
+    """
+
+    def __init__(self, ontology_graph: Graph, uri_table: UriTable):
+        self.ontology_graph = ontology_graph
+        self.uri_table = uri_table
+        self._kind_partition = None
+
+    @property
+    def kind_partition(self) -> KindPartition:
+        """ Partition induced by the graph's scior:shareKind relations, created on its first use. """
+
+        if self._kind_partition is None:
+            self._kind_partition = KindPartition()
+            for node_x, _, node_y in self.ontology_graph.triples((None, SCIOR_SHARE_KIND, None)):
+                self._kind_partition.add_share_kind(self.uri_table.get_id(node_x), self.uri_table.get_id(node_y))
+
+        return self._kind_partition
+
+    def __contains__(self, triple: tuple) -> bool:
+        subject_id, predicate, object_id = triple
+        graph_triple = (self.uri_table.get_node(subject_id), predicate, self.uri_table.get_node(object_id))
+        return graph_triple in self.ontology_graph
+
+    def get_superclass_ids(self, node_id: int) -> list[int]:
+        """ Returns the ids of the nodes y for which the triple (node, rdfs:subClassOf, y) exists. """
+
+        superclasses = self.ontology_graph.objects(self.uri_table.get_node(node_id), RDFS.subClassOf)
+        return [self.uri_table.get_id(superclass) for superclass in superclasses]
+
+    def get_subclass_ids(self, node_id: int) -> list[int]:
+        """ Returns the ids of the nodes y for which the triple (y, rdfs:subClassOf, node) exists. """
+
+        subclasses = self.ontology_graph.subjects(RDFS.subClassOf, self.uri_table.get_node(node_id))
+        return [self.uri_table.get_id(subclass) for subclass in subclasses]
+
+
+def get_taxonomy_relations(ontology_graph: Graph, uri_table: UriTable,
+                           taxonomy_index: TaxonomyIndex | None = None) -> TaxonomyIndex | GraphTaxonomyRelations:
+    """ Returns the structure in which the rules obtain the relations between nodes (by their ids): the taxonomy index,
+        if used, or a view of the ontology graph.
+    """
+
+    return GraphTaxonomyRelations(ontology_graph, uri_table) if taxonomy_index is None else taxonomy_index
+
+
+def build_taxonomy_index(ontology_graph: Graph, taxonomy_closure: TaxonomyClosure | None = None,
+                         uri_table: UriTable | None = None) -> TaxonomyIndex:
+    """ Creates the native taxonomy index of the received working graph.
+
+    :param ontology_graph: Ontology's working (RDFLib) graph, after the execution of the rules of group BASE.
+    :type ontology_graph: Graph
+    :param taxonomy_closure: Closure of the graph's rdfs:subClassOf relations, if not materialized in the graph. Also
+    used for answering the scior:shareSuperClass relation.
+    :type taxonomy_closure: TaxonomyClosure | None
+    :param uri_table: Table whose ids are used for the index's nodes. If a closure is received, its table is used.
+    :type uri_table: UriTable | None
+    :return: Taxonomy index with all indexed relations of the graph.
+    :rtype: TaxonomyIndex
+    """
+
+    LOGGER.debug("Building the native taxonomy index of the ontology graph...")
+
+    # Using the closure's table, so that the ids of the nodes in the index and in the closure are the same
+    if taxonomy_closure is not None:
+        uri_table = taxonomy_closure.uri_table
+
+    taxonomy_index = TaxonomyIndex(uri_table)
+    taxonomy_index.taxonomy_closure = taxonomy_closure
+
+    for indexed_predicate in [RDF.type, RDFS.subClassOf, SCIOR_SHARE_SUPER_CLASS, SCIOR_SHARE_KIND]:
+        for triple in ontology_graph.triples((None, indexed_predicate, None)):
+            taxonomy_index.add_triple(triple)
+
+    # The closure's relations are inserted directly by their ids
+    if taxonomy_closure is not None:
+        for subclass_id in range(len(taxonomy_closure.nodes)):
+            superclass_ids = taxonomy_closure.get_superclass_ids(subclass_id)
+            taxonomy_index.superclasses[subclass_id] |= superclass_ids
+            for superclass_id in superclass_ids:
+                taxonomy_index.subclasses[superclass_id].add(subclass_id)
+
+    LOGGER.debug(f"Native taxonomy index built with {len(taxonomy_index.nodes)} nodes and "
+                 f"{sum(len(superclasses) for superclasses in taxonomy_index.superclasses)} "
+                 f"rdfs:subClassOf relations.")
+
+    return taxonomy_index
@@ -0,0 +1,174 @@
+""" Per-class aggregates of the classification states of the classes related to each class in the taxonomy.
+
+    For each tracked pair of direction (ancestors or descendants) and gUFO type, the aggregates count, for every node
+    x of the taxonomy index, how many of its superclasses (ANCESTORS) or subclasses (DESCENDANTS) have the gUFO type in
+    their is_type, can_type and not_type lists. As the indexed rdfs:subClassOf relations are reflexive and transitive
+    after the execution of the rules of group BASE, the counts include the class itself and its direct and indirect
+    ancestors or descendants.
+
+    Pairs are tracked from their first use and their counts are then maintained incrementally: classification moves are
+    read from the changes journal of the OntologyDataClassList and new rdfs:subClassOf relations are received from the
+    TaxonomyIndex. Hence, rules that only ask if any related class is, can or cannot be of a type perform constant-time
+    checks instead of scanning the related classes.
+"""
+
+from scior.modules.ontology_dataclassess.dataclass_definitions import GUFO_TYPES_BITS, OntologyDataClassList
+from scior.modules.taxonomy_index import TaxonomyIndex
+
+ANCESTORS = "ancestors"
+DESCENDANTS = "descendants"
+
+# Positions of the states in the tuples returned by TypeAggregates.get_counts
+IS_STATE = 0
+CAN_STATE = 1
+NOT_STATE = 2
+
+
+def get_classification_state(masks: tuple[int, int, int], classification_bit: int) -> int | None:
+    """ Returns the state (IS_STATE, CAN_STATE or NOT_STATE) of a classification in the received (is, can, not) masks,
+        or None if the classification is in none of them.
+    """
+
+    for state, mask in enumerate(masks):
+        if mask & classification_bit:
+            return state
+
+    return None
+
+
+class TypeAggregates(object):
+    """ Incrementally maintained counts of the is, can and not states of the gUFO types of the ancestors and
+        descendants of the taxonomy index's nodes.
+    """
+
+    def __init__(self, taxonomy_index: TaxonomyIndex, ontology_dataclass_list: OntologyDataClassList):
+        self.taxonomy_index = taxonomy_index
+        self.ontology_dataclass_list = ontology_dataclass_list
+
+        # Counts of each tracked (direction, gufo_type) pair: one list per state, indexed by the nodes' ids
+        self.counters = {}
+
+        # Classification masks of each node when the counts were last synchronized with the changes journal
+        self._masks = []
+        self._journal_position = ontology_dataclass_list.get_journal_position()
+        self._extend_nodes()
+
+    def _get_current_masks(self, node_id: int) -> tuple[int, int, int]:
+        """ Returns the current (is, can, not) masks of the node's dataclass, or zero masks if it has no dataclass. """
+
+        ontology_dataclass = self.ontology_dataclass_list.get_by_id(node_id)
+
+        if ontology_dataclass is None:
+            return 0, 0, 0
+
+        return ontology_dataclass.is_mask, ontology_dataclass.can_mask, ontology_dataclass.not_mask
+
+    def _extend_nodes(self) -> None:
+        """ Includes the nodes added to the taxonomy index since the last call. New nodes have no relations. """
+
+        for node_id in range(len(self._masks), len(self.taxonomy_index.nodes)):
+            self._masks.append(self._get_current_masks(node_id))
+            for state_counts in self.counters.values():
+                for counts in state_counts:
+                    counts.append(0)
+
+    def _get_related_ids(self, node_id: int, direction: str, inverse: bool = False) -> set[int]:
+        """ Returns the ids of the nodes aggregated for the received node in the received direction. If inverse is
+            True, returns instead the ids of the nodes for which the received node is aggregated.
+        """
+
+        if (direction == ANCESTORS) != inverse:
+            return self.taxonomy_index.superclasses[node_id]
+
+        return self.taxonomy_index.subclasses[node_id]
+
+    def _update_counts(self, node_id: int, old_masks: tuple[int, int, int], new_masks: tuple[int, int, int]) -> None:
+        """ Updates the counts of all nodes to which the received node is aggregated after its masks changed. """
+
+        for (direction, gufo_type), state_counts in self.counters.items():
+            classification_bit = GUFO_TYPES_BITS[gufo_type]
+            old_state = get_classification_state(old_masks, classification_bit)
+            new_state = get_classification_state(new_masks, classification_bit)
+
+            if old_state == new_state:
+                continue
+
+            for related_id in self._get_related_ids(node_id, direction, inverse=True):
+                if old_state is not None:
+                    state_counts[old_state][related_id] -= 1
+                if new_state is not None:
+                    state_counts[new_state][related_id] += 1
+
+    def _synchronize(self) -> None:
+        """ Updates the counts with the classification moves journaled since the last synchronization. """
+
+        current_position = self.ontology_dataclass_list.get_journal_position()
+
+        if current_position == self._journal_position:
+            return
+
+        changed_ids = self.ontology_dataclass_list.get_changed_classes_since(self._journal_position)
+        self._journal_position = current_position
+        self._extend_nodes()
+
+        for node_id in changed_ids:
+            old_masks = self._masks[node_id]
+            new_masks = self._get_current_masks(node_id)
+
+            if old_masks != new_masks:
+                self._masks[node_id] = new_masks
+                self._update_counts(node_id, old_masks, new_masks)
+
+    def _get_state_counts(self, direction: str, gufo_type: str) -> list[list[int]]:
+        """ Returns the counts of the received pair, calculating them from the index if the pair is not tracked yet. """
+
+        state_counts = self.counters.get((direction, gufo_type))
+
+        if state_counts is None:
+            classification_bit = GUFO_TYPES_BITS[gufo_type]
+            node_states = [get_classification_state(masks, classification_bit) for masks in self._masks]
+            state_counts = [[0] * len(self._masks) for _ in range(3)]
+
+            for node_id in range(len(self._masks)):
+                for related_id in self._get_related_ids(node_id, direction):
+                    related_state = node_states[related_id]
+                    if related_state is not None:
+                        state_counts[related_state][node_id] += 1
+
+            self.counters[(direction, gufo_type)] = state_counts
+
+        return state_counts
+
+    def get_counts(self, node_id: int, direction: str, gufo_type: str) -> tuple[int, int, int]:
+        """ Returns how many ancestors or descendants of the received node are, can be and cannot be of a gUFO type.
+
+        :param node_id: Id of the evaluated node.
+        :type node_id: int
+        :param direction: Related nodes to be counted. Allowed values are ANCESTORS and DESCENDANTS.
+        :type direction: str
+        :param gufo_type: gUFO type (in short form, e.g., Kind) whose states are counted.
+        :type gufo_type: str
+        :return: Numbers of related nodes with the type in their is_type, can_type and not_type lists, in this order.
+        :rtype: tuple[int, int, int]
+        """
+
+        self._synchronize()
+        state_counts = self._get_state_counts(direction, gufo_type)
+
+        return state_counts[IS_STATE][node_id], state_counts[CAN_STATE][node_id], state_counts[NOT_STATE][node_id]
+
+    def add_subclass_relation(self, subclass_id: int, superclass_id: int) -> None:
+        """ Updates the counts after the relation rdfs:subClassOf(subclass, superclass) is added to the index. """
+
+        self._extend_nodes()
+
+        for (direction, gufo_type), state_counts in self.counters.items():
+            if direction == ANCESTORS:
+                aggregated_id, counted_id = subclass_id, superclass_id
+            else:
+                aggregated_id, counted_id = superclass_id, subclass_id
+
+            counted_state = get_classification_state(self._masks[counted_id], GUFO_TYPES_BITS[gufo_type])
+
+            if counted_state is not None:
+                state_counts[counted_state][aggregated_id] += 1
@@ -0,0 +1,58 @@
+""" Interning table of the URIs (and other RDFLib nodes) handled by Scior.
+
+    Each URI is stored once and identified by a dense integer id, assigned in registration order. The table is created
+    when the ontology's classes are loaded (see OntologyDataClassList), hence the classes have the first ids. The same
+    ids are used by the dataclasses, the taxonomy closure and index, the rules' query bindings, the changes journals
+    and the incompleteness stack. They are converted back to URIs only when results are reported or written into the
+    ontology graph.
+"""
+
+from rdflib import URIRef
+from rdflib.term import Node
+
+
+class UriTable(object):
+    """ Bidirectional map between URIs and their integer ids. For each id, the URI string and its RDFLib node are
+        created only once and shared by all structures that use them.
+    """
+
+    def __init__(self):
+        self.uris: list[str] = []
+        self.nodes: list[Node] = []
+        self.uri_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.uris)
+
+    def get_id(self, node, create: bool = True) -> int | None:
+        """ Returns the id of the received URI string or RDFLib node, registering it if unknown and create is True.
+
+        :param node: URI string or RDFLib node (e.g., URIRef or BNode).
+        :param create: Indicates if a new id must be created for an unknown URI.
+        :type create: bool
+        :return: Id of the URI or None if it is unknown and create is False.
+        :rtype: int | None
+        """
+
+        uri = node if type(node) is str else str(node)
+        uri_id = self.uri_ids.get(uri)
+
+        if uri_id is None and create:
+            uri_id = len(self.uris)
+            self.uri_ids[uri] = uri_id
+            self.uris.append(uri)
+            self.nodes.append(node if isinstance(node, Node) else URIRef(uri))
+
+        return uri_id
+
+    def get_uri(self, uri_id: int) -> str:
+        """ Returns the URI string of the received id. """
+        return self.uris[uri_id]
+
+    def get_node(self, uri_id: int) -> Node:
+        """ Returns the RDFLib node of the received id. """
+        return self.nodes[uri_id]
+
+    def get_uris(self, uri_ids) -> list[str]:
+        """ Returns the URI strings of the received ids, in the same order. """
+        return [self.uris[uri_id] for uri_id in uri_ids]
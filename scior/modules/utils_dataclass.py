@@ -3,7 +3,7 @@ import inspect
 import operator
 
 from scior.modules.logger_config import initialize_logger
-from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass
+from scior.modules.ontology_dataclassess.dataclass_definitions import OntologyDataClass, OntologyDataClassList
 from scior.modules.problems_treatment.treat_errors import report_error_dataclass_not_found, report_error_end_of_switch
 
 LOGGER = initialize_logger()
@@ -146,23 +146,28 @@ def select_list(list_of_options):
 def sort_all_ontology_dataclass_list(ontology_dataclass_list):
     """ Receives an ontology_dataclass_list and:
             1) Sorts it via its dataclasses' uris
-            2) Sorts all lists inside each dataclass of the list.
+            2) Sorts all lists inside each dataclass of the list (types bitmasks' views are always sorted).
     """
 
     ontology_dataclass_list.sort(key=operator.attrgetter('uri'))
 
     for ontology_dataclass in ontology_dataclass_list:
-        ontology_dataclass.is_type.sort()
-        ontology_dataclass.can_type.sort()
-        ontology_dataclass.not_type.sort()
-        ontology_dataclass.is_individual.sort()
-        ontology_dataclass.can_individual.sort()
-        ontology_dataclass.not_individual.sort()
+        ontology_dataclass.sort_all_internal_lists()
 
 
 def get_dataclass_by_uri(ontology_dataclass_list, desired_uri: str) -> OntologyDataClass | None:
     """ Receives the complete ontology_dataclass_list and return the specific Ontology DataClass that has the
-    desired URI received as parameter or None, if this URI is not found. """
+    desired URI received as parameter or None, if this URI is not found.
+
+    When an OntologyDataClassList is received its URI index is used (constant time). Plain lists are linearly scanned.
+    """
+
+    if isinstance(ontology_dataclass_list, OntologyDataClassList):
+        ontology_dataclass = ontology_dataclass_list.get_by_uri(desired_uri)
+        if ontology_dataclass is not None:
+            return ontology_dataclass
+        report_error_dataclass_not_found(desired_uri)
+        return None
 
     for ontology_dataclass in ontology_dataclass_list:
         if ontology_dataclass.uri == desired_uri:
@@ -170,3 +175,16 @@ def get_dataclass_by_uri(ontology_dataclass_list, desired_uri: str) -> OntologyD
 
     report_error_dataclass_not_found(desired_uri)
     return None
+
+
+def get_dataclass_by_id(ontology_dataclass_list: OntologyDataClassList, desired_id: int) -> OntologyDataClass | None:
+    """ Receives the complete ontology_dataclass_list and return the specific Ontology DataClass whose URI has the
+    desired integer id (see UriTable) or None, if there is no dataclass with this id.
+    """
+
+    ontology_dataclass = ontology_dataclass_list.get_by_id(desired_id)
+
+    if ontology_dataclass is None:
+        report_error_dataclass_not_found(ontology_dataclass_list.uri_table.get_uri(desired_id))
+
+    return ontology_dataclass
@@ -65,6 +65,26 @@ def get_computer_specifications():
         exit(1)
 
 
+def get_peak_memory_usage() -> float:
+    """ Returns the peak resident set size (RSS) of the current process in megabytes, rounded to one decimal place.
+    In systems without the resource module (e.g., Windows), the current RSS is returned instead.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        import psutil
+        return round(psutil.Process().memory_info().rss / (1024.0 ** 2), 1)
+
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is measured in bytes in macOS and in kilobytes in Linux
+    if platform.system() == "Darwin":
+        peak_memory /= 1024.0
+
+    return round(peak_memory / 1024.0, 1)
+
+
 def create_directory_if_not_exists(directory_path: str) -> None:
     """ Checks if the directory that has the path received as argument exists.
     If it does, do nothing. If it does not, create it.
@@ -0,0 +1,115 @@
+""" Streaming reader for N-Triples and N-Quads files, which builds the ontology's working graph directly from the
+    file's lines, without parsing the whole file into an RDFLib graph.
+
+    Only the statements used by Scior are kept: rdf:type statements whose objects are owl:Class, gUFO types or blank
+    nodes (used for the known negative gUFO types), owl:complementOf statements whose objects are gUFO types and all
+    rdfs:subClassOf statements. The other lines are discarded by a byte-level check before being parsed.
+"""
+import re
+import time
+
+from rdflib import BNode, Graph, OWL, RDF, RDFS, URIRef
+from rdflib.plugins.parsers.ntriples import unquote, uriquote
+from rdflib.util import guess_format
+
+from scior.modules.graph_store import bulk_loading, create_graph
+from scior.modules.logger_config import initialize_logger
+from scior.modules.problems_treatment.treat_errors import report_error_io_read
+from scior.modules.resources_gufo import GUFO_NAMESPACE
+
+LOGGER = initialize_logger()
+
+STREAMABLE_FORMATS = ["nt", "nquads"]
+
+RDF_TYPE_BYTES = b"<" + str(RDF.type).encode() + b">"
+RDFS_SUBCLASSOF_BYTES = b"<" + str(RDFS.subClassOf).encode() + b">"
+OWL_COMPLEMENTOF_BYTES = b"<" + str(OWL.complementOf).encode() + b">"
+
+# Subject, predicate and object (if not a literal) of a N-Triples or N-Quads line
+STATEMENT_PATTERN = re.compile(rb"\s*(<[^>]*>|_:[^\s<]*[^\s<.])\s*<([^>]*)>\s*(<[^>]*>|_:[^\s<]*[^\s<.])?")
+
+
+def is_streamable_file(ontology_file: str) -> bool:
+    """ Informs if the received file can be read by the streaming reader, i.e., if it is a N-Triples or N-Quads file. """
+
+    return guess_format(ontology_file) in STREAMABLE_FORMATS
+
+
+def is_kept_statement(predicate: URIRef, object_node) -> bool:
+    """ Informs if a statement with the received predicate and object must be kept in the working graph. """
+
+    if predicate == RDFS.subClassOf:
+        return True
+    if predicate == RDF.type:
+        return object_node == OWL.Class or isinstance(object_node, BNode) or object_node.startswith(GUFO_NAMESPACE)
+    if predicate == OWL.complementOf:
+        return isinstance(object_node, URIRef) and object_node.startswith(GUFO_NAMESPACE)
+
+    return False
+
+
+def stream_working_graph(ontology_file: str, graph_store: str = "memory") -> Graph:
+    """ Builds the ontology's working graph (taxonomy only) by streaming the lines of a N-Triples or N-Quads file.
+
+    :param ontology_file: Path to the N-Triples or N-Quads ontology file to be read.
+    :type ontology_file: str
+    :param graph_store: Graph store in which the working graph is created (see graph_store.GRAPH_STORES).
+    :type graph_store: str
+    :return: Working graph with only the statements used by Scior.
+    :rtype: Graph
+    """
+
+    st = time.perf_counter()
+
+    working_graph = create_graph(graph_store)
+    # Nodes already created, indexed by their N-Triples representation, so that repeated nodes are shared
+    nodes = {}
+    number_lines = 0
+
+    def get_node(node_bytes: bytes):
+        node = nodes.get(node_bytes)
+
+        if node is None:
+            node_text = node_bytes.decode("utf-8")
+            if node_text.startswith("_:"):
+                node = BNode(node_text[2:])
+            else:
+                node_text = node_text[1:-1]
+                node = URIRef(uriquote(unquote(node_text)) if "\\" in node_text else node_text)
+            nodes[node_bytes] = node
+
+        return node
+
+    def get_kept_statements(input_file):
+        nonlocal number_lines
+
+        for line in input_file:
+            number_lines += 1
+
+            if RDFS_SUBCLASSOF_BYTES not in line and RDF_TYPE_BYTES not in line and OWL_COMPLEMENTOF_BYTES not in line:
+                continue
+
+            statement_match = STATEMENT_PATTERN.match(line)
+
+            # Lines whose objects are literals are not used
+            if statement_match is None or statement_match.group(3) is None:
+                continue
+
+            predicate = get_node(b"<" + statement_match.group(2) + b">")
+            object_node = get_node(statement_match.group(3))
+
+            if is_kept_statement(predicate, object_node):
+                yield get_node(statement_match.group(1)), predicate, object_node, working_graph
+
+    try:
+        with open(ontology_file, "rb") as input_file, bulk_loading(working_graph):
+            working_graph.addN(get_kept_statements(input_file))
+    except OSError as error:
+        file_description = f"input ontology file"
+        report_error_io_read(ontology_file, file_description, error)
+
+    elapsed_time = round(time.perf_counter() - st, 3)
+    LOGGER.info(f"Ontology file {ontology_file} successfully streamed to working memory in {elapsed_time} seconds.")
+    LOGGER.debug(f"Working graph created with {len(working_graph)} statements from {number_lines} lines.")
+
+    return working_graph
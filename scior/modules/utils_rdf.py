@@ -1,11 +1,11 @@
 """ Auxiliary functions for extending and complementing RDFLib's RDF treatment functions """
-import copy
 import time
 
 from owlrl import RDFS_Semantics, DeductiveClosure
-from rdflib import RDF, OWL, Graph
+from rdflib import BNode, RDF, OWL, Dataset, Graph
 from rdflib.util import guess_format
 
+from scior.modules.graph_store import bulk_loading, create_graph
 from scior.modules.logger_config import initialize_logger
 from scior.modules.problems_treatment.treat_errors import report_error_io_read
 
@@ -25,20 +25,33 @@ def load_graph_safely_considering_restrictions(ontology_file, graph_restriction=
     return ontology_graph
 
 
-def load_all_graph_safely(ontology_file: str) -> Graph:
+def load_all_graph_safely(ontology_file: str, graph_store: str = "memory") -> Graph:
     """ Safely load graph from file to working memory.
 
     :param ontology_file: Path to the ontology file to be loaded into the working memory.
     :type ontology_file: str
+    :param graph_store: Graph store in which the graph is loaded (see graph_store.GRAPH_STORES).
+    :type graph_store: str
     :return: RDFLib graph loaded as object.
     :rtype: Graph
     """
 
-    ontology_graph = Graph()
+    ontology_graph = create_graph(graph_store)
 
     try:
         file_format = guess_format(ontology_file)
-        ontology_graph.parse(ontology_file, format=file_format, encoding='utf-8')
+        # RDFLib's N-Triples parser always uses UTF-8 and does not accept the encoding argument
+        parse_arguments = {} if file_format == "nt" else {"encoding": 'utf-8'}
+        with bulk_loading(ontology_graph):
+            if file_format == "nquads":
+                # N-Quads are only parsed into context-aware graphs. The triples of all graphs (default and named) of
+                # the dataset are merged.
+                ontology_dataset = Dataset()
+                ontology_dataset.parse(ontology_file, format=file_format)
+                ontology_graph.addN((subj, pred, obj, ontology_graph)
+                                    for subj, pred, obj, _ in ontology_dataset.quads((None, None, None, None)))
+            else:
+                ontology_graph.parse(ontology_file, format=file_format, **parse_arguments)
     except OSError as error:
         file_description = f"input ontology file"
         report_error_io_read(ontology_file, file_description, error)
@@ -48,15 +61,26 @@ def load_all_graph_safely(ontology_file: str) -> Graph:
     return ontology_graph
 
 
-def reduce_graph_considering_restrictions(original_graph, restrictions_list):
-    """ Reduce the already loaded ontology model to only allowed statements (contained in the restrictions_list). """
+def reduce_graph_considering_restrictions(original_graph, restrictions_list, graph_store: str = "memory"):
+    """ Reduce the already loaded ontology model to only allowed statements (contained in the restrictions_list).
 
-    # Copying original graph to a new graph
-    working_graph = copy.deepcopy(original_graph)
+        The reduced graph is built in a single pass over the original graph's statements of the allowed predicates,
+        without copying the whole graph or removing statements from it. The original graph is not modified.
+        The reduced graph is created in the received graph store (see graph_store.GRAPH_STORES).
+    """
+
+    working_graph = create_graph(graph_store)
+
+    for prefix, namespace in original_graph.namespaces():
+        working_graph.bind(prefix, namespace, override=True, replace=True)
+
+    with bulk_loading(working_graph):
+        for restriction in restrictions_list:
+            working_graph.addN((subj, pred, obj, working_graph)
+                               for subj, pred, obj in original_graph.triples((None, restriction, None)))
 
-    for subj, pred, obj in working_graph:
-        if pred not in restrictions_list:
-            working_graph.remove((subj, pred, obj))
+    LOGGER.debug(f"Working graph created with {len(working_graph)} of the {len(original_graph)} statements "
+                 f"of the original graph.")
 
     return working_graph
 
@@ -64,11 +88,7 @@ def reduce_graph_considering_restrictions(original_graph, restrictions_list):
 def load_restrictions_only_graph_safely(owl_file_path, restrictions_list):
     """ Extract the dataset model's taxonomy into a new graph. """
 
-    working_graph = load_all_graph_safely(owl_file_path)
-
-    for subj, pred, obj in working_graph:
-        if pred not in restrictions_list:
-            working_graph.remove((subj, pred, obj))
+    working_graph = reduce_graph_considering_restrictions(load_all_graph_safely(owl_file_path), restrictions_list)
 
     return working_graph
 
@@ -127,37 +147,41 @@ def get_ontology_uri(ontology_graph):
 
 def get_list_of_all_classes(ontology_graph: Graph, exceptions_list=None):
     """ Returns a list of all classes as URI strings without repetitions available in a Graph.
-    Classes that have namespaces included in the exception_list parameter are not included in the returned list. """
+    Classes that have namespaces included in the exception_list parameter are not included in the returned list.
+
+    The classes are discovered in a single scan of the graph's owl:Class instances. BNodes are not included.
+    """
 
     if exceptions_list == None:
         exceptions_list = []
 
-    classes_list = []
-
-    for sub, pred, obj in ontology_graph:
-        if (sub, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(sub).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(sub.n3()[1:-1])
-        if (obj, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(obj).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(obj.n3()[1:-1])
-
-    # Removing possible repetitions
-    no_rep_classes_list = [*set(classes_list)]
-
-    # Removing classes that have namespace in the exceptions_list
-    classes_list = no_rep_classes_list.copy()
-    for class_uri in no_rep_classes_list:
-        for exception_item in exceptions_list:
-            if class_uri.startswith(exception_item):
-                classes_list.remove(class_uri)
-                break
-
-    return classes_list
+    exceptions_prefixes = tuple(exceptions_list)
+
+    # Dictionary used as an insertion-ordered set
+    classes_uris = {}
+    number_bnodes = 0
+    number_excluded = 0
+
+    for ontology_class in ontology_graph.subjects(RDF.type, OWL.Class):
+
+        # Eliminating BNodes
+        if isinstance(ontology_class, BNode):
+            number_bnodes += 1
+            continue
+
+        class_uri = str(ontology_class)
+
+        # Removing classes that have namespace in the exceptions_list
+        if class_uri.startswith(exceptions_prefixes):
+            number_excluded += 1
+            continue
+
+        classes_uris[class_uri] = None
+
+    LOGGER.debug(f"{len(classes_uris)} classes found in the graph. "
+                 f"BNodes ignored: {number_bnodes}. Classes in excluded namespaces: {number_excluded}.")
+
+    return list(classes_uris)
 
 
 # Not used
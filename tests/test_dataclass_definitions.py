@@ -0,0 +1,86 @@
+""" Tests of the classifications bitmasks and of their read-only views, used as the dataclasses' type lists. """
+import random
+
+import pytest
+
+from scior.modules.ontology_dataclassess.dataclass_definitions import GUFO_ALL_TYPES_MASK, GUFO_LIST_ENDURANT_TYPES, \
+    ClassificationsView, OntologyDataClass, classifications_to_mask, get_classifications_view, \
+    mask_to_classifications
+
+
+@pytest.mark.parametrize("random_seed", range(5))
+def test_mask_round_trip(random_seed: int):
+    """ Checks if converting a list of classifications into a bitmask and back returns its sorted classifications.
+
+    :param random_seed: Seed of the random lists of classifications.
+    :type random_seed: int
+    """
+
+    generator = random.Random(random_seed)
+
+    for _ in range(50):
+        classifications = generator.sample(GUFO_LIST_ENDURANT_TYPES, generator.randint(0, 15))
+        assert mask_to_classifications(classifications_to_mask(classifications)) == sorted(classifications)
+
+    assert classifications_to_mask(GUFO_LIST_ENDURANT_TYPES) == GUFO_ALL_TYPES_MASK
+
+
+def test_view_membership():
+    """ Checks if membership in a view is the test of the classification's bit, including names that are not gUFO
+        classifications.
+    """
+
+    view = get_classifications_view(classifications_to_mask(["Kind", "Sortal", "RigidType"]))
+
+    for gufo_type in GUFO_LIST_ENDURANT_TYPES:
+        assert (gufo_type in view) == (gufo_type in ["Kind", "Sortal", "RigidType"])
+
+    assert "Unknown" not in view
+    assert "gufo:Kind" not in view
+    assert None not in view
+    assert "Kind" not in get_classifications_view(0)
+
+
+def test_view_sequence():
+    """ Checks if a view behaves as the sorted list of its classifications. """
+
+    view = get_classifications_view(classifications_to_mask(["Sortal", "Kind", "RigidType"]))
+
+    assert list(view) == ["Kind", "RigidType", "Sortal"]
+    assert len(view) == 3 and not get_classifications_view(0)
+    assert view[0] == "Kind" and view[-1] == "Sortal" and view[1:] == ("RigidType", "Sortal")
+    assert view + ["Category"] == ["Kind", "RigidType", "Sortal", "Category"]
+    assert view.index("Sortal") == 2 and view.count("Kind") == 1
+    assert repr(view) == repr(["Kind", "RigidType", "Sortal"])
+
+
+def test_view_equality():
+    """ Checks if views are equal to views of the same mask and to lists and tuples with the same sorted elements, and
+        if views of the same mask are shared.
+    """
+
+    mask = classifications_to_mask(["Kind", "Sortal"])
+    view = get_classifications_view(mask)
+
+    assert view is get_classifications_view(mask)
+    assert view == ClassificationsView(mask) and hash(view) == hash(ClassificationsView(mask))
+    assert view != get_classifications_view(classifications_to_mask(["Kind"]))
+    assert view == ["Kind", "Sortal"] and view == ("Kind", "Sortal")
+    assert view != ["Sortal", "Kind"]
+    assert view != "Kind"
+    assert len({view, ClassificationsView(mask)}) == 1
+
+
+def test_dataclass_views():
+    """ Checks if the type lists of a dataclass are views of its bitmasks and are not changed by later moves. """
+
+    ontology_dataclass = OntologyDataClass(uri="http://example.org/X", can_mask=GUFO_ALL_TYPES_MASK)
+    can_type = ontology_dataclass.can_type
+
+    ontology_dataclass.move_classification_from_can_type("Kind", "is_type")
+    ontology_dataclass.move_classification_from_can_type("Category", "not_type")
+
+    assert ontology_dataclass.is_type == ["Kind"] and ontology_dataclass.not_type == ["Category"]
+    assert "Kind" not in ontology_dataclass.can_type and "Kind" in can_type
+    assert len(ontology_dataclass.can_type) == len(GUFO_LIST_ENDURANT_TYPES) - 2
+    assert ontology_dataclass.is_type is get_classifications_view(ontology_dataclass.is_mask)
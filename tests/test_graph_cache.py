@@ -0,0 +1,121 @@
+""" Tests of the on-disk cache of parsed ontology graphs. """
+import os
+
+import pytest
+from rdflib.compare import to_isomorphic
+
+import scior.modules.graph_cache as graph_cache
+from scior.modules.graph_cache import CACHE_FILE_EXTENSION, evict_cache_entries, get_cache_file_path, \
+    get_file_digest, load_graph_from_cache, load_graph_using_cache
+from scior.modules.utils_rdf import load_all_graph_safely
+
+TEST_FILE = os.path.join(os.path.dirname(__file__), "test_files", "test_rs06a_in.ttl")
+SOFTWARE_VERSION = "0.0.test"
+
+
+def load_test_file(cache_directory: str, graph_store: str = "memory"):
+    """ Loads the test file using the cache in the received directory.
+
+    :param cache_directory: Directory of the cache entries.
+    :type cache_directory: str
+    :param graph_store: Graph store in which the graph is loaded.
+    :type graph_store: str
+    :return: Loaded RDFLib graph.
+    :rtype: Graph
+    """
+
+    return load_graph_using_cache(TEST_FILE, graph_store, cache_directory, 1024, SOFTWARE_VERSION)
+
+
+def get_test_entry_path(cache_directory: str) -> str:
+    """ Returns the path of the test file's cache entry in the received directory. """
+
+    return get_cache_file_path(cache_directory, get_file_digest(TEST_FILE), SOFTWARE_VERSION)
+
+
+@pytest.mark.parametrize("graph_store", ["memory", "sqlite"])
+def test_cache_hit(tmp_path, monkeypatch, graph_store: str):
+    """ Checks if the second loading of a file is obtained from its cache entry and equals the parsed graph.
+
+    :param graph_store: Graph store in which the graph is loaded.
+    :type graph_store: str
+    """
+
+    parsed_graph = load_all_graph_safely(TEST_FILE)
+    first_graph = load_test_file(str(tmp_path), graph_store)
+
+    assert os.path.exists(get_test_entry_path(str(tmp_path)))
+
+    def fail_parsing(*_):
+        raise AssertionError("Ontology file parsed despite its cache entry.")
+
+    monkeypatch.setattr(graph_cache, "load_all_graph_safely", fail_parsing)
+    cached_graph = load_test_file(str(tmp_path), graph_store)
+
+    assert to_isomorphic(first_graph) == to_isomorphic(parsed_graph)
+    assert to_isomorphic(cached_graph) == to_isomorphic(parsed_graph)
+    assert dict(cached_graph.namespaces()).get("gufo") == dict(parsed_graph.namespaces()).get("gufo")
+
+
+@pytest.mark.parametrize("entry_content", [b"", b"SCIORGC\n", b"SCIORGC\n\xff\xff\xff\xff\xff\xff\xff\x00{}",
+                                           b"\x80\x04\x95\x00\x00\x00\x00", "truncated", "invalid_term"])
+def test_corrupt_entry(tmp_path, entry_content):
+    """ Checks if a corrupt cache entry is ignored and replaced by a valid one.
+
+    :param entry_content: Content written into the entry (bytes) or kind of corruption of a valid entry (str).
+    """
+
+    load_test_file(str(tmp_path))
+    entry_path = get_test_entry_path(str(tmp_path))
+
+    with open(entry_path, "rb") as entry_file:
+        valid_content = entry_file.read()
+
+    if entry_content == "truncated":
+        entry_content = valid_content[:-5]
+    elif entry_content == "invalid_term":
+        entry_content = valid_content.replace(b'"U', b'"X', 1)
+
+    with open(entry_path, "wb") as entry_file:
+        entry_file.write(entry_content)
+
+    with pytest.raises(Exception):
+        load_graph_from_cache(entry_path, SOFTWARE_VERSION, "memory")
+
+    loaded_graph = load_test_file(str(tmp_path))
+
+    assert to_isomorphic(loaded_graph) == to_isomorphic(load_all_graph_safely(TEST_FILE))
+    assert to_isomorphic(load_graph_from_cache(entry_path, SOFTWARE_VERSION, "memory")) == to_isomorphic(loaded_graph)
+
+
+def test_other_software_version(tmp_path):
+    """ Checks if an entry created by another software version is not used. """
+
+    load_test_file(str(tmp_path))
+    entry_path = get_test_entry_path(str(tmp_path))
+
+    with pytest.raises(ValueError):
+        load_graph_from_cache(entry_path, "another version", "memory")
+
+
+def test_eviction(tmp_path):
+    """ Checks if the least recently used entries are evicted, but never the kept one, until the maximum size. """
+
+    entry_paths = []
+
+    for entry_number in range(4):
+        entry_path = os.path.join(str(tmp_path), f"entry{entry_number}{CACHE_FILE_EXTENSION}")
+        with open(entry_path, "wb") as entry_file:
+            entry_file.write(b"0" * 512 * 1024)
+        os.utime(entry_path, (1000 + entry_number, 1000 + entry_number))
+        entry_paths.append(entry_path)
+
+    other_file_path = os.path.join(str(tmp_path), "other.txt")
+    with open(other_file_path, "wb") as other_file:
+        other_file.write(b"0" * 1024 * 1024)
+
+    # The oldest entry is kept, hence the second and third oldest ones are evicted
+    evict_cache_entries(str(tmp_path), 1, entry_paths[0])
+
+    assert [os.path.exists(entry_path) for entry_path in entry_paths] == [True, False, False, True]
+    assert os.path.exists(other_file_path)
@@ -0,0 +1,155 @@
+""" Tests of the on-disk graph store, which must behave as RDFLib's default in-memory store. """
+import pytest
+from rdflib import BNode, Graph, Literal, RDF, RDFS, URIRef, XSD
+
+import scior.modules.graph_store as graph_store
+from scior.modules.graph_store import SQLiteStore, bulk_loading, create_graph, decode_node, encode_node
+
+EXAMPLE = "http://example.org/"
+
+TEST_TRIPLES = [
+    (URIRef(EXAMPLE + "Person"), RDF.type, URIRef("http://www.w3.org/2002/07/owl#Class")),
+    (URIRef(EXAMPLE + "Student"), RDFS.subClassOf, URIRef(EXAMPLE + "Person")),
+    (URIRef(EXAMPLE + "Student"), RDFS.label, Literal("Student", lang="en")),
+    (URIRef(EXAMPLE + "Student"), RDFS.comment, Literal("42", datatype=XSD.integer)),
+    (BNode("b0"), RDFS.subClassOf, URIRef(EXAMPLE + "Person"))
+]
+
+
+def create_test_graphs() -> tuple[Graph, Graph]:
+    """ Creates an in-memory graph and an on-disk (SQLite) graph, both with the test triples.
+
+    :return: In-memory graph and on-disk graph.
+    :rtype: tuple[Graph, Graph]
+    """
+
+    memory_graph = create_graph("memory")
+    sqlite_graph = create_graph("sqlite")
+
+    for triple in TEST_TRIPLES:
+        memory_graph.add(triple)
+        sqlite_graph.add(triple)
+
+    return memory_graph, sqlite_graph
+
+
+@pytest.mark.parametrize("node", [triple_node for triple in TEST_TRIPLES for triple_node in triple])
+def test_node_encoding(node):
+    """ Checks if the stored nodes are decoded back into equal RDFLib nodes.
+
+    :param node: RDFLib node to be encoded.
+    """
+
+    assert decode_node(encode_node(node)) == node
+
+
+@pytest.mark.parametrize("read_page_size", [1, 2, 50000])
+@pytest.mark.parametrize("triple_pattern", [(None, None, None), (URIRef(EXAMPLE + "Student"), None, None),
+                                            (None, RDFS.subClassOf, None), (None, None, URIRef(EXAMPLE + "Person")),
+                                            (None, RDFS.subClassOf, URIRef(EXAMPLE + "Person")),
+                                            TEST_TRIPLES[2], (URIRef(EXAMPLE + "Unknown"), None, None)])
+def test_triples_patterns(monkeypatch, triple_pattern: tuple, read_page_size: int):
+    """ Checks if the triples matching a pattern are the same in the in-memory and in the on-disk stores, whose triples
+        are read in pages of different sizes.
+
+    :param triple_pattern: (subject, predicate, object) pattern, in which None matches any node.
+    :type triple_pattern: tuple
+    :param read_page_size: Number of triples read at once from the on-disk store.
+    :type read_page_size: int
+    """
+
+    monkeypatch.setattr(graph_store, "READ_PAGE_SIZE", read_page_size)
+
+    memory_graph, sqlite_graph = create_test_graphs()
+
+    assert isinstance(sqlite_graph.store, SQLiteStore)
+    sqlite_triples = list(sqlite_graph.triples(triple_pattern))
+
+    assert len(sqlite_triples) == len(set(sqlite_triples))
+    assert set(sqlite_triples) == set(memory_graph.triples(triple_pattern))
+
+
+def test_add_and_remove():
+    """ Checks if duplicated triples are ignored and if removed triples are no longer returned. """
+
+    memory_graph, sqlite_graph = create_test_graphs()
+
+    sqlite_graph.add(TEST_TRIPLES[0])
+    assert len(sqlite_graph) == len(TEST_TRIPLES)
+
+    removed_pattern = (URIRef(EXAMPLE + "Student"), None, None)
+    memory_graph.remove(removed_pattern)
+    sqlite_graph.remove(removed_pattern)
+
+    assert set(sqlite_graph) == set(memory_graph)
+    assert len(sqlite_graph) == len(memory_graph)
+
+
+def test_modification_while_iterating():
+    """ Checks if triples can be added and removed while the triples of the same store are iterated. """
+
+    _, sqlite_graph = create_test_graphs()
+
+    for subject_node, _, object_node in sqlite_graph.triples((None, RDFS.subClassOf, None)):
+        sqlite_graph.remove((subject_node, RDFS.subClassOf, object_node))
+        sqlite_graph.add((object_node, RDFS.subClassOf, subject_node))
+
+    assert set(sqlite_graph.subject_objects(RDFS.subClassOf)) == \
+           {(URIRef(EXAMPLE + "Person"), URIRef(EXAMPLE + "Student")), (URIRef(EXAMPLE + "Person"), BNode("b0"))}
+
+
+@pytest.mark.parametrize("triple_pattern", [(None, None, None), (None, RDFS.subClassOf, None)])
+def test_paged_scan_while_modifying(monkeypatch, triple_pattern: tuple):
+    """ Checks if a scan read in small pages returns once every triple that exists during the whole scan and no triple
+        removed before its page is read, while triples are added and removed.
+
+    :param triple_pattern: (subject, predicate, object) pattern, in which None matches any node.
+    :type triple_pattern: tuple
+    """
+
+    monkeypatch.setattr(graph_store, "READ_PAGE_SIZE", 3)
+    sqlite_graph = create_graph("sqlite")
+    classes = [URIRef(EXAMPLE + f"Class{position:02}") for position in range(20)]
+
+    for position, ontology_class in enumerate(classes):
+        sqlite_graph.add((ontology_class, RDFS.subClassOf, classes[(position + 1) % len(classes)]))
+
+    initial_triples = set(sqlite_graph)
+    removed_triples = set()
+    added_triples = set()
+    scanned_triples = []
+
+    for triple in sqlite_graph.triples(triple_pattern):
+        assert triple not in removed_triples
+        scanned_triples.append(triple)
+
+        # Added triples may be scanned, according to the order of the pages
+        if triple in added_triples:
+            continue
+
+        # Removing a triple that is not in the page being scanned and adding a new triple
+        subject_position = classes.index(triple[0])
+        if subject_position % 4 == 0 and subject_position + 3 < len(classes):
+            removed_triple = (classes[subject_position + 3], RDFS.subClassOf, classes[(subject_position + 4) % 20])
+            sqlite_graph.remove(removed_triple)
+            removed_triples.add(removed_triple)
+        added_triple = (URIRef(EXAMPLE + f"Added{subject_position:02}"), RDFS.subClassOf, triple[0])
+        sqlite_graph.add(added_triple)
+        added_triples.add(added_triple)
+
+    assert len(scanned_triples) == len(set(scanned_triples))
+    assert initial_triples - removed_triples <= set(scanned_triples)
+    assert set(scanned_triples) <= initial_triples | added_triples
+    assert set(sqlite_graph) == (initial_triples - removed_triples) | added_triples
+
+
+def test_bulk_loading():
+    """ Checks if the triples added during a bulk loading are available after it. """
+
+    sqlite_graph = create_graph("sqlite")
+
+    with bulk_loading(sqlite_graph):
+        for triple in TEST_TRIPLES:
+            sqlite_graph.add(triple)
+
+    assert set(sqlite_graph) == set(TEST_TRIPLES)
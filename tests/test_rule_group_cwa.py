@@ -0,0 +1,37 @@
+""" Regression tests of the rules of group CWA. """
+import os
+
+import pytest
+
+import scior.modules.initialization_arguments as args
+from scior.main import run_scior_test_execution
+from scior.modules.utils_dataclass import get_dataclass_by_uri
+
+TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "test_files")
+
+
+@pytest.mark.parametrize("execution_mode", [None, "is_sparql_rules", "is_vectorized_gufo"])
+@pytest.mark.parametrize("assumption, is_not_non_sortal", [("cwa", True), ("owa", False), ("owaf", False)])
+def test_rc05_shared_kind(monkeypatch, assumption: str, is_not_non_sortal: bool, execution_mode: str | None):
+    """ Checks if RC05 concludes that X cannot be a NonSortal when all Sortals that share a superclass with X share the
+        same Kind (test_rc05a). The rule is only executed under the closed-world assumption.
+
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    :param is_not_non_sortal: Indicates if NonSortal is expected in X's not_type list.
+    :type is_not_non_sortal: bool
+    :param execution_mode: Argument that selects an execution mode other than the native one, if not None.
+    :type execution_mode: str | None
+    """
+
+    if execution_mode == "is_vectorized_gufo":
+        pytest.importorskip("numpy")
+
+    if execution_mode is not None:
+        monkeypatch.setitem(args.OPTIONAL_ARGUMENTS_DEFAULTS, execution_mode, True)
+
+    ontology_dataclass_list = run_scior_test_execution("input", os.path.join(TEST_FILES_PATH, "test_rc05a_in.ttl"),
+                                                       assumption)
+    class_x = get_dataclass_by_uri(ontology_dataclass_list, "http://test.com#X")
+
+    assert ("NonSortal" in class_x.not_type) == is_not_non_sortal
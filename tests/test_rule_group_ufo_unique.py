@@ -0,0 +1,134 @@
+""" Tests of the rules of group UFO Unique. """
+import csv
+import os
+import random
+
+import pytest
+from rdflib import RDFS, URIRef
+
+from scior.main import run_scior_test_execution
+from scior.modules.ontology_dataclassess.dataclass_definitions import GUFO_ALL_TYPES_MASK, GUFO_LIST_ENDURANT_TYPES, \
+    GUFO_TYPES_BITS, OntologyDataClass, OntologyDataClassList
+from scior.modules.problems_treatment.treat_inconsistent import InconsistentOntology
+from scior.modules.rules.rule_group_ufo_unique import UFO_UNIQUE_RULES
+from scior.modules.taxonomy_index import TaxonomyIndex
+from scior.modules.type_aggregates import ANCESTORS, TypeAggregates
+from scior.modules.utils_dataclass import get_dataclass_by_id
+
+TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "test_files")
+
+with open(os.path.join(TEST_FILES_PATH, "all_tests.csv"), mode="r") as tests_file:
+    TEST_EXECUTIONS = [(row[0], row[2]) for row in list(csv.reader(tests_file))[1:]]
+
+
+def assert_ru01_shortcut(ontology_dataclass_list: OntologyDataClassList, taxonomy_index: TaxonomyIndex) -> int:
+    """ Asserts that, for every Sortal, the RU01 shortcut (a single superclass that is a Kind and none that can be a
+        Kind, according to the type aggregates) is taken if and only if the scan of the Sortal's superclasses finds a
+        single Kind and no candidate Kinds.
+
+    :param ontology_dataclass_list: List with all OntologyDataClass elements, including their URIs and internal lists.
+    :type ontology_dataclass_list: OntologyDataClassList
+    :param taxonomy_index: Taxonomy index whose type aggregates are used by RU01.
+    :type taxonomy_index: TaxonomyIndex
+    :return: Number of evaluated Sortals.
+    :rtype: int
+    """
+
+    evaluated_sortals = 0
+
+    for ontology_dataclass in ontology_dataclass_list:
+        if "Sortal" not in ontology_dataclass.is_type:
+            continue
+
+        evaluated_class = ontology_dataclass.uri_id
+        is_count, can_count, _ = taxonomy_index.type_aggregates.get_counts(evaluated_class, ANCESTORS, "Kind")
+
+        is_classes_list = []
+        can_classes_list = []
+
+        for superclass in taxonomy_index.get_superclass_ids(evaluated_class):
+            superclass_dataclass = get_dataclass_by_id(ontology_dataclass_list, superclass)
+            if "Kind" in superclass_dataclass.is_type:
+                is_classes_list.append(superclass)
+            elif "Kind" in superclass_dataclass.can_type:
+                can_classes_list.append(superclass)
+
+        assert (is_count == 1 and can_count == 0) == (len(is_classes_list) == 1 and not can_classes_list), \
+            ontology_dataclass.uri
+        evaluated_sortals += 1
+
+    return evaluated_sortals
+
+
+@pytest.mark.parametrize("random_seed", range(5))
+def test_ru01_shortcut_random(random_seed: int):
+    """ Checks the RU01 shortcut of all Sortals of a random taxonomy after random classification moves and new
+        rdfs:subClassOf relations.
+
+    :param random_seed: Seed of the random classes, relations and moves.
+    :type random_seed: int
+    """
+
+    generator = random.Random(random_seed)
+    uris = [f"http://example.org/class{position}" for position in range(25)]
+    ontology_dataclass_list = OntologyDataClassList(
+        [OntologyDataClass(uri=uri, can_mask=GUFO_ALL_TYPES_MASK) for uri in uris])
+
+    taxonomy_index = TaxonomyIndex(ontology_dataclass_list.uri_table)
+    for uri in uris:
+        taxonomy_index.add_triple((URIRef(uri), RDFS.subClassOf, URIRef(uri)))
+        taxonomy_index.add_triple((URIRef(uri), RDFS.subClassOf, URIRef(generator.choice(uris))))
+
+    # Most classes start with known Sortal and Kind states, so that the shortcut is taken for some Sortals
+    for ontology_dataclass in ontology_dataclass_list:
+        for classification, is_probability, not_probability in [("Sortal", 0.6, 0.3), ("Kind", 0.15, 0.75)]:
+            drawn_number = generator.random()
+            if drawn_number < is_probability + not_probability:
+                target_list = "is_type" if drawn_number < is_probability else "not_type"
+                ontology_dataclass.move_classification_from_can_type(classification, target_list)
+
+    taxonomy_index.type_aggregates = TypeAggregates(taxonomy_index, ontology_dataclass_list)
+    evaluated_sortals = 0
+
+    for step in range(80):
+        if generator.random() < 0.8:
+            ontology_dataclass = generator.choice(ontology_dataclass_list)
+            classification = generator.choice(GUFO_LIST_ENDURANT_TYPES)
+            if ontology_dataclass.can_mask & GUFO_TYPES_BITS[classification]:
+                target_list = generator.choice(["is_type", "not_type"])
+                ontology_dataclass.move_classification_from_can_type(classification, target_list)
+                ontology_dataclass_list.register_modification(ontology_dataclass, classification, target_list)
+        else:
+            taxonomy_index.add_triple((URIRef(generator.choice(uris)), RDFS.subClassOf,
+                                       URIRef(generator.choice(uris))))
+
+        evaluated_sortals += assert_ru01_shortcut(ontology_dataclass_list, taxonomy_index)
+
+    assert evaluated_sortals
+
+
+@pytest.mark.parametrize("input_file, assumption", TEST_EXECUTIONS)
+def test_ru01_shortcut_execution(monkeypatch, input_file: str, assumption: str):
+    """ Checks the RU01 shortcut of all Sortals before every execution of RU01 during the execution of a test file.
+
+    :param input_file: Name of the test file in the test_files directory.
+    :type input_file: str
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    """
+
+    ru01_declaration = UFO_UNIQUE_RULES[0]
+    run_ru01 = ru01_declaration.rule_function
+
+    def checked_run_ru01(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index,
+                         candidate_sets):
+        assert_ru01_shortcut(ontology_dataclass_list, taxonomy_index)
+        run_ru01(ontology_dataclass_list, ontology_graph, incompleteness_stack, rules_delta, taxonomy_index,
+                 candidate_sets)
+
+    monkeypatch.setattr(ru01_declaration, "rule_function", checked_run_ru01)
+
+    try:
+        run_scior_test_execution("input", os.path.join(TEST_FILES_PATH, input_file), assumption)
+    except InconsistentOntology:
+        pass
@@ -0,0 +1,119 @@
+""" Tests of the worklist closure of the gUFO rules, which must reach the same state of applying the rules' table in loop
+    until no rule changes it.
+"""
+import random
+
+import pytest
+
+import scior.modules.initialization_arguments as args
+from scior.modules.ontology_dataclassess.dataclass_definitions import GUFO_ALL_TYPES_MASK, GUFO_LIST_ENDURANT_TYPES, \
+    OntologyDataClass, OntologyDataClassList, classifications_to_mask
+from scior.modules.problems_treatment.treat_inconsistent import InconsistentOntology
+from scior.modules.rules.rule_loop_group_gufo import GUFO_ALL_RULES, execute_gufo_rules_for_dataclass, \
+    get_gufo_closure
+
+
+def get_naive_closure(is_types: set[str], not_types: set[str]) -> tuple[set[str], set[str]] | None:
+    """ Applies all gUFO rules, using their lists of classifications, until no rule changes the received state.
+
+    :param is_types: Classifications in the is_type list.
+    :type is_types: set[str]
+    :param not_types: Classifications in the not_type list.
+    :type not_types: set[str]
+    :return: The closed is_type and not_type classifications or None if a classification must be in both lists.
+    :rtype: tuple[set[str], set[str]] | None
+    """
+
+    is_types, not_types = set(is_types), set(not_types)
+    modified = True
+
+    while modified:
+        modified = False
+
+        for gufo_rule in GUFO_ALL_RULES:
+            if set(gufo_rule.is_premises) <= is_types and set(gufo_rule.not_premises) <= not_types:
+                if not set(gufo_rule.is_conclusions) <= is_types or not set(gufo_rule.not_conclusions) <= not_types:
+                    is_types.update(gufo_rule.is_conclusions)
+                    not_types.update(gufo_rule.not_conclusions)
+                    modified = True
+
+        if is_types & not_types:
+            return None
+
+    return is_types, not_types
+
+
+def get_test_states() -> list[tuple[set[str], set[str]]]:
+    """ Returns the initial states of the tests: the empty state, every single classification in each list and random
+        states with up to three classifications in each list. No classification is in both lists.
+    """
+
+    test_states = [(set(), set())]
+    test_states.extend(({gufo_type}, set()) for gufo_type in GUFO_LIST_ENDURANT_TYPES)
+    test_states.extend((set(), {gufo_type}) for gufo_type in GUFO_LIST_ENDURANT_TYPES)
+
+    generator = random.Random(0)
+    for _ in range(300):
+        drawn_types = generator.sample(GUFO_LIST_ENDURANT_TYPES, generator.randint(1, 6))
+        split_position = generator.randint(0, min(3, len(drawn_types)))
+        test_states.append((set(drawn_types[:split_position]), set(drawn_types[split_position:])))
+
+    return test_states
+
+
+TEST_STATES = get_test_states()
+
+
+def test_gufo_closure():
+    """ Checks if the memoized closure of every test state is the naive closure of the rules' table. """
+
+    for is_types, not_types in TEST_STATES:
+        naive_closure = get_naive_closure(is_types, not_types)
+        gufo_closure = get_gufo_closure(classifications_to_mask(is_types), classifications_to_mask(not_types))
+
+        if naive_closure is None:
+            assert gufo_closure is None, (is_types, not_types)
+        else:
+            expected_closure = tuple(classifications_to_mask(closed_types) for closed_types in naive_closure)
+            assert gufo_closure == expected_closure, (is_types, not_types)
+
+
+def test_gufo_closure_fixpoint():
+    """ Checks if every closed state is a fixpoint of the closure. """
+
+    for is_types, not_types in TEST_STATES:
+        gufo_closure = get_gufo_closure(classifications_to_mask(is_types), classifications_to_mask(not_types))
+        if gufo_closure is not None:
+            assert get_gufo_closure(*gufo_closure) == gufo_closure, (is_types, not_types)
+
+
+@pytest.mark.parametrize("is_types, not_types", TEST_STATES)
+def test_dataclass_closure(monkeypatch, is_types: set[str], not_types: set[str]):
+    """ Checks if a dataclass evaluated by the worklist reaches the naive closure of its state or, if it is
+        inconsistent, if the inconsistency is reported.
+
+    :param is_types: Classifications in the dataclass' is_type list.
+    :type is_types: set[str]
+    :param not_types: Classifications in the dataclass' not_type list.
+    :type not_types: set[str]
+    """
+
+    monkeypatch.setitem(args.ARGUMENTS, "is_debug", False)
+
+    is_mask, not_mask = classifications_to_mask(is_types), classifications_to_mask(not_types)
+    ontology_dataclass = OntologyDataClass(uri="http://example.org/X", is_mask=is_mask, not_mask=not_mask,
+                                           can_mask=GUFO_ALL_TYPES_MASK & ~(is_mask | not_mask))
+    ontology_dataclass_list = OntologyDataClassList([ontology_dataclass])
+    naive_closure = get_naive_closure(is_types, not_types)
+
+    if naive_closure is None:
+        with pytest.raises(InconsistentOntology):
+            execute_gufo_rules_for_dataclass(ontology_dataclass_list, ontology_dataclass)
+        return
+
+    execute_gufo_rules_for_dataclass(ontology_dataclass_list, ontology_dataclass)
+    closed_is_types, closed_not_types = naive_closure
+
+    assert set(ontology_dataclass.is_type) == closed_is_types
+    assert set(ontology_dataclass.not_type) == closed_not_types
+    assert set(ontology_dataclass.can_type) == set(GUFO_LIST_ENDURANT_TYPES) - closed_is_types - closed_not_types
@@ -0,0 +1,121 @@
+""" Tests of the native queries, whose seeded results must be equal to their filtered complete results. """
+import random
+
+import pytest
+from rdflib import OWL, RDF, RDFS, URIRef
+
+from scior.modules.rules.rule_native_queries import QuerySeed, query_typed_subclasses, query_typed_superclasses, \
+    query_intermediate_superclasses, query_related_classes, query_related_class_pairs, query_share_kind, \
+    query_sibling_subclasses, query_isolated_classes, query_unrelated_siblings
+from scior.modules.taxonomy_index import SCIOR_SHARE_KIND, SCIOR_SHARE_SUPER_CLASS, TaxonomyIndex
+
+GUFO_TYPES = ["Sortal", "NonSortal", "Kind", "Phase", "Role", "PhaseMixin", "Category", "Mixin", "AntiRigidType",
+              "RigidType"]
+
+NATIVE_QUERIES = [
+    (query_typed_subclasses, ("Sortal",), {}),
+    (query_typed_superclasses, ("Kind",), {"include_itself": False}),
+    (query_intermediate_superclasses, (["AntiRigidType", "Sortal"], ["Category"]), {}),
+    (query_intermediate_superclasses, ([], ["PhaseMixin"]), {"all_distinct": True}),
+    (query_related_classes, (None,), {}),
+    (query_related_class_pairs, ("NonSortal", "Sortal"), {}),
+    (query_share_kind, (None,), {}),
+    (query_share_kind, ("Phase",), {"include_itself": False}),
+    (query_sibling_subclasses, ("PhaseMixin", "Category"), {}),
+    (query_isolated_classes, (), {}),
+    (query_unrelated_siblings, ("PhaseMixin",), {}),
+    (query_unrelated_siblings, ("PhaseMixin",), {"project_z": False})
+]
+
+
+def create_random_taxonomy_index(random_seed: int, number_classes: int = 40) -> TaxonomyIndex:
+    """ Creates a taxonomy index with random types and relations. As in the working graph, the rdfs:subClassOf relation
+        is reflexive and transitive.
+
+    :param random_seed: Seed of the random generator, for reproducible indexes.
+    :type random_seed: int
+    :param number_classes: Number of classes in the index.
+    :type number_classes: int
+    :return: Randomly created taxonomy index.
+    :rtype: TaxonomyIndex
+    """
+
+    generator = random.Random(random_seed)
+    taxonomy_index = TaxonomyIndex()
+    classes = [URIRef(f"http://example.org/class{position}") for position in range(number_classes)]
+
+    for class_position, ontology_class in enumerate(classes):
+        taxonomy_index.add_triple((ontology_class, RDF.type, OWL.Class))
+        for gufo_type in generator.sample(GUFO_TYPES, 3):
+            taxonomy_index.add_triple((ontology_class, RDF.type, URIRef(f"http://purl.org/nemo/gufo#{gufo_type}")))
+        taxonomy_index.add_triple((ontology_class, RDFS.subClassOf, ontology_class))
+        if class_position:
+            for superclass in generator.sample(classes[:class_position], min(class_position, 2)):
+                taxonomy_index.add_triple((ontology_class, RDFS.subClassOf, superclass))
+
+    # Transitive closure, as the classes were created in a topological order
+    for class_id in range(number_classes):
+        for superclass_id in list(taxonomy_index.superclasses[class_id]):
+            for ancestor_id in list(taxonomy_index.superclasses[superclass_id]):
+                taxonomy_index.add_relation(class_id, RDFS.subClassOf, ancestor_id)
+
+    for _ in range(number_classes // 2):
+        class_x, class_y = generator.sample(classes, 2)
+        taxonomy_index.add_triple((class_x, SCIOR_SHARE_SUPER_CLASS, class_y))
+        taxonomy_index.add_triple((class_y, SCIOR_SHARE_SUPER_CLASS, class_x))
+        taxonomy_index.add_triple((class_x, SCIOR_SHARE_KIND, class_y))
+
+    return taxonomy_index
+
+
+@pytest.mark.parametrize("random_seed", range(5))
+@pytest.mark.parametrize("native_query, query_args, query_kwargs", NATIVE_QUERIES)
+def test_seeded_rows(native_query, query_args: tuple, query_kwargs: dict, random_seed: int):
+    """ Checks if the rows of a query seeded with all its variables are the complete result's rows touching the seed.
+
+    :param native_query: Native query function being tested.
+    :param query_args: Positional arguments of the query, after the taxonomy index.
+    :type query_args: tuple
+    :param query_kwargs: Keyword arguments of the query.
+    :type query_kwargs: dict
+    :param random_seed: Seed of the random taxonomy index and of the seed's classes.
+    :type random_seed: int
+    """
+
+    taxonomy_index = create_random_taxonomy_index(random_seed)
+    seed_classes = set(random.Random(random_seed).sample(range(len(taxonomy_index.nodes)), 4))
+
+    complete_result = native_query(taxonomy_index, *query_args, **query_kwargs)
+    seeded_result = native_query(taxonomy_index, *query_args, seed=QuerySeed(seed_classes, None), **query_kwargs)
+    expected_result = [row for row in complete_result if any(value in seed_classes for value in row)]
+
+    assert len(seeded_result) == len(set(seeded_result))
+    assert set(seeded_result) == set(expected_result)
+
+
+@pytest.mark.parametrize("random_seed", range(5))
+@pytest.mark.parametrize("native_query, query_args, query_kwargs", NATIVE_QUERIES)
+def test_seeded_variable(native_query, query_args: tuple, query_kwargs: dict, random_seed: int):
+    """ Checks if the rows of a query seeded with a single variable are the complete result's rows whose variable is
+        bound to a seed's class.
+
+    :param native_query: Native query function being tested.
+    :param query_args: Positional arguments of the query, after the taxonomy index.
+    :type query_args: tuple
+    :param query_kwargs: Keyword arguments of the query.
+    :type query_kwargs: dict
+    :param random_seed: Seed of the random taxonomy index and of the seed's classes.
+    :type random_seed: int
+    """
+
+    taxonomy_index = create_random_taxonomy_index(random_seed)
+    seed_classes = set(random.Random(random_seed).sample(range(len(taxonomy_index.nodes)), 8))
+    complete_result = native_query(taxonomy_index, *query_args, **query_kwargs)
+
+    for variable in complete_result[0]._fields if complete_result else []:
+        seeded_result = native_query(taxonomy_index, *query_args, seed=QuerySeed(seed_classes, [variable]),
+                                     **query_kwargs)
+        expected_result = [row for row in complete_result if getattr(row, variable) in seed_classes]
+
+        assert set(seeded_result) == set(expected_result)
+
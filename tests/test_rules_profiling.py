@@ -0,0 +1,117 @@
+""" Tests of the opt-in profiling of the rules executed in loop. """
+import json
+import os
+
+import pytest
+
+import scior.modules.initialization_arguments as args
+from scior.main import run_scior_test_execution
+from scior.modules.rules.rules_profiling import RULES_PROFILES, get_rules_profiles_summary, print_rules_profiles, \
+    record_incompleteness, record_move, record_query, save_rules_profiles, start_gufo_closure, start_rule_profile, \
+    start_rules_profiling, stop_gufo_closure, stop_rule_profile
+
+TEST_FILE = os.path.join(os.path.dirname(__file__), "test_files", "test_ru01a_in.ttl")
+
+
+def test_rule_profile():
+    """ Checks the measures recorded for the executions of a rule and their summary. """
+
+    start_rules_profiling()
+
+    for iteration in [1, 2]:
+        start_time = start_rule_profile("RT01", "rule_group_test", iteration)
+        record_query(0.5, 10)
+        record_move(True)
+        record_move(False)
+        gufo_start_time = start_gufo_closure()
+        # Moves of the gUFO rules are part of the closure and are not recorded
+        record_move(True)
+        stop_gufo_closure(gufo_start_time)
+        record_incompleteness()
+        stop_rule_profile(start_time - 1.0)
+
+    assert len(RULES_PROFILES) == 2
+    assert RULES_PROFILES[0].treatment_time == pytest.approx(RULES_PROFILES[0].wall_time - 0.5)
+
+    rule_summary, = get_rules_profiles_summary()
+
+    assert rule_summary["executions"] == 2
+    assert rule_summary["query_time"] == pytest.approx(1.0)
+    assert rule_summary["result_rows"] == 20
+    assert (rule_summary["effective_moves"], rule_summary["redundant_moves"]) == (2, 2)
+    assert rule_summary["incompleteness_entries"] == 2
+    assert rule_summary["gufo_closure_time"] > 0
+
+
+def test_printed_table(capsys):
+    """ Checks if the summary of the recorded profiles is printed as a table with one row per rule. """
+
+    start_rules_profiling()
+    for rule_code in ["RT01", "RT02"]:
+        start_time = start_rule_profile(rule_code, "rule_group_test", 1)
+        record_query(0.1, 3)
+        stop_rule_profile(start_time)
+
+    print_rules_profiles()
+    printed_table = capsys.readouterr().out
+
+    assert "RT01" in printed_table and "RT02" in printed_table and "rule_group_test" in printed_table
+
+
+def test_rule_without_queries(tmp_path, monkeypatch, capsys):
+    """ Checks if the query measures of a rule that executed no query are reported as N/A (null in the JSON file). """
+
+    start_rules_profiling()
+    start_time = start_rule_profile("RT02", "rule_group_test", 1)
+    stop_rule_profile(start_time)
+
+    rule_summary, = get_rules_profiles_summary()
+
+    assert rule_summary["query_time"] is None and rule_summary["result_rows"] is None
+    assert rule_summary["treatment_time"] == pytest.approx(rule_summary["wall_time"])
+
+    print_rules_profiles()
+    assert "N/A" in capsys.readouterr().out
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(args.ARGUMENTS, "ontology_path", "ontology.ttl")
+    save_rules_profiles("20000101-000000")
+
+    with open(os.path.join(str(tmp_path), "results", "ontology-20000101-000000-rules-profiling.json")) as json_file:
+        profiling_content = json.load(json_file)
+
+    assert profiling_content["rules"][0]["query_time"] is None
+    assert profiling_content["executions"][0]["result_rows"] is None
+
+
+def test_no_rule_profiled():
+    """ Checks if nothing is recorded when no rule is being profiled. """
+
+    start_rules_profiling()
+    record_query(1.0, 1)
+    record_move(True)
+    record_incompleteness()
+
+    assert start_gufo_closure() is None
+    assert not RULES_PROFILES
+
+
+@pytest.mark.parametrize("is_sparql_rules", [False, True])
+def test_profiled_execution(monkeypatch, is_sparql_rules: bool):
+    """ Checks if all executed rules are profiled in an execution. RU01 reads the classes' relations directly and has
+        no query measures.
+
+    :param is_sparql_rules: Indicates if the SPARQL rules mode is used.
+    :type is_sparql_rules: bool
+    """
+
+    monkeypatch.setitem(args.OPTIONAL_ARGUMENTS_DEFAULTS, "is_rules_profiling", True)
+    monkeypatch.setitem(args.OPTIONAL_ARGUMENTS_DEFAULTS, "is_sparql_rules", is_sparql_rules)
+
+    run_scior_test_execution("input", TEST_FILE, "cwa")
+
+    rules_summary = {rule_summary["rule_code"]: rule_summary for rule_summary in get_rules_profiles_summary()}
+
+    assert {"RA01", "RU01", "RS01", "RC05"} <= set(rules_summary)
+    assert rules_summary["RA01"]["query_time"] is not None
+    assert rules_summary["RU01"]["query_time"] is None and rules_summary["RU01"]["result_rows"] is None
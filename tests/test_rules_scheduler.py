@@ -0,0 +1,122 @@
+""" Tests of the scheduler of the rules executed in loop. """
+import csv
+import os
+
+import pytest
+
+import scior.main as scior_main
+import scior.modules.initialization_arguments as args
+import scior.modules.rules.rules_scheduler as rules_scheduler
+from scior.main import run_scior_test_execution
+from scior.modules.problems_treatment.treat_inconsistent import InconsistentOntology
+from scior.modules.rules.rule_scheduler_definitions import RuleDeclaration
+from scior.modules.rules.rules_scheduler import RULES_GROUPS_DECLARATIONS, build_rules_dependency_graph, \
+    get_strongly_connected_components, order_rules_declarations
+
+TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "test_files")
+
+with open(os.path.join(TEST_FILES_PATH, "all_tests.csv"), mode="r") as tests_file:
+    TEST_EXECUTIONS = [(row[0], row[2]) for row in list(csv.reader(tests_file))[1:]]
+
+
+def get_execution_result(monkeypatch, input_file: str, assumption: str) -> tuple:
+    """ Executes Scior in a test file and returns its classifications and incompleteness entries.
+
+    :param input_file: Name of the test file in the test_files directory.
+    :type input_file: str
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    :return: The is, can and not bitmasks of each class, indexed by its URI, and the (rule code, URI, message) of the
+    entries of the incompleteness stack, in the stack's order. The string 'inconsistent' if the ontology is
+    inconsistent.
+    :rtype: tuple
+    """
+
+    incompleteness_stacks = []
+    execute_rules_types = scior_main.execute_rules_types
+
+    def recorded_execute_rules_types(*arguments):
+        incompleteness_stacks.append(execute_rules_types(*arguments))
+        return incompleteness_stacks[-1]
+
+    monkeypatch.setattr(scior_main, "execute_rules_types", recorded_execute_rules_types)
+
+    try:
+        ontology_dataclass_list = run_scior_test_execution("input", os.path.join(TEST_FILES_PATH, input_file),
+                                                           assumption)
+    except InconsistentOntology:
+        return "inconsistent", None
+
+    classifications = {ontology_dataclass.uri: (ontology_dataclass.is_mask, ontology_dataclass.can_mask,
+                                                ontology_dataclass.not_mask)
+                       for ontology_dataclass in ontology_dataclass_list}
+    incompleteness_entries = [(entry.rule_code, entry.affected_dataclass_uri, entry.incompleteness_message)
+                              for entry in incompleteness_stacks[-1]]
+
+    return classifications, incompleteness_entries
+
+
+@pytest.mark.parametrize("is_sparql_rules", [False, True])
+@pytest.mark.parametrize("input_file, assumption", TEST_EXECUTIONS)
+def test_candidate_sets(monkeypatch, input_file: str, assumption: str, is_sparql_rules: bool):
+    """ Checks if skipping the treatment of the results whose candidate sets did not change (rules of groups UFO Unique
+        and UFO Some) produces the same classifications and incompleteness stack of treating all results.
+
+    :param input_file: Name of the test file in the test_files directory.
+    :type input_file: str
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    :param is_sparql_rules: Indicates if the SPARQL rules mode is used.
+    :type is_sparql_rules: bool
+    """
+
+    monkeypatch.setitem(args.OPTIONAL_ARGUMENTS_DEFAULTS, "is_sparql_rules", is_sparql_rules)
+    skipping_result = get_execution_result(monkeypatch, input_file, assumption)
+
+    switch_rule_execution = rules_scheduler.switch_rule_execution
+
+    def switch_rule_execution_without_candidate_sets(*arguments):
+        switch_rule_execution(*arguments[:6], None)
+
+    monkeypatch.setattr(rules_scheduler, "switch_rule_execution", switch_rule_execution_without_candidate_sets)
+    treating_result = get_execution_result(monkeypatch, input_file, assumption)
+
+    assert skipping_result == treating_result
+
+
+def test_rules_dependency_graph():
+    """ Checks if the dependency graph of all rules executed in loop forms a single strongly connected component, in
+        which case they are executed in declaration order. If a change in the rules' read or write sets splits the
+        graph, this test fails and the ordering of the components must be revised.
+    """
+
+    rule_declarations = [rule_declaration for group_declarations in RULES_GROUPS_DECLARATIONS.values()
+                         for rule_declaration in group_declarations]
+    rule_codes = [rule_declaration.rule_code for rule_declaration in rule_declarations]
+
+    assert all(rule_declaration.reads and rule_declaration.writes for rule_declaration in rule_declarations)
+
+    dependency_graph = build_rules_dependency_graph(rule_declarations)
+    components = get_strongly_connected_components(dependency_graph)
+
+    assert len(components) == 1 and sorted(components[0]) == sorted(rule_codes)
+    assert order_rules_declarations(rule_declarations) == rule_declarations
+
+
+def test_rules_ordering():
+    """ Checks if rules are ordered by the topological order of their components and, inside each component and among
+        independent components, by declaration order.
+    """
+
+    def declare_rule(rule_code: str, reads: list[str], writes: list[str]) -> RuleDeclaration:
+        return RuleDeclaration(rule_code, "test", print, reads=reads, writes=writes)
+
+    rule_declarations = [declare_rule("R1", ["ex:c"], ["ex:d"]),
+                         declare_rule("R2", ["ex:a"], ["ex:b"]),
+                         declare_rule("R3", ["ex:b"], ["ex:a", "ex:c"]),
+                         declare_rule("R4", ["ex:e"], ["ex:e"])]
+
+    assert build_rules_dependency_graph(rule_declarations) == {"R1": [], "R2": ["R3"], "R3": ["R1", "R2"],
+                                                               "R4": ["R4"]}
+    assert [rule_declaration.rule_code for rule_declaration in order_rules_declarations(rule_declarations)] == \
+           ["R2", "R3", "R1", "R4"]
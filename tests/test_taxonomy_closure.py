@@ -0,0 +1,133 @@
+""" Tests of the closure engine of the rdfs:subClassOf relation, which must be equal to the relations obtained by a
+    naive application of the rules of group BASE.
+"""
+import glob
+import os
+import random
+
+import pytest
+from rdflib import BNode, Graph, OWL, RDF, RDFS, URIRef
+
+from scior.modules.rules.rule_group_base import execute_rules_base
+from scior.modules.taxonomy_closure import build_taxonomy_closure
+from scior.modules.taxonomy_index import SCIOR_SHARE_SUPER_CLASS
+from scior.modules.utils_rdf import load_all_graph_safely
+
+TEST_FILES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "test_files", "*_in.ttl")))
+TEST_GRAPHS = [os.path.basename(test_file) for test_file in TEST_FILES] + [f"random{seed}" for seed in range(10)]
+
+
+def create_random_graph(random_seed: int, number_nodes: int = 30) -> Graph:
+    """ Creates a graph with random rdfs:subClassOf relations, including cycles, between owl:Class instances and nodes
+        that are not (URIs without type and blank nodes).
+
+    :param random_seed: Seed of the random generator, for reproducible graphs.
+    :type random_seed: int
+    :param number_nodes: Number of nodes in the graph.
+    :type number_nodes: int
+    :return: Randomly created graph.
+    :rtype: Graph
+    """
+
+    generator = random.Random(random_seed)
+    random_graph = Graph()
+    nodes = [URIRef(f"http://example.org/node{position}") if position % 7 else BNode(f"b{position}")
+             for position in range(number_nodes)]
+
+    for node in nodes:
+        if generator.random() < 0.8:
+            random_graph.add((node, RDF.type, OWL.Class))
+
+    for _ in range(number_nodes * 2):
+        random_graph.add((generator.choice(nodes), RDFS.subClassOf, generator.choice(nodes)))
+
+    return random_graph
+
+
+def get_naive_closure(ontology_graph: Graph) -> set[tuple]:
+    """ Returns the rdfs:subClassOf relations of the graph after the rules RB01 and RB02: the graph's relations, the
+        reflexive relation of every owl:Class and the relation between every pair of owl:Class instances connected by a
+        path of rdfs:subClassOf relations.
+
+    :param ontology_graph: Graph whose relations are closed.
+    :type ontology_graph: Graph
+    :return: Set of (subclass, superclass) pairs.
+    :rtype: set[tuple]
+    """
+
+    owl_classes = set(ontology_graph.subjects(RDF.type, OWL.Class))
+    closure = set(ontology_graph.subject_objects(RDFS.subClassOf))
+
+    for subclass in owl_classes:
+        closure.add((subclass, subclass))
+        reached_nodes = set()
+        pending_nodes = [subclass]
+
+        while pending_nodes:
+            for superclass in ontology_graph.objects(pending_nodes.pop(), RDFS.subClassOf):
+                if superclass not in reached_nodes:
+                    reached_nodes.add(superclass)
+                    pending_nodes.append(superclass)
+
+        closure.update((subclass, superclass) for superclass in reached_nodes if superclass in owl_classes)
+
+    return closure
+
+
+def get_test_graph(graph_name: str) -> Graph:
+    """ Returns the graph of a test file or, for names starting with 'random', a random graph.
+
+    :param graph_name: Name of the test file or 'random' followed by the random graph's seed.
+    :type graph_name: str
+    :return: Tested graph.
+    :rtype: Graph
+    """
+
+    if graph_name.startswith("random"):
+        return create_random_graph(int(graph_name[len("random"):]))
+
+    return load_all_graph_safely(os.path.join(os.path.dirname(__file__), "test_files", graph_name))
+
+
+@pytest.mark.parametrize("graph_name", TEST_GRAPHS)
+def test_closure_relations(graph_name: str):
+    """ Checks if the superclasses and subclasses of every node in the closure are the ones of the naive closure.
+
+    :param graph_name: Name of the test file or 'random' followed by the random graph's seed.
+    :type graph_name: str
+    """
+
+    ontology_graph = get_test_graph(graph_name)
+    naive_closure = get_naive_closure(ontology_graph)
+    taxonomy_closure = build_taxonomy_closure(ontology_graph)
+
+    for node in taxonomy_closure.nodes:
+        assert set(taxonomy_closure.get_superclasses(node)) == {y for x, y in naive_closure if x == node}, graph_name
+        assert set(taxonomy_closure.get_subclasses(node)) == {x for x, y in naive_closure if y == node}, graph_name
+
+    assert all(taxonomy_closure.is_subclass_of(x, y) for x, y in naive_closure)
+    assert taxonomy_closure.count_relations() == len(naive_closure)
+
+    first_node, last_node = taxonomy_closure.nodes[0], taxonomy_closure.nodes[-1]
+    assert taxonomy_closure.is_subclass_of(first_node, last_node) == ((first_node, last_node) in naive_closure)
+    assert not taxonomy_closure.is_subclass_of(first_node, URIRef("http://example.org/unknown"))
+
+
+@pytest.mark.parametrize("graph_name", TEST_GRAPHS)
+def test_materialized_relations(graph_name: str):
+    """ Checks if the relations written into the graph by the rules of group BASE are the ones of the naive closure and
+        if scior:shareSuperClass holds between all nodes that share a superclass in it.
+
+    :param graph_name: Name of the test file or 'random' followed by the random graph's seed.
+    :type graph_name: str
+    """
+
+    ontology_graph = get_test_graph(graph_name)
+    naive_closure = get_naive_closure(ontology_graph)
+    execute_rules_base(ontology_graph)
+
+    naive_share_super_class = {(x, other_x) for x, y in naive_closure for other_x, other_y in naive_closure
+                               if y == other_y}
+
+    assert set(ontology_graph.subject_objects(RDFS.subClassOf)) == naive_closure, graph_name
+    assert set(ontology_graph.subject_objects(SCIOR_SHARE_SUPER_CLASS)) == naive_share_super_class, graph_name
@@ -0,0 +1,200 @@
+""" Tests of the native taxonomy index, which must mirror the working graph, of its scior:shareKind partition and of the
+    rules evaluated over it, which must classify the test files in the same way of the SPARQL rules and of the
+    vectorized gUFO rules.
+"""
+import csv
+import glob
+import os
+import random
+
+import pytest
+from rdflib import Graph, OWL, RDF, RDFS, URIRef
+
+import scior.modules.initialization_arguments as args
+from scior.main import run_scior_test_execution
+from scior.modules.problems_treatment.treat_inconsistent import InconsistentOntology
+from scior.modules.resources_gufo import GUFO_NAMESPACE
+from scior.modules.rules.rule_group_base import execute_rules_base
+from scior.modules.taxonomy_index import SCIOR_SHARE_KIND, SCIOR_SHARE_SUPER_CLASS, GraphTaxonomyRelations, \
+    KindPartition, TaxonomyIndex, build_taxonomy_index
+from scior.modules.utils_rdf import load_all_graph_safely
+
+TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "test_files")
+TEST_FILES = sorted(glob.glob(os.path.join(TEST_FILES_PATH, "*_in.ttl")))
+
+with open(os.path.join(TEST_FILES_PATH, "all_tests.csv"), mode="r") as tests_file:
+    TEST_EXECUTIONS = [(row[0], row[2]) for row in list(csv.reader(tests_file))[1:]]
+
+
+def get_execution_result(input_file: str, assumption: str) -> dict | str:
+    """ Executes Scior in a test file and returns its classifications.
+
+    :param input_file: Name of the test file in the test_files directory.
+    :type input_file: str
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    :return: The is, can and not bitmasks and the incompleteness of each class, indexed by its URI, or the string
+    'inconsistent' if the ontology is inconsistent.
+    :rtype: dict | str
+    """
+
+    try:
+        ontology_dataclass_list = run_scior_test_execution("input", os.path.join(TEST_FILES_PATH, input_file),
+                                                           assumption)
+    except InconsistentOntology:
+        return "inconsistent"
+
+    return {ontology_dataclass.uri: (ontology_dataclass.is_mask, ontology_dataclass.can_mask,
+                                     ontology_dataclass.not_mask, ontology_dataclass.is_incomplete)
+            for ontology_dataclass in ontology_dataclass_list}
+
+
+@pytest.mark.parametrize("turtle_file", TEST_FILES, ids=os.path.basename)
+def test_index_mirrors_graph(turtle_file: str):
+    """ Checks if the index built from the working graph (after the rules of group BASE) has the same relations,
+        owl:Class instances and gUFO types of the graph.
+
+    :param turtle_file: Path of the test file.
+    :type turtle_file: str
+    """
+
+    ontology_graph = load_all_graph_safely(turtle_file)
+    execute_rules_base(ontology_graph)
+
+    taxonomy_index = build_taxonomy_index(ontology_graph)
+    graph_relations = GraphTaxonomyRelations(ontology_graph, taxonomy_index.uri_table)
+    node_ids = range(len(taxonomy_index.nodes))
+
+    for predicate in [RDFS.subClassOf, SCIOR_SHARE_SUPER_CLASS, SCIOR_SHARE_KIND]:
+        for subject_id in node_ids:
+            for object_id in node_ids:
+                relation = (subject_id, predicate, object_id)
+                assert (relation in taxonomy_index) == (relation in graph_relations), relation
+
+    for node_id in node_ids:
+        assert taxonomy_index.get_superclass_ids(node_id) == set(graph_relations.get_superclass_ids(node_id))
+        assert taxonomy_index.get_subclass_ids(node_id) == set(graph_relations.get_subclass_ids(node_id))
+
+    graph_classes = ontology_graph.subjects(RDF.type, OWL.Class)
+    assert taxonomy_index.owl_classes == {taxonomy_index.get_node_id(owl_class) for owl_class in graph_classes}
+
+    for subject_node, object_node in ontology_graph.subject_objects(RDF.type):
+        if isinstance(object_node, URIRef) and object_node.startswith(GUFO_NAMESPACE):
+            gufo_type = object_node[len(GUFO_NAMESPACE):]
+            assert taxonomy_index.get_node_id(subject_node) in taxonomy_index.get_type_members(gufo_type)
+
+
+def test_ancestors_cache():
+    """ Checks if the memoized ancestors of a node are updated when a new rdfs:subClassOf relation is added. """
+
+    taxonomy_index = TaxonomyIndex()
+    class_a, class_b, class_c = [URIRef(f"http://example.org/{name}") for name in "ABC"]
+
+    taxonomy_index.add_triple((class_a, RDFS.subClassOf, class_b))
+    node_a, node_b, node_c = [taxonomy_index.get_node_id(node) for node in [class_a, class_b, class_c]]
+
+    assert taxonomy_index.get_ancestors(node_a) == {node_a, node_b}
+    assert not taxonomy_index.add_triple((class_a, RDFS.subClassOf, class_b))
+
+    assert taxonomy_index.add_triple((class_b, RDFS.subClassOf, class_c))
+    assert taxonomy_index.get_ancestors(node_a) == {node_a, node_b, node_c}
+    assert taxonomy_index.get_node_id(URIRef("http://example.org/D"), create=False) is None
+
+
+@pytest.mark.parametrize("execution_mode", ["is_sparql_rules", "is_vectorized_gufo"])
+@pytest.mark.parametrize("input_file, assumption", TEST_EXECUTIONS)
+def test_execution_modes(monkeypatch, input_file: str, assumption: str, execution_mode: str):
+    """ Checks if the rules evaluated over the native index classify the test file in the same way of another execution
+        mode: the SPARQL rules (-sr) or the vectorized gUFO rules (-vg).
+
+    :param input_file: Name of the test file in the test_files directory.
+    :type input_file: str
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    :param execution_mode: Argument that selects the execution mode compared to the native one.
+    :type execution_mode: str
+    """
+
+    if execution_mode == "is_vectorized_gufo":
+        pytest.importorskip("numpy")
+
+    native_result = get_execution_result(input_file, assumption)
+
+    monkeypatch.setitem(args.OPTIONAL_ARGUMENTS_DEFAULTS, execution_mode, True)
+    mode_result = get_execution_result(input_file, assumption)
+
+    assert mode_result == native_result
+
+
+@pytest.mark.parametrize("random_seed", range(5))
+def test_kind_partition_merges(random_seed: int):
+    """ Checks if the blocks of the partition are the equivalence classes of the received scior:shareKind relations.
+
+    :param random_seed: Seed of the random relations.
+    :type random_seed: int
+    """
+
+    generator = random.Random(random_seed)
+    kind_partition = KindPartition()
+    naive_blocks = {}
+
+    for _ in range(40):
+        node_x, node_y = generator.randrange(50), generator.randrange(50)
+        is_expected_change = node_x not in naive_blocks or node_y not in naive_blocks or \
+            naive_blocks[node_x] is not naive_blocks[node_y]
+
+        merged_block = naive_blocks.get(node_x, {node_x}) | naive_blocks.get(node_y, {node_y})
+        for member_id in merged_block:
+            naive_blocks[member_id] = merged_block
+
+        assert kind_partition.add_share_kind(node_x, node_y) == is_expected_change
+
+    for node_x in range(60):
+        assert set(kind_partition.get_block_members(node_x)) == naive_blocks.get(node_x, set())
+        for node_y in range(60):
+            assert kind_partition.shares_kind(node_x, node_y) == (node_y in naive_blocks.get(node_x, set()))
+
+    node_ids = generator.sample(range(60), 30)
+    assert kind_partition.count_partitions(node_ids) == \
+           len({id(naive_blocks[node_id]) if node_id in naive_blocks else -node_id - 1 for node_id in node_ids})
+
+
+def test_kind_partition_kinds():
+    """ Checks if the Kinds of the blocks are registered and if the changed blocks are returned only once. """
+
+    kind_partition = KindPartition()
+
+    assert kind_partition.add_kind_subclass(1, 0)
+    assert kind_partition.add_kind_subclass(2, 0)
+    assert not kind_partition.add_kind_subclass(2, 0)
+    (changed_members, changed_kinds), = kind_partition.pop_changed_blocks()
+    assert (sorted(changed_members), changed_kinds) == ([0, 1, 2], [0])
+    assert kind_partition.pop_changed_blocks() == []
+
+    assert kind_partition.add_kind_subclass(4, 3)
+    assert kind_partition.add_share_kind(4, 1)
+    (changed_members, changed_kinds), = kind_partition.pop_changed_blocks()
+    assert (sorted(changed_members), sorted(changed_kinds)) == ([0, 1, 2, 3, 4], [0, 3])
+
+    assert kind_partition.get_partition_id(5) == 5 and kind_partition.get_block_members(5) == []
+    assert kind_partition.count_partitions([0, 3, 5, 6]) == 3
+
+
+def test_graph_kind_partition():
+    """ Checks if the partition of the graph's scior:shareKind relations, used with the SPARQL rules, has the same
+        blocks of the partition kept by the taxonomy index.
+    """
+
+    ontology_graph = Graph()
+    classes = [URIRef(f"http://example.org/class{position}") for position in range(6)]
+
+    for class_x, class_y in [(0, 1), (1, 2), (3, 4), (2, 0)]:
+        ontology_graph.add((classes[class_x], SCIOR_SHARE_KIND, classes[class_y]))
+
+    taxonomy_index = build_taxonomy_index(ontology_graph)
+    graph_relations = GraphTaxonomyRelations(ontology_graph, taxonomy_index.uri_table)
+
+    for class_x in classes:
+        node_x = taxonomy_index.get_node_id(class_x)
+        assert set(graph_relations.kind_partition.get_block_members(node_x)) == \
+               set(taxonomy_index.kind_partition.get_block_members(node_x))
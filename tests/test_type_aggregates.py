@@ -0,0 +1,135 @@
+""" Tests of the incrementally maintained type aggregates, whose counts must always be equal to the ones obtained by
+    scanning the ancestors and descendants of each class.
+"""
+import csv
+import os
+import random
+
+import pytest
+from rdflib import RDFS, URIRef
+
+from scior.main import run_scior_test_execution
+from scior.modules.ontology_dataclassess.dataclass_definitions import GUFO_ALL_TYPES_MASK, GUFO_LIST_ENDURANT_TYPES, \
+    GUFO_TYPES_BITS, OntologyDataClass, OntologyDataClassList
+from scior.modules.problems_treatment.treat_inconsistent import InconsistentOntology
+from scior.modules.taxonomy_index import TaxonomyIndex
+from scior.modules.type_aggregates import ANCESTORS, DESCENDANTS, TypeAggregates, get_classification_state
+
+TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "test_files")
+
+with open(os.path.join(TEST_FILES_PATH, "all_tests.csv"), mode="r") as tests_file:
+    TEST_EXECUTIONS = [(row[0], row[2]) for row in list(csv.reader(tests_file))[1:]]
+
+
+def get_scanned_counts(aggregates: TypeAggregates, node_id: int, direction: str,
+                       gufo_type: str) -> tuple[int, int, int]:
+    """ Returns the numbers of ancestors or descendants of the node that are, can be and cannot be of a gUFO type,
+        obtained by scanning them.
+
+    :param aggregates: Aggregates whose taxonomy index and dataclasses are scanned.
+    :type aggregates: TypeAggregates
+    :param node_id: Id of the evaluated node.
+    :type node_id: int
+    :param direction: Related nodes to be counted. Allowed values are ANCESTORS and DESCENDANTS.
+    :type direction: str
+    :param gufo_type: gUFO type (in short form, e.g., Kind) whose states are counted.
+    :type gufo_type: str
+    :return: Numbers of related nodes with the type in their is_type, can_type and not_type lists, in this order.
+    :rtype: tuple[int, int, int]
+    """
+
+    taxonomy_index = aggregates.taxonomy_index
+    related_ids = taxonomy_index.superclasses[node_id] if direction == ANCESTORS else taxonomy_index.subclasses[node_id]
+    counts = [0, 0, 0]
+
+    for related_id in related_ids:
+        ontology_dataclass = aggregates.ontology_dataclass_list.get_by_id(related_id)
+        if ontology_dataclass is None:
+            continue
+        masks = (ontology_dataclass.is_mask, ontology_dataclass.can_mask, ontology_dataclass.not_mask)
+        state = get_classification_state(masks, GUFO_TYPES_BITS[gufo_type])
+        if state is not None:
+            counts[state] += 1
+
+    return counts[0], counts[1], counts[2]
+
+
+def assert_aggregates_counts(aggregates: TypeAggregates, tracked_pairs: list[tuple[str, str]]) -> None:
+    """ Asserts that the aggregated counts of the received pairs are the scanned ones for all nodes of the index. """
+
+    for node_id in range(len(aggregates.taxonomy_index.nodes)):
+        for direction, gufo_type in tracked_pairs:
+            assert aggregates.get_counts(node_id, direction, gufo_type) == \
+                   get_scanned_counts(aggregates, node_id, direction, gufo_type), (node_id, direction, gufo_type)
+
+
+@pytest.mark.parametrize("random_seed", range(5))
+def test_incremental_counts(random_seed: int):
+    """ Checks if the counts are kept equal to the scanned ones after random classification moves and new
+        rdfs:subClassOf relations, including relations to nodes without dataclasses.
+
+    :param random_seed: Seed of the random classes, relations and moves.
+    :type random_seed: int
+    """
+
+    generator = random.Random(random_seed)
+    uris = [f"http://example.org/class{position}" for position in range(25)]
+    ontology_dataclass_list = OntologyDataClassList(
+        [OntologyDataClass(uri=uri, can_mask=GUFO_ALL_TYPES_MASK) for uri in uris])
+
+    taxonomy_index = TaxonomyIndex(ontology_dataclass_list.uri_table)
+    for uri in uris:
+        taxonomy_index.add_triple((URIRef(uri), RDFS.subClassOf, URIRef(uri)))
+        taxonomy_index.add_triple((URIRef(uri), RDFS.subClassOf, URIRef(generator.choice(uris))))
+
+    aggregates = TypeAggregates(taxonomy_index, ontology_dataclass_list)
+    taxonomy_index.type_aggregates = aggregates
+    tracked_pairs = [(ANCESTORS, "Kind"), (DESCENDANTS, "Sortal")]
+    assert_aggregates_counts(aggregates, tracked_pairs)
+
+    for step in range(60):
+        if step == 30:
+            # Pairs tracked after moves and relations were added are calculated from the current state
+            tracked_pairs.extend([(ANCESTORS, "Role"), (DESCENDANTS, "NonSortal")])
+
+        if generator.random() < 0.7:
+            ontology_dataclass = generator.choice(ontology_dataclass_list)
+            if ontology_dataclass.can_mask:
+                classification = generator.choice([gufo_type for gufo_type in GUFO_LIST_ENDURANT_TYPES
+                                                   if ontology_dataclass.can_mask & GUFO_TYPES_BITS[gufo_type]])
+                target_list = generator.choice(["is_type", "not_type"])
+                ontology_dataclass.move_classification_from_can_type(classification, target_list)
+                ontology_dataclass_list.register_modification(ontology_dataclass, classification, target_list)
+        else:
+            superclass_uri = generator.choice(uris + [f"http://example.org/external{step}"])
+            taxonomy_index.add_triple((URIRef(generator.choice(uris)), RDFS.subClassOf, URIRef(superclass_uri)))
+
+        assert_aggregates_counts(aggregates, tracked_pairs)
+
+
+@pytest.mark.parametrize("input_file, assumption", TEST_EXECUTIONS)
+def test_execution_counts(monkeypatch, input_file: str, assumption: str):
+    """ Checks if all counts used by the rules during the execution of a test file are equal to the scanned ones.
+
+    :param input_file: Name of the test file in the test_files directory.
+    :type input_file: str
+    :param assumption: World-assumption of the execution. Valid values: 'cwa', 'owa', 'owaf'.
+    :type assumption: str
+    """
+
+    aggregated_get_counts = TypeAggregates.get_counts
+    checked_counts = []
+
+    def checked_get_counts(aggregates: TypeAggregates, node_id: int, direction: str, gufo_type: str):
+        counts = aggregated_get_counts(aggregates, node_id, direction, gufo_type)
+        checked_counts.append(counts == get_scanned_counts(aggregates, node_id, direction, gufo_type))
+        return counts
+
+    monkeypatch.setattr(TypeAggregates, "get_counts", checked_get_counts)
+
+    try:
+        run_scior_test_execution("input", os.path.join(TEST_FILES_PATH, input_file), assumption)
+    except InconsistentOntology:
+        pass
+
+    assert all(checked_counts)
@@ -0,0 +1,42 @@
+""" Tests of the interning table of URIs and their integer ids. """
+from rdflib import BNode, Literal, URIRef
+
+from scior.modules.uri_table import UriTable
+
+
+def test_uri_round_trip():
+    """ Checks if URI strings and RDFLib nodes receive dense ids in registration order and are recovered from them. """
+
+    uri_table = UriTable()
+    blank_node = BNode()
+    nodes = ["http://example.org/A", URIRef("http://example.org/B"), blank_node, Literal("C")]
+
+    uri_ids = [uri_table.get_id(node) for node in nodes]
+
+    assert uri_ids == [0, 1, 2, 3] and len(uri_table) == 4
+    assert uri_table.get_uris(reversed(uri_ids)) == ["C", str(blank_node), "http://example.org/B",
+                                                     "http://example.org/A"]
+
+    for uri_id, node in zip(uri_ids, nodes):
+        assert uri_table.get_uri(uri_id) == str(node)
+        assert uri_table.get_node(uri_id) == (URIRef(node) if type(node) is str else node)
+
+    assert type(uri_table.get_node(0)) is URIRef
+    assert uri_table.get_node(2) is blank_node
+
+
+def test_known_and_unknown_uris():
+    """ Checks if a URI has the same id as a string and as a URIRef and if unknown URIs are only registered when
+        requested.
+    """
+
+    uri_table = UriTable()
+    uri_id = uri_table.get_id(URIRef("http://example.org/A"))
+
+    assert uri_table.get_id("http://example.org/A") == uri_id
+    assert uri_table.get_id("http://example.org/A", create=False) == uri_id
+    assert uri_table.get_id("http://example.org/B", create=False) is None
+    assert len(uri_table) == 1
+
+    assert uri_table.get_id("http://example.org/B") == 1
+    assert uri_table.get_node(uri_table.get_id("http://example.org/B")) is uri_table.get_node(1)
@@ -0,0 +1,79 @@
+""" Tests of the loading of N-Triples and N-Quads files, which must be equivalent to the loading of the same ontology
+    from a Turtle file.
+"""
+import glob
+import os
+
+import pytest
+from rdflib import Dataset, Graph, URIRef
+from rdflib.compare import to_isomorphic
+
+from scior.modules.utils_ntriples import is_kept_statement, is_streamable_file, stream_working_graph
+from scior.modules.utils_rdf import load_all_graph_safely
+
+TEST_FILES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "test_files", "*_in.ttl")))
+
+
+def write_test_file(turtle_graph: Graph, file_path: str) -> None:
+    """ Writes the received graph as a N-Triples or N-Quads file, according to the file's extension. N-Quads files
+        have their triples split between the default graph and a named graph.
+
+    :param turtle_graph: Graph loaded from a Turtle file.
+    :type turtle_graph: Graph
+    :param file_path: Path of the written file.
+    :type file_path: str
+    """
+
+    if file_path.endswith(".nt"):
+        turtle_graph.serialize(file_path, format="nt", encoding="utf-8")
+        return
+
+    ontology_dataset = Dataset()
+    named_graph = ontology_dataset.graph(URIRef("http://example.org/named"))
+
+    for position, triple in enumerate(turtle_graph):
+        (named_graph if position % 2 else ontology_dataset.default_context).add(triple)
+
+    ontology_dataset.serialize(file_path, format="nquads", encoding="utf-8")
+
+
+@pytest.mark.parametrize("file_extension", [".nt", ".nq"])
+@pytest.mark.parametrize("turtle_file", TEST_FILES, ids=os.path.basename)
+def test_streamed_working_graph(tmp_path, turtle_file: str, file_extension: str):
+    """ Checks if the streamed working graph has all statements of the Turtle file that are used by Scior.
+
+    :param turtle_file: Path of the Turtle file used as reference.
+    :type turtle_file: str
+    :param file_extension: Extension of the streamed file.
+    :type file_extension: str
+    """
+
+    turtle_graph = load_all_graph_safely(turtle_file)
+    streamed_file = os.path.join(str(tmp_path), "ontology" + file_extension)
+    write_test_file(turtle_graph, streamed_file)
+
+    expected_graph = Graph()
+    for subject_node, predicate, object_node in turtle_graph:
+        if is_kept_statement(predicate, object_node):
+            expected_graph.add((subject_node, predicate, object_node))
+
+    assert is_streamable_file(streamed_file)
+    assert to_isomorphic(stream_working_graph(streamed_file)) == to_isomorphic(expected_graph)
+
+
+@pytest.mark.parametrize("file_extension", [".nt", ".nq"])
+@pytest.mark.parametrize("turtle_file", TEST_FILES[:20], ids=os.path.basename)
+def test_loaded_original_graph(tmp_path, turtle_file: str, file_extension: str):
+    """ Checks if the complete graph loaded from the N-Triples or N-Quads file has all triples of the Turtle file.
+
+    :param turtle_file: Path of the Turtle file used as reference.
+    :type turtle_file: str
+    :param file_extension: Extension of the loaded file.
+    :type file_extension: str
+    """
+
+    turtle_graph = load_all_graph_safely(turtle_file)
+    loaded_file = os.path.join(str(tmp_path), "ontology" + file_extension)
+    write_test_file(turtle_graph, loaded_file)
+
+    assert to_isomorphic(load_all_graph_safely(loaded_file)) == to_isomorphic(turtle_graph)